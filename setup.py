@@ -0,0 +1,34 @@
+"""Build hook for optional mypyc compilation.
+
+Metadata lives in ``pyproject.toml``. With ``VORTEX_MYPYC=1`` in the build
+environment the modules below are compiled to C extensions with mypyc;
+otherwise (the default) the wheel is pure Python. Both import identically.
+"""
+
+import os
+
+from setuptools import setup
+
+# Typed, self-contained hot paths; anything listed must pass ``mypy`` cleanly.
+MYPYC_MODULES = [
+    "vortex/intelligence/code.py",
+    "vortex/intelligence/data.py",
+]
+
+ext_modules = []
+if os.environ.get("VORTEX_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only the compiled modules themselves are type checked. numpy is optional,
+    # so without it the ignores guarding its import would look unused.
+    ext_modules = mypycify(
+        [
+            "--ignore-missing-imports",
+            "--follow-imports=silent",
+            "--no-warn-unused-ignores",
+            *MYPYC_MODULES,
+        ],
+        opt_level="3",
+    )
+
+setup(ext_modules=ext_modules)
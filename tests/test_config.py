@@ -1,9 +1,12 @@
 import asyncio
+import threading
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from vortex.core.config import UnifiedConfigManager
+from vortex.core.config import UnifiedConfigManager, VortexSettings
+from vortex.utils.errors import ConfigurationError
 
 
 def test_load_default_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -16,3 +19,99 @@ def test_load_default_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     manager = UnifiedConfigManager()
     settings = asyncio.run(manager.load())
     assert settings.providers[0].name == "echo"
+
+
+def test_settings_are_frozen_and_ignore_unknown_keys(tmp_path: Path) -> None:
+    settings = VortexSettings.model_validate({"providers": [{"name": "echo", "type": "echo"}]})
+    with pytest.raises(ValidationError):
+        settings.ui.theme = "dark"
+    with pytest.raises(ValidationError):
+        VortexSettings.model_validate({"providers": []})
+
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(
+        "providers:\n  - name: echo\n    type: echo\nplaner:\n  max_parallel_tasks: 2\n",
+        encoding="utf-8",
+    )
+    loaded = asyncio.run(UnifiedConfigManager(config_path).load())
+    assert loaded.providers[0].name == "echo"
+
+
+def test_config_watcher_reloads_on_change(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("providers:\n  - name: echo\n    type: echo\n", encoding="utf-8")
+    manager = UnifiedConfigManager(config_path, poll_interval=0.05)
+    asyncio.run(manager.load())
+    reloaded = threading.Event()
+
+    async def _on_reload(settings) -> None:  # type: ignore[no-untyped-def]
+        if settings.providers[0].name == "second":
+            reloaded.set()
+
+    manager.register_callback(_on_reload)
+    manager.start_watching()
+    try:
+        for _ in range(50):
+            config_path.write_text(
+                "providers:\n  - name: second\n    type: echo\n", encoding="utf-8"
+            )
+            if reloaded.wait(0.2):
+                break
+        assert reloaded.is_set()
+    finally:
+        manager.stop_watching()
+
+
+def test_load_toml_config(tmp_path: Path) -> None:
+    pytest.importorskip("tomllib")
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[[providers]]\nname = "echo"\ntype = "echo"\n', encoding="utf-8")
+    settings = asyncio.run(UnifiedConfigManager(config_path).load())
+    assert settings.providers[0].name == "echo"
+    ini_path = config_path.with_suffix(".ini")
+    ini_path.write_text("[providers]\n", encoding="utf-8")
+    with pytest.raises(ConfigurationError, match="Unsupported"):
+        asyncio.run(UnifiedConfigManager(ini_path).load())
+
+
+def test_unchanged_config_is_not_parsed_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("providers:\n  - name: echo\n    type: echo\n", encoding="utf-8")
+    reads = []
+    original = UnifiedConfigManager._read_file
+
+    def _counting_read(path: Path):  # type: ignore[no-untyped-def]
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(UnifiedConfigManager, "_read_file", staticmethod(_counting_read))
+    first = asyncio.run(UnifiedConfigManager(config_path).load())
+    second = asyncio.run(UnifiedConfigManager(config_path).reload())
+    assert second is first
+    assert len(reads) == 1
+
+    config_path.write_text("providers:\n  - name: other\n    type: echo\n", encoding="utf-8")
+    os.utime(config_path, ns=(1, 1))
+    assert asyncio.run(UnifiedConfigManager(config_path).load()).providers[0].name == "other"
+    assert len(reads) == 2
+    config_path.unlink()
+    with pytest.raises(ConfigurationError, match="does not exist"):
+        asyncio.run(UnifiedConfigManager(config_path).load())
+
+
+def test_yaml_parsers_prefer_libyaml() -> None:
+    import yaml
+
+    from vortex.core import config
+
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert config._YAML_LOADER is expected
+    themes = pytest.importorskip("vortex.ui_tui.themes")
+    settings = pytest.importorskip("vortex.ui_tui.settings")
+    assert themes._YAML_LOADER is settings._YAML_LOADER is expected
+    dumper = yaml.CSafeDumper if yaml.__with_libyaml__ else yaml.SafeDumper
+    assert settings._YAML_DUMPER is dumper
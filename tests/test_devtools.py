@@ -1,4 +1,5 @@
 import asyncio
+import os
 from pathlib import Path
 
 import pytest
@@ -33,3 +34,103 @@ async def test_debugger_and_devops(monkeypatch, tmp_path: Path) -> None:
     assert outcome == "ok"
     timed = await debugger.timeout(asyncio.sleep(0, result="done"), 1)
     assert timed == "done"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != "posix", reason="shell workers are POSIX only")
+async def test_devops_reuses_isolated_shell_workers(tmp_path: Path) -> None:
+    helper = DevOpsHelper(workdir=tmp_path, pool_size=1)
+    try:
+        first = await helper.run_command("sh", "-c", "printf 'no newline'; exit 3")
+        assert first == {"stdout": "no newline", "stderr": "", "returncode": "3"}
+        with pytest.raises(FileNotFoundError):
+            await helper.run_command("cd", "/")
+        await helper.run_command("sh", "-c", "cd /")
+        second = await helper.run_command("pwd")
+        assert second["stdout"].strip() == str(tmp_path)
+        results = await asyncio.gather(
+            *(helper.run_command("sh", "-c", f"echo out{i}; echo err{i} >&2") for i in range(4))
+        )
+        assert [r["stdout"] for r in results] == [f"out{i}\n" for i in range(4)]
+        assert [r["stderr"] for r in results] == [f"err{i}\n" for i in range(4)]
+        assert len(helper._workers) == 1
+    finally:
+        await helper.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pool_size", [0, 1])
+async def test_devops_output_modes(tmp_path: Path, pool_size: int) -> None:
+    helper = DevOpsHelper(workdir=tmp_path, pool_size=pool_size)
+    script = "printf 'a\\nb\\n'; echo oops >&2; exit 2"
+    try:
+        quiet = await helper.run_command("sh", "-c", script, capture_output=False)
+        assert quiet == {"stdout": "", "stderr": "", "returncode": "2"}
+        lines: list = []
+        streamed = await helper.run_command("sh", "-c", script, on_line=lines.append)
+        assert lines == ["a", "b"]
+        assert streamed == {"stdout": "", "stderr": "oops\n", "returncode": "2"}
+    finally:
+        await helper.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != "posix", reason="shell workers are POSIX only")
+async def test_devops_workers_match_a_direct_spawn(tmp_path: Path, monkeypatch) -> None:
+    helper = DevOpsHelper(workdir=tmp_path, pool_size=1)
+    try:
+        with pytest.raises(FileNotFoundError):
+            await helper.run_command("vortex-no-such-binary")
+        with pytest.raises(FileNotFoundError):
+            await helper.run_command("./missing.sh")
+        monkeypatch.setenv("VORTEX_DEVOPS_PROBE", "one")
+        assert (await helper.run_command("printenv", "VORTEX_DEVOPS_PROBE"))["stdout"] == "one\n"
+        first = helper._workers[0]
+        monkeypatch.setenv("VORTEX_DEVOPS_PROBE", "two")
+        assert (await helper.run_command("printenv", "VORTEX_DEVOPS_PROBE"))["stdout"] == "two\n"
+        assert helper._workers[0] is not first
+        await first.wait()
+    finally:
+        await helper.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != "posix", reason="shell workers are POSIX only")
+async def test_devops_workers_run_programs_not_shell_builtins(tmp_path: Path) -> None:
+    direct = DevOpsHelper(workdir=tmp_path, pool_size=0)
+    pooled = DevOpsHelper(workdir=tmp_path, pool_size=1)
+    try:
+        for args in (("echo", "a\\nb"), ("echo", "-e", "x"), ("printf", "%s|", "a", "b")):
+            expected = await direct.run_command(*args)
+            assert await pooled.run_command(*args) == expected
+        assert pooled._workers
+    finally:
+        await pooled.close()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="shell workers are POSIX only")
+def test_devops_workers_shut_down_with_their_event_loop(tmp_path: Path) -> None:
+    import gc
+    import warnings
+
+    helper = DevOpsHelper(workdir=tmp_path, pool_size=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        asyncio.run(helper.run_command("true"))
+        first = helper._workers
+        assert first == [] or first[0].returncode is not None
+        result = asyncio.run(helper.run_command("echo", "again"))
+        assert result["stdout"] == "again\n"
+        gc.collect()
+    assert helper._workers == []
+
+
+def test_framework_discover_matches_glob(tmp_path: Path) -> None:
+    for relative in ["test_a.py", "helper.py", "pkg/test_b.py", "pkg/deep/test_c.py"]:
+        target = tmp_path / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("", encoding="utf-8")
+    framework = VortexTestFramework(root=tmp_path)
+    for pattern in ["test_*.py", "**/test_*.py", "pkg/test_*.py"]:
+        assert sorted(framework.discover(pattern)) == sorted(tmp_path.glob(pattern))
+    assert list(VortexTestFramework(root=tmp_path / "missing").discover()) == []
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from vortex.ai import NLPEngine
@@ -26,6 +28,44 @@ async def test_multiagent_broadcast(model_manager) -> None:
     assert result["alpha"] == "PING"
 
 
+@pytest.mark.asyncio
+async def test_multiagent_broadcast_bounds_and_cancels_peers(model_manager) -> None:
+    coordinator = MultiAgentCoordinator(model_manager, max_concurrent=2)
+    active = peak = 0
+    cancelled = []
+
+    async def worker(message: str) -> str:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return message
+
+    for name in "abcd":
+        coordinator.register(name, worker)
+    assert await coordinator.broadcast("hi") == {name: "hi" for name in "abcd"}
+    assert peak == 2
+
+    async def failing(message: str) -> str:
+        raise RuntimeError("boom")
+
+    async def slow(message: str) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return message
+
+    coordinator = MultiAgentCoordinator(model_manager)
+    coordinator.register("slow", slow)
+    coordinator.register("failing", failing)
+    with pytest.raises(RuntimeError):
+        await coordinator.broadcast("hi")
+    assert cancelled == [True]
+
+
 @pytest.mark.asyncio
 async def test_self_improvement_and_predictor() -> None:
     loop = SelfImprovementLoop(lambda idea: len(idea))
@@ -37,3 +77,20 @@ async def test_self_improvement_and_predictor() -> None:
     keywords = predictor.top_keywords(["alpha beta", "beta gamma"], limit=2)
     assert isinstance(trend, float)
     assert keywords
+
+
+def test_predictor_batches_match_single_calls() -> None:
+    engine = NLPEngine()
+    docs = ["I love this great tool", "bad and sad", "neutral words only"]
+    assert engine.sentiment_batch(docs) == [engine.sentiment(doc) for doc in docs]
+    assert engine.keyword_summary_batch(docs, top_k=2) == [
+        engine.keyword_summary(doc, top_k=2) for doc in docs
+    ]
+    predictor = Predictor(engine)
+    assert predictor.predict_sentiment_trend([]) == 0.0
+    assert predictor.top_keywords(["alpha beta", "beta gamma"], limit=3) == [
+        "beta",
+        "alpha",
+        "gamma",
+    ]
+    assert predictor.top_keywords(["beta alpha", "beta gamma"], limit=1) == ["beta"]
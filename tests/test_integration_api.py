@@ -6,6 +6,7 @@ import pytest
 
 from vortex.integration import APIHub, CloudIntegration
 from vortex.security.manager import UnifiedSecurityManager
+from vortex.utils.async_cache import request_digest
 
 
 @pytest.mark.asyncio
@@ -50,3 +51,137 @@ async def test_cloud_integration_cache(tmp_path: Path) -> None:
     assert result["path"] == "/status"
     accounts = await cloud.list_accounts()
     assert accounts == ["default"]
+
+
+@pytest.mark.asyncio
+async def test_api_hub_reuses_session_and_injects_token(tmp_path: Path, monkeypatch) -> None:
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    seen = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        return httpx.Response(200, json={"ok": True})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "vortex.integration.api_hub.httpx.AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(_handler), **kwargs),
+    )
+    hub = APIHub(security)
+    await hub.register_api(
+        "example", "https://example.test", headers={"X-App": "vortex"}, secret="t"
+    )
+    _, first = await hub._get_client("example")
+    await hub.call("example", "/a")
+    _, second = await hub._get_client("example")
+    assert first is second
+    assert seen[0]["authorization"] == "Bearer t" and seen[0]["x-app"] == "vortex"
+    assert dict(hub._clients["example"].default_headers) == {"X-App": "vortex"}
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_cloud_integration_reuses_client(tmp_path: Path) -> None:
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    cloud = CloudIntegration(security)
+    await cloud.add_account("default", "https://cloud.test", credential="secret")
+    created = []
+
+    async def _client(account) -> httpx.AsyncClient:  # type: ignore[no-untyped-def]
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+        client = httpx.AsyncClient(transport=transport, base_url=account.base_url)
+        created.append(client)
+        return client
+
+    cloud._client = _client  # type: ignore[assignment]
+    await asyncio.gather(*(cloud.request("default", "GET", "/status") for _ in range(5)))
+    assert len(created) == 1
+    await cloud.add_account("default", "https://moved.test", credential="secret")
+    assert created[0].is_closed
+    await cloud.request("default", "GET", "/status")
+    assert [str(client.base_url) for client in created] == [
+        "https://cloud.test",
+        "https://moved.test",
+    ]
+    await cloud.close()
+    assert created[1].is_closed
+
+
+def test_request_digest_is_canonical() -> None:
+    first = request_digest({"b": 2, "a": [1, 2]}, {"nested": {"y": 1, "x": 2}})
+    second = request_digest({"a": [1, 2], "b": 2}, {"nested": {"x": 2, "y": 1}})
+    assert first == second and len(first) == 16
+    assert request_digest({"a": 1}, None) != request_digest({"a": 2}, None)
+
+
+@pytest.mark.asyncio
+async def test_api_hub_caches_token_briefly(tmp_path: Path, monkeypatch) -> None:
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    seen = []
+    transport = httpx.MockTransport(
+        lambda request: seen.append(request.headers["authorization"]) or httpx.Response(200)
+    )
+    client = httpx.AsyncClient(transport=transport, base_url="https://example.test")
+    hub = APIHub(security, client=client, token_ttl=60.0)
+    await hub.register_api("example", "https://example.test", secret="one")
+    lookups = []
+    original = security.retrieve_secret
+
+    async def _retrieve(name: str) -> str:
+        lookups.append(name)
+        return await original(name)
+
+    monkeypatch.setattr(security, "retrieve_secret", _retrieve)
+    for _ in range(3):
+        await hub.call("example", "/a")
+    assert lookups == ["api:example"]
+    await hub.register_api("example", "https://example.test", secret="two")
+    await hub.call("example", "/a")
+    assert seen == ["Bearer one"] * 3 + ["Bearer two"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registrations_for_different_names_do_not_serialise(
+    tmp_path: Path, monkeypatch
+) -> None:
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    release = asyncio.Event()
+    original = security.store_secret
+
+    async def _store(name: str, secret: str) -> None:
+        if name.endswith(":slow"):
+            await release.wait()
+        await original(name, secret)
+
+    monkeypatch.setattr(security, "store_secret", _store)
+    hub = APIHub(security)
+    cloud = CloudIntegration(security)
+    slow = [
+        asyncio.create_task(hub.register_api("slow", "https://slow.test", secret="s")),
+        asyncio.create_task(cloud.add_account("slow", "https://slow.test", credential="s")),
+    ]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(hub.register_api("fast", "https://fast.test", secret="f"), 1)
+    await asyncio.wait_for(cloud.add_account("fast", "https://fast.test", credential="f"), 1)
+    assert await hub.list_apis() == ["fast"]
+    assert await cloud.list_accounts() == ["fast"]
+    release.set()
+    await asyncio.gather(*slow)
+    assert sorted(await hub.list_apis()) == ["fast", "slow"]
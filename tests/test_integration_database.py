@@ -1,7 +1,11 @@
+import asyncio
+import sqlite3
+
 import pytest
 
 from vortex.integration.database import DatabaseManager
 from vortex.security.manager import UnifiedSecurityManager
+from vortex.utils.errors import IntegrationError
 
 
 @pytest.mark.asyncio
@@ -17,4 +21,62 @@ async def test_database_manager_encryption(tmp_path):
     result = await manager.fetch("SELECT value FROM secrets", use_cache=True)
     assert result.rowcount == 1
     assert result.rows[0]["value"] != "top"
+    assert result.rows is result.rows
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_database_manager_reads_use_query_only_pool(tmp_path):
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    manager = DatabaseManager(f"sqlite:///{tmp_path/'db.sqlite'}", security, read_pool_size=2)
+    await manager.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+    await manager.execute("INSERT INTO items VALUES (?, ?)", (1, "one"))
+    results = await asyncio.gather(*(manager.fetch("SELECT * FROM items") for _ in range(4)))
+    assert all(result.rows == [{"id": 1, "name": "one"}] for result in results)
+    assert len(manager._reader_connections) == 2
+    with pytest.raises(sqlite3.OperationalError):
+        await manager.fetch("INSERT INTO items VALUES (2, 'two')")
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_store_secret_records_bulk_insert(tmp_path):
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    manager = DatabaseManager(f"sqlite:///{tmp_path/'db.sqlite'}", security)
+    await manager.execute("CREATE TABLE secrets (name TEXT, value TEXT)")
+    payloads = [{"name": f"n{i}", "value": f"v{i}"} for i in range(50)]
+    assert await manager.store_secret_records("secrets", payloads) == 50
+    assert await manager.store_secret_records("secrets", []) == 0
+    with pytest.raises(IntegrationError):
+        await manager.store_secret_records("secrets", [{"name": "a"}, {"value": "b"}])
+    result = await manager.fetch("SELECT name, value FROM secrets")
+    assert result.rowcount == 50
+    decrypt = manager._encryptor.decrypt_value
+    assert [decrypt(row["value"]) for row in result.rows] == [p["value"] for p in payloads]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_query_result_is_columnar(tmp_path):
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    manager = DatabaseManager(f"sqlite:///{tmp_path/'db.sqlite'}", security)
+    created = await manager.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+    assert created.columns == [] and created.values == []
+    await manager.execute("INSERT INTO items VALUES (1, 'one'), (2, 'two')")
+    result = await manager.fetch("SELECT id, name FROM items ORDER BY id")
+    assert result.columns == ["id", "name"]
+    assert result.values == [(1, "one"), (2, "two")]
+    assert list(result.as_rows()) == [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
     await manager.close()
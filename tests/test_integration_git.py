@@ -2,6 +2,7 @@ import pytest
 
 from vortex.integration.git import GitManager
 from vortex.security.manager import UnifiedSecurityManager
+from vortex.utils.errors import IntegrationError
 
 
 @pytest.mark.asyncio
@@ -15,3 +16,22 @@ async def test_git_status(tmp_path):
     manager = GitManager(security)
     result = await manager.status()
     assert result.success
+
+
+@pytest.mark.asyncio
+async def test_git_run_many_uses_fixed_environment(tmp_path):
+    security = UnifiedSecurityManager(
+        credential_dir=tmp_path,
+        allowed_modules=["json"],
+        forbidden_modules=[],
+    )
+    security.permissions.grant("cli", {"git:run"})
+    manager = GitManager(security)
+    assert manager._env["GIT_TERMINAL_PROMPT"] == "0"
+    results = await manager._run_many(
+        [["status", "--short"], ["rev-parse", "--is-inside-work-tree"]]
+    )
+    assert [r.success for r in results] == [True, True]
+    assert results[1].stdout.strip() == "true"
+    with pytest.raises(IntegrationError):
+        await manager._run(arg for arg in ["not-a-git-command"])
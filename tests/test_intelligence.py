@@ -0,0 +1,250 @@
+import os
+import struct
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from vortex.core.model import UnifiedModelManager
+from vortex.intelligence import (
+    UnifiedAudioSystem,
+    UnifiedCodeIntelligence,
+    UnifiedDataAnalyst,
+    UnifiedVisionPro,
+    code,
+    data,
+    vision,
+)
+
+
+@pytest.fixture()
+def model_manager() -> UnifiedModelManager:
+    return UnifiedModelManager([{"name": "echo", "type": "echo"}])
+
+
+@pytest.mark.parametrize("size", [0, 3, 7, 8, 4099])
+def test_dominant_colour_matches_channel_sums(
+    model_manager: UnifiedModelManager, monkeypatch: pytest.MonkeyPatch, size: int
+) -> None:
+    data = bytes((i * 37 + 11) % 256 for i in range(size))
+    pro = UnifiedVisionPro(model_manager)
+    expected = (
+        "#" + "".join(f"{sum(data[c::3]) % 256:02x}" for c in range(3)) if data else "unknown"
+    )
+    assert pro._dominant_colour(data) == expected
+    monkeypatch.setattr(vision, "np", None)
+    assert pro._dominant_colour(data) == expected
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_most_frequent_colour_bins_rgb_triples(
+    model_manager: UnifiedModelManager,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    use_numpy: bool,
+) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(vision, "np", None)
+    elif vision.np is None:
+        pytest.skip("numpy not installed")
+    pro = UnifiedVisionPro(model_manager)
+    # Red and near-red share a bin and outnumber the blue pixels; the odd
+    # trailing bytes are not a pixel.
+    data = bytes([255, 0, 0] * 3 + [250, 5, 2] * 2 + [0, 0, 255] * 4 + [0, 0])
+    path = tmp_path / "image.raw"
+    path.write_bytes(data)
+    assert pro.analyse(path, most_frequent=True).dominant_colour == "#fc0404"
+    assert pro._most_frequent_colour(bytes([0, 0, 255, 255, 0, 0])) == "#0404fc"
+    assert pro._most_frequent_colour(b"\x01\x02") == "unknown"
+
+
+def test_inspect_file_collects_nested_functions(
+    model_manager: UnifiedModelManager, tmp_path: Path
+) -> None:
+    source = """
+def top(a, b):
+    def inner(c):
+        return lambda d: d
+    return inner
+
+
+class Service:
+    async def fetch(self, url):
+        try:
+            pass
+        except ValueError:
+            def on_error(exc):
+                pass
+        else:
+            if url:
+                def later():
+                    pass
+
+
+VALUE = [x for x in range(3)]
+"""
+    path = tmp_path / "sample.py"
+    path.write_text(source, encoding="utf-8")
+    signatures = UnifiedCodeIntelligence(model_manager).inspect_file(path)
+    assert [(s.name, s.args) for s in signatures] == [
+        ("top", ["a", "b"]),
+        ("inner", ["c"]),
+        ("fetch", ["self", "url"]),
+        ("on_error", ["exc"]),
+        ("later", []),
+    ]
+
+
+@pytest.mark.parametrize("filename", ["code.py", "data.py", "vision.py"])
+def test_function_defs_agree_with_ast_walk(filename: str) -> None:
+    import ast
+
+    # vision is never compiled, so its directory holds the sources.
+    tree = ast.parse((Path(vision.__file__).parent / filename).read_bytes())
+    expected = [
+        node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    found = list(code._function_defs(tree))
+    assert sorted(found, key=id) == sorted(expected, key=id)
+    assert [node.lineno for node in found] == sorted(node.lineno for node in found)
+
+
+@pytest.mark.parametrize(
+    "channels,rate,frames,extra_size", [(1, 8000, 4000, 3), (2, 44100, 1234, 1001)]
+)
+def test_audio_header_parse_matches_wave(
+    model_manager: UnifiedModelManager,
+    tmp_path: Path,
+    channels: int,
+    rate: int,
+    frames: int,
+    extra_size: int,
+) -> None:
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\0\0" * channels * frames)
+    # An odd-sized extra chunk must be skipped with its pad byte; a large one
+    # pushes ``fmt `` beyond the first header read.
+    raw = path.read_bytes()
+    extra = b"LIST" + struct.pack("<I", extra_size) + b"a" * extra_size + b"\0"
+    raw = raw[:12] + extra + raw[12:]
+    path.write_bytes(raw[:4] + struct.pack("<I", len(raw) - 8) + raw[8:])
+
+    system = UnifiedAudioSystem(model_manager)
+    assert system.analyse(path) == system.analyse(path, strict=True)
+    assert system.analyse(path).duration == frames / rate
+
+    bogus = tmp_path / "bogus.wav"
+    bogus.write_bytes(b"not audio")
+    with pytest.raises(wave.Error):
+        system.analyse(bogus)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_data_summary_matches_statistics(
+    model_manager: UnifiedModelManager, monkeypatch: pytest.MonkeyPatch, use_numpy: bool
+) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(data, "np", None)
+    elif data.np is None:
+        pytest.skip("numpy not installed")
+    columns = {
+        "odd": [5.0, 1.0, 3.0],
+        "even": (v * 0.5 for v in [4, 8, 1, 3]),
+        "empty": [],
+    }
+    summaries = UnifiedDataAnalyst(model_manager).summarise(columns)
+    assert [(s.column, s.count, s.median) for s in summaries] == [
+        ("odd", 3, 3.0),
+        ("even", 4, 1.75),
+    ]
+    assert summaries[0].mean == pytest.approx(3.0)
+    assert summaries[1].mean == pytest.approx(2.0)
+
+
+def test_inspect_file_caches_on_stat(model_manager: UnifiedModelManager, tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text("def first(a):\n    pass\n", encoding="utf-8")
+    intelligence = UnifiedCodeIntelligence(model_manager)
+    first = intelligence.inspect_file(path)
+    first[0].args.append("mutated")
+    key = code._cache_key(path)
+    assert code._signature_cache[key] == (("first", ("a",)),)
+    assert [(s.name, s.args) for s in intelligence.inspect_file(path)] == [("first", ["a"])]
+
+    path.write_text("def second(b, c):\n    pass\n", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert [s.name for s in intelligence.inspect_file(path)] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_tests_many_parses_in_worker_processes(
+    model_manager: UnifiedModelManager, tmp_path: Path
+) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"mod{index}.py"
+        path.write_text(f"def func{index}(x{index}):\n    pass\n", encoding="utf-8")
+        paths.append(path)
+    intelligence = UnifiedCodeIntelligence(model_manager)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        inspected = await intelligence.inspect_files(paths + paths[:1], executor=pool)
+    assert [[s.name for s in sigs] for sigs in inspected] == [
+        ["func0"],
+        ["func1"],
+        ["func2"],
+        ["func0"],
+    ]
+    assert all(code._cache_key(path) in code._signature_cache for path in paths)
+    suggestions = await intelligence.suggest_tests_many(paths)
+    assert list(suggestions) == paths
+    assert "func1(x1)" in suggestions[paths[1]]
+
+
+@pytest.mark.asyncio
+async def test_inspect_files_keeps_one_process_pool(
+    model_manager: UnifiedModelManager, tmp_path: Path
+) -> None:
+    intelligence = UnifiedCodeIntelligence(model_manager)
+
+    def _batch(prefix: str) -> list:
+        paths = []
+        for index in range(code._PARALLEL_PARSE_THRESHOLD):
+            path = tmp_path / f"{prefix}{index}.py"
+            path.write_text(f"def {prefix}{index}():\n    pass\n", encoding="utf-8")
+            paths.append(path)
+        return paths
+
+    first = await intelligence.inspect_files(_batch("a"))
+    pool = intelligence._pool
+    second = await intelligence.inspect_files(_batch("b"))
+    assert pool is not None and intelligence._pool is pool
+    assert [sigs[0].name for sigs in second] == [f"b{i}" for i in range(len(second))]
+    assert len(first) == len(second)
+    await intelligence.close()
+    assert intelligence._pool is None
+
+
+@pytest.mark.asyncio
+async def test_suggest_tests_reuses_rendered_signatures(
+    model_manager: UnifiedModelManager, tmp_path: Path
+) -> None:
+    path = tmp_path / "render.py"
+    path.write_text("def a(x, y):\n    pass\n\n\ndef b():\n    pass\n", encoding="utf-8")
+    intelligence = UnifiedCodeIntelligence(model_manager)
+    first = await intelligence.suggest_tests(path)
+    assert "a(x, y), b()." in first
+    key = code._cache_key(path)
+    assert code._signature_text_cache[key] == "a(x, y), b()"
+    code._signature_text_cache[key] = "cached()"
+    assert "cached()" in await intelligence.suggest_tests(path)
+
+    path.write_text("def c(z):\n    pass\n", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "c(z)." in await intelligence.suggest_tests(path)
@@ -1,9 +1,15 @@
 import asyncio
+import dataclasses
 from pathlib import Path
 
 import pytest
 
-from vortex.core.memory import UnifiedMemorySystem
+from vortex.core.memory import (
+    MemoryRecord,
+    SimpleVectorStore,
+    UnifiedMemorySystem,
+    _encode_embedding,
+)
 
 
 def test_memory_roundtrip(tmp_path: Path):
@@ -17,3 +23,157 @@ def test_memory_roundtrip(tmp_path: Path):
         assert "remember" in summary
 
     asyncio.run(_run())
+
+
+def test_memory_list_paging_and_kind(tmp_path: Path):
+    async def _run():
+        memory = UnifiedMemorySystem(f"sqlite:///{tmp_path / 'memory.db'}")
+        for index in range(3):
+            await memory.add("note", f"note {index}")
+        await memory.add("feedback", "ui:4")
+        first = await memory.list(limit=2)
+        second = await memory.list(limit=2, offset=2)
+        assert len(first) == 2 and len(second) == 2
+        assert {r.id for r in first}.isdisjoint(r.id for r in second)
+        feedback = await memory.list(kind="feedback")
+        assert [r.content for r in feedback] == ["ui:4"]
+
+    asyncio.run(_run())
+
+
+def test_memory_reads_skip_uncommitted_writes(tmp_path: Path):
+    async def _run():
+        memory = UnifiedMemorySystem(f"sqlite:///{tmp_path / 'memory.db'}")
+        await memory.add("note", "committed")
+        # The writer connection mid-transaction, as seen from the loop thread.
+        memory._conn.execute(
+            "INSERT INTO memory (kind, content, created_at) VALUES ('note', 'pending', 0)"
+        )
+        assert [r.content for r in await memory.list()] == ["committed"]
+        memory._conn.commit()
+        assert {r.content for r in await memory.list()} == {"committed", "pending"}
+
+    asyncio.run(_run())
+
+
+def test_memory_in_memory_database():
+    async def _run():
+        memory = UnifiedMemorySystem("sqlite:///:memory:")
+        record = await memory.add("note", "ephemeral")
+        assert [r.id for r in await memory.list()] == [record.id]
+        assert [r.content for r in await memory.search("ephemeral")] == ["ephemeral"]
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_vector_store_ranking(monkeypatch: pytest.MonkeyPatch, use_numpy: bool):
+    from vortex.core import memory as memory_module
+
+    if not use_numpy:
+        monkeypatch.setattr(memory_module, "np", None)
+    elif memory_module.np is None:
+        pytest.skip("numpy not installed")
+    store = SimpleVectorStore()
+    store.add(1, [1.0, 0.0])
+    store.add(2, [0.0, 1.0])
+    store.add(3, [1.0, 1.0])
+    store.add(4, [0.0, 0.0])
+    ranked = store.search([1.0, 0.1], limit=3)
+    assert [record_id for record_id, _ in ranked] == [1, 3, 2]
+    assert ranked[0][1] == pytest.approx(0.995, abs=1e-3)
+    store.remove(1)
+    assert [record_id for record_id, _ in store.search([1.0, 0.1], limit=5)] == [3, 2, 4]
+    assert len(store) == 3
+
+
+@pytest.mark.parametrize("use_sumprod", [True, False])
+def test_vector_dot_rejects_mismatched_dimensions(
+    monkeypatch: pytest.MonkeyPatch, use_sumprod: bool
+):
+    import math
+
+    from vortex.core import memory as memory_module
+
+    if not use_sumprod:
+        monkeypatch.setattr(memory_module, "_dot", memory_module._py_dot)
+    elif not hasattr(math, "sumprod"):
+        pytest.skip("math.sumprod needs Python 3.12")
+    monkeypatch.setattr(memory_module, "np", None)
+    store = SimpleVectorStore()
+    store.add(1, [1.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        store.search([1.0, 0.0])
+
+
+def test_memory_embedding_blob_roundtrip(tmp_path: Path):
+    async def _run():
+        memory = UnifiedMemorySystem(f"sqlite:///{tmp_path / 'memory.db'}")
+        record = await memory.add("note", "vector me")
+        memory._conn.execute(
+            "INSERT INTO memory (kind, content, metadata, embedding, created_at) "
+            "VALUES ('legacy', 'old row', '{}', '[0.5, 0.25]', 0)"
+        )
+        memory._conn.commit()
+        rows = {r.kind: r for r in await memory.list()}
+        assert rows["note"].embedding == pytest.approx(record.embedding)
+        assert len(rows["note"].embedding) == 16
+        assert rows["legacy"].embedding == [0.5, 0.25]
+
+    asyncio.run(_run())
+
+
+def test_memory_record_embedding_is_a_public_field():
+    record = MemoryRecord(1, "note", "text", {}, embedding=[1.0, 0.0], created_at=0.0)
+    assert dataclasses.asdict(record)["embedding"] == [1.0, 0.0]
+    record.embedding = [0.0, 1.0]
+    assert record.embedding == [0.0, 1.0]
+    raw = MemoryRecord(2, "note", "text", {}, _encode_embedding([0.5, 0.25]), 0.0)
+    assert raw.embedding == [0.5, 0.25]
+    assert dataclasses.asdict(raw) == {
+        "id": 2,
+        "kind": "note",
+        "content": "text",
+        "metadata": {},
+        "embedding": [0.5, 0.25],
+        "created_at": 0.0,
+    }
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_memory_add_many(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_numpy: bool):
+    from vortex.core import memory as memory_module
+
+    if not use_numpy:
+        monkeypatch.setattr(memory_module, "np", None)
+    elif memory_module.np is None:
+        pytest.skip("numpy not installed")
+
+    async def _run():
+        memory = UnifiedMemorySystem(f"sqlite:///{tmp_path / 'memory.db'}")
+        single = await memory.add("note", "first")
+        records = await memory.add_many(
+            [("note", f"bulk {index}", {"index": index}) for index in range(100)]
+        )
+        assert [r.id for r in records] == list(range(single.id + 1, single.id + 101))
+        assert records[0].embedding == pytest.approx(memory_module._hash_embedding("bulk 0"))
+        assert len(memory._vector_store) == 101
+        hits = await memory.search("bulk 42", limit=1)
+        assert hits[0].content == "bulk 42" and hits[0].metadata == {"index": 42}
+
+    asyncio.run(_run())
+
+
+def test_hash_embedding_is_memoised_and_immutable():
+    from vortex.core.memory import _hash_embedding
+
+    first = _hash_embedding("same query")
+    assert _hash_embedding("same query") is first
+    with pytest.raises((TypeError, ValueError)):
+        first[0] = 1.0
+
+
+def test_hash_embedding_bytes_matches_text():
+    from vortex.core.memory import _hash_embedding, _hash_embedding_bytes
+
+    assert list(_hash_embedding_bytes("naïve".encode("utf-8"))) == list(_hash_embedding("naïve"))
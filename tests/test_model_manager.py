@@ -1,5 +1,6 @@
 import asyncio
 
+import httpx
 import pytest
 
 from vortex.core.model import ProviderError, UnifiedModelManager
@@ -41,3 +42,117 @@ def test_failover(monkeypatch):
         assert result["text"] == "HI"
 
     asyncio.run(_run())
+
+
+class GatedProvider:
+    name = "gated"
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, *, settings):
+        pass
+
+    async def generate(self, prompt: str, **kwargs):
+        GatedProvider.in_flight += 1
+        GatedProvider.peak = max(GatedProvider.peak, GatedProvider.in_flight)
+        await asyncio.sleep(0.01)
+        GatedProvider.in_flight -= 1
+        return {"text": prompt, "usage": {"prompt_tokens": 1, "completion_tokens": 1}}
+
+
+def test_generate_runs_concurrently(monkeypatch):
+    async def _run():
+        from vortex.core import model
+
+        monkeypatch.setitem(model.PROVIDER_REGISTRY, "gated", GatedProvider)
+        manager = UnifiedModelManager([{"name": "gated", "type": "gated"}])
+        results = await asyncio.gather(*(manager.generate(str(i)) for i in range(5)))
+        assert [result["text"] for result in results] == [str(i) for i in range(5)]
+        assert GatedProvider.peak == 5
+        assert manager.token_usage()["gated"].prompt_tokens == 5
+
+    asyncio.run(_run())
+
+
+def test_openai_provider_reuses_client(monkeypatch):
+    from vortex.core import model
+
+    requests = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}], "usage": {}})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        model.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(_handler), **kwargs),
+    )
+
+    async def _run():
+        manager = UnifiedModelManager([{"name": "openai", "type": "openai", "api_key": "k"}])
+        provider = manager.providers[0].instance
+        await manager.generate("one")
+        client = provider._client
+        await manager.generate("two")
+        assert provider._client is client
+        await manager.close()
+        assert client.is_closed and provider._client is None
+
+    asyncio.run(_run())
+    assert len(requests) == 2
+
+
+def test_openai_client_is_closed_with_its_event_loop(monkeypatch):
+    from vortex.core import model
+
+    clients = []
+    real_client = httpx.AsyncClient
+
+    def _client(**kwargs):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+        )
+        clients.append(real_client(transport=transport, **kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(model.httpx, "AsyncClient", _client)
+    manager = UnifiedModelManager([{"name": "openai", "type": "openai", "api_key": "k"}])
+    provider = manager.providers[0].instance
+
+    asyncio.run(manager.generate("one"))
+    assert clients[0].is_closed and provider._client is None
+    asyncio.run(manager.generate("two"))
+    assert len(clients) == 2 and clients[1].is_closed
+
+
+def test_sse_parser_handles_split_events():
+    from vortex.core.model import _iter_sse_data
+
+    async def _chunks():
+        for piece in (
+            b'data: {"a"',
+            b": 1}\r\n\r",
+            b"\n: ping\n\ndata: two\n",
+            b"\ndata: [DONE]\n\n",
+        ):
+            yield piece
+        yield b"data: never\n\n"
+
+    async def _run():
+        return [payload async for payload in _iter_sse_data(_chunks())]
+
+    assert asyncio.run(_run()) == ['{"a": 1}', "two"]
+
+    async def _first_event():
+        # The event's closing CRLF is split so its final "\n" arrives alone;
+        # the event must be emitted without waiting for more data.
+        async def _stalled():
+            yield b"data: a\r\n\r"
+            yield b"\n"
+            await asyncio.Event().wait()
+
+        return await asyncio.wait_for(_iter_sse_data(_stalled()).__anext__(), 1)
+
+    assert asyncio.run(_first_event()) == "a"
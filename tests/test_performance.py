@@ -76,3 +76,18 @@ async def test_cache_and_parallel_tools() -> None:
         [lambda value=i: asyncio.sleep(0.01, result=value) for i in range(3)]
     )
     assert sorted(results) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cost_tracker_total_matches_snapshot() -> None:
+    manager = UnifiedModelManager(
+        [
+            {"name": "echo", "type": "echo"},
+            {"name": "openai", "type": "openai"},
+        ]
+    )
+    for state, cost in zip(manager.providers, (1.5, 0.25)):
+        state.metrics.cost = cost
+    tracker = CostTracker(manager)
+    snapshot = await tracker.snapshot()
+    assert await tracker.total_cost() == sum(item.cost for item in snapshot.values()) == 1.75
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from vortex.core.planner import TaskSpec, UnifiedAdvancedPlanner
+from vortex.utils.errors import VortexError
+
+
+def _task(name: str, *deps: str) -> TaskSpec:
+    async def _action() -> str:
+        await asyncio.sleep(0)
+        return name
+
+    return TaskSpec(name=name, description="", action=_action, depends_on=frozenset(deps))
+
+
+def test_add_tasks_registers_batch_atomically() -> None:
+    planner = UnifiedAdvancedPlanner()
+    planner.add_tasks([_task("a"), _task("b", "a")])
+    assert planner.plan() == ["a", "b"]
+
+    with pytest.raises(VortexError):
+        planner.add_tasks([_task("c"), _task("a")])
+    assert "c" not in planner.plan()
+
+
+def test_execute_waits_for_dependencies() -> None:
+    finished: list = []
+
+    def _tracked(name: str, *deps: str) -> TaskSpec:
+        async def _action() -> str:
+            assert all(dep in finished for dep in deps)
+            await asyncio.sleep(0.01)
+            finished.append(name)
+            return name
+
+        return TaskSpec(name=name, description="", action=_action, depends_on=frozenset(deps))
+
+    planner = UnifiedAdvancedPlanner(max_parallel_tasks=2)
+    planner.add_tasks(
+        [_tracked("a"), _tracked("b", "a"), _tracked("c", "a"), _tracked("d", "b", "c")]
+    )
+    results = asyncio.run(asyncio.wait_for(planner.execute(), timeout=5))
+    assert [result.name for result in results] == planner.plan()
+    assert all(result.success for result in results)
+    assert finished[0] == "a" and finished[-1] == "d"
+
+
+def test_execute_rejects_unknown_dependency() -> None:
+    planner = UnifiedAdvancedPlanner()
+    planner.add_task(_task("a", "missing"))
+    with pytest.raises(VortexError):
+        asyncio.run(planner.execute())
+
+
+def test_execute_retries_with_backoff_until_cancelled() -> None:
+    calls = {"flaky": 0, "stuck": 0}
+
+    async def _flaky() -> str:
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            raise RuntimeError("transient")
+        return "ok"
+
+    async def _stuck() -> None:
+        calls["stuck"] += 1
+        raise RuntimeError("down")
+
+    planner = UnifiedAdvancedPlanner(recovery_retries=2, retry_backoff=0.001, max_backoff=0.002)
+    planner.add_task(TaskSpec(name="flaky", description="", action=_flaky))
+    results = asyncio.run(planner.execute())
+    assert results[0].success and calls["flaky"] == 3
+
+    planner = UnifiedAdvancedPlanner(recovery_retries=50, retry_backoff=60, max_backoff=60)
+    planner.add_task(TaskSpec(name="stuck", description="", action=_stuck))
+
+    async def _run():
+        running = asyncio.create_task(planner.execute())
+        await asyncio.sleep(0.01)
+        planner.cancel()
+        return await asyncio.wait_for(running, timeout=5)
+
+    results = asyncio.run(_run())
+    assert not results[0].success and calls["stuck"] == 1
@@ -0,0 +1,247 @@
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from vortex.core.plugin import UnifiedPluginSystem
+from vortex.security.sandbox import Sandbox, SandboxPolicy
+from vortex.utils.errors import SecurityError
+
+
+def test_discover_caches_until_directory_changes(tmp_path: Path) -> None:
+    (tmp_path / "alpha.py").write_text("", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path, tmp_path / "missing"])
+    assert system.discover() == {"alpha": tmp_path / "alpha.py"}
+    first = system._discovery_cache[tmp_path]
+
+    assert system.discover() == {"alpha": tmp_path / "alpha.py"}
+    assert system._discovery_cache[tmp_path] is first
+
+    (tmp_path / "beta.py").write_text("", encoding="utf-8")
+    stat = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert set(system.discover()) == {"alpha", "beta"}
+
+
+PLUGIN_SOURCE = """
+from vortex.core.plugin import BasePlugin
+
+
+class Greeter(BasePlugin):
+    name = "greeter"
+
+    def execute(self, who="world"):
+        return f"hello {who}"
+"""
+
+
+def test_load_reuses_imported_module(tmp_path: Path) -> None:
+    (tmp_path / "vortex_test_greeter.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path])
+
+    async def _run() -> None:
+        first = await system.load("vortex_test_greeter")
+        module = sys.modules["vortex_plugins.vortex_test_greeter"]
+        second = await system.load("vortex_test_greeter")
+        assert type(first) is type(second)
+        assert sys.modules["vortex_plugins.vortex_test_greeter"] is module
+        assert system._plugin_class_cache["vortex_plugins.vortex_test_greeter"] is type(first)
+        await system.unload("vortex_test_greeter")
+        assert "vortex_plugins.vortex_test_greeter" not in sys.modules
+        assert "vortex_plugins.vortex_test_greeter" not in system._plugin_class_cache
+
+    asyncio.run(_run())
+
+
+def test_resolve_plugin_scans_module_namespace(tmp_path: Path) -> None:
+    source = """
+from vortex.core.plugin import BasePlugin
+
+
+class Helper:
+    pass
+
+
+class Worker(BasePlugin):
+    def execute(self):
+        return "done"
+
+
+def __getattr__(name):
+    raise AssertionError(f"unexpected lookup of {name}")
+"""
+    (tmp_path / "vortex_test_worker.py").write_text(source, encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path])
+
+    async def _run() -> None:
+        plugin = await system.load("vortex_test_worker")
+        assert type(plugin).__name__ == "Worker"
+        await system.unload("vortex_test_worker")
+
+    asyncio.run(_run())
+
+
+def test_import_loads_from_file_without_touching_sys_path(tmp_path: Path) -> None:
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "vortex_test_shadow.py").write_text("VALUE = 'stale'\n", encoding="utf-8")
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "vortex_test_shadow.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    system = UnifiedPluginSystem([plugins])
+    sys.path.insert(0, str(other))
+    try:
+        __import__("vortex_test_shadow")
+        path_before = list(sys.path)
+
+        async def _run() -> None:
+            plugin = await system.load("vortex_test_shadow")
+            assert plugin.execute() == "hello world"
+            assert sys.modules["vortex_plugins.vortex_test_shadow"].__file__ == str(
+                plugins / "vortex_test_shadow.py"
+            )
+            await system.unload("vortex_test_shadow")
+
+        asyncio.run(_run())
+        assert sys.path == path_before
+    finally:
+        sys.path.remove(str(other))
+        sys.modules.pop("vortex_test_shadow", None)
+
+
+def test_plugin_named_after_stdlib_module_does_not_shadow_it(tmp_path: Path) -> None:
+    import csv
+
+    (tmp_path / "csv.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path])
+
+    async def _run() -> None:
+        plugin = await system.load("csv")
+        assert plugin.execute() == "hello world"
+        assert sys.modules["csv"] is csv
+        await system.unload("csv")
+        assert sys.modules["csv"] is csv
+        assert "vortex_plugins.csv" not in sys.modules
+
+    asyncio.run(_run())
+
+
+def test_plugins_support_relative_imports_and_pickling(tmp_path: Path) -> None:
+    import pickle
+
+    (tmp_path / "vortex_test_helper.py").write_text("GREETING = 'hi'\n", encoding="utf-8")
+    source = PLUGIN_SOURCE.replace(
+        "from vortex.core.plugin import BasePlugin",
+        "from vortex.core.plugin import BasePlugin\n\nfrom . import vortex_test_helper",
+    ).replace('f"hello {who}"', 'f"{vortex_test_helper.GREETING} {who}"')
+    (tmp_path / "vortex_test_relative.py").write_text(source, encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path])
+
+    async def _run() -> None:
+        plugin = await system.load("vortex_test_relative")
+        try:
+            assert plugin.execute() == "hi world"
+            assert type(pickle.loads(pickle.dumps(plugin))) is type(plugin)
+        finally:
+            await system.unload("vortex_test_relative")
+            sys.modules.pop("vortex_plugins.vortex_test_helper", None)
+
+    asyncio.run(_run())
+
+
+def test_sandbox_allow_lists_name_plugins_by_module_stem(tmp_path: Path) -> None:
+    (tmp_path / "vortex_test_allowed.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    (tmp_path / "vortex_test_denied.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    policy = SandboxPolicy(allowed_modules={"vortex_test_allowed"}, forbidden_builtins=set())
+    system = UnifiedPluginSystem([tmp_path], sandbox=Sandbox(policy))
+
+    async def _run() -> None:
+        try:
+            assert await system.execute("vortex_test_allowed") == "hello world"
+            with pytest.raises(SecurityError):
+                await system.execute("vortex_test_denied")
+        finally:
+            await system.unload("vortex_test_allowed")
+            await system.unload("vortex_test_denied")
+
+    asyncio.run(_run())
+
+
+def test_execute_runs_different_plugins_concurrently(tmp_path: Path) -> None:
+    source = """
+from vortex.core.plugin import BasePlugin
+
+
+class Waiter(BasePlugin):
+    def execute(self, barrier):
+        barrier.wait()
+        return __name__
+"""
+    names = ["vortex_test_waiter_a", "vortex_test_waiter_b"]
+    for name in names:
+        (tmp_path / f"{name}.py").write_text(source, encoding="utf-8")
+    policy = SandboxPolicy(allowed_modules=set(names), forbidden_builtins=set())
+    system = UnifiedPluginSystem([tmp_path], sandbox=Sandbox(policy))
+    barrier = threading.Barrier(2, timeout=5)
+
+    async def _run() -> list:
+        try:
+            return await asyncio.gather(*(system.execute(name, barrier) for name in names))
+        finally:
+            for name in names:
+                await system.unload(name)
+
+    assert asyncio.run(_run()) == [f"vortex_plugins.{name}" for name in names]
+
+
+def test_sandboxes_are_leased_from_pool_and_reset(tmp_path: Path) -> None:
+    (tmp_path / "vortex_test_pooled.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    system = UnifiedPluginSystem([tmp_path], pool_size=1)
+    pooled = system._sandbox_pool[0]
+
+    async def _run() -> None:
+        await system.load("vortex_test_pooled")
+        assert system._sandbox_pool == []
+        assert system._plugins["vortex_test_pooled"].sandbox is pooled
+        pooled.policy.allowed_modules.add("os")
+        await system.unload("vortex_test_pooled")
+
+    asyncio.run(_run())
+    assert system._sandbox_pool == [pooled]
+    assert "os" not in pooled.policy.allowed_modules
+
+
+def test_identical_concurrent_executions_share_one_run(tmp_path: Path) -> None:
+    source = """
+from vortex.core.plugin import BasePlugin
+
+CALLS = []
+
+
+class Counter(BasePlugin):
+    def execute(self, value, delay=0.05):
+        import time
+
+        CALLS.append(value)
+        time.sleep(delay)
+        return value * 2
+"""
+    (tmp_path / "vortex_test_counter.py").write_text(source, encoding="utf-8")
+    policy = SandboxPolicy(allowed_modules={"vortex_test_counter"}, forbidden_builtins=set())
+    system = UnifiedPluginSystem([tmp_path], sandbox=Sandbox(policy))
+
+    async def _run() -> list:
+        try:
+            calls = [system.execute("vortex_test_counter", 2, delay=0.05) for _ in range(3)]
+            results = await asyncio.gather(*calls, system.execute("vortex_test_counter", 3))
+            assert sys.modules["vortex_plugins.vortex_test_counter"].CALLS == [2, 3]
+            assert system._inflight == {}
+            return results
+        finally:
+            await system.unload("vortex_test_counter")
+
+    assert asyncio.run(_run()) == [4, 4, 4, 6]
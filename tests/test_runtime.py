@@ -0,0 +1,58 @@
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from vortex import main
+from vortex.cli import app as cli_app
+from vortex.experimental import MultiAgentCoordinator
+
+
+def test_runtime_defers_rarely_used_components(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = tmp_path / "vortex.yml"
+    config.write_text(
+        f"""
+providers:
+  - name: echo
+    type: echo
+memory:
+  database: sqlite:///{tmp_path / 'memory.db'}
+security:
+  credential_store: {tmp_path / 'credentials'}
+""",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("VORTEX_CONFIG", str(config))
+    # configure_logging rewires the root logger for the whole test session.
+    monkeypatch.setattr(main, "configure_logging", lambda: None)
+    monkeypatch.setattr(cli_app, "runtime", None)
+    monkeypatch.setattr(cli_app, "_require_runtime", cli_app._runtime_missing)
+    asyncio.run(main._initialise_runtime())
+    ctx = cli_app.runtime
+    try:
+        assert ctx is not None and ctx._deferred == {}
+        assert ctx.memory.db_path == tmp_path / "memory.db"
+        coordinator = ctx.multiagent
+        assert isinstance(coordinator, MultiAgentCoordinator)
+        assert ctx.multiagent is coordinator
+        assert set(ctx._deferred) == {"multiagent"}
+        assert asyncio.run(coordinator.broadcast("hi")) == {"echo": "echo:hi"}
+        result = cli_app._run_async(ctx, ctx.devops.run_command("true"))
+        assert result["returncode"] == "0"
+        assert ctx.devops._workers == []
+        monkeypatch.setattr(cli_app, "_WORKFLOW_CACHE", OrderedDict())
+        workflow = tmp_path / "workflow.json"
+        engines = []
+        for index in range(cli_app._WORKFLOW_CACHE_SIZE + 2):
+            workflow.write_text(f'[{{"name": "step", "message": "v{index}"}}]', encoding="utf-8")
+            cli_app.workflow_run(workflow)
+            engines.append(ctx.workflow_engine)
+        cli_app.workflow_run(workflow)
+        assert ctx.workflow_engine is engines[-1]
+        assert list(cli_app._WORKFLOW_CACHE.values()) == engines[2:]
+    finally:
+        if ctx is not None:
+            ctx.config_manager.stop_watching()
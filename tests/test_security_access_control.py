@@ -1,5 +1,6 @@
 import pytest
 
+from vortex.security.audit import AuditTrail
 from vortex.security.encryption import CredentialStore, DataEncryptor
 from vortex.security.manager import UnifiedSecurityManager
 
@@ -25,3 +26,157 @@ def test_data_encryptor_roundtrip(tmp_path):
     encryptor = DataEncryptor(store)
     token = encryptor.encrypt_value("secret")
     assert encryptor.decrypt_value(token) == "secret"
+
+
+def test_audit_trail_appends_lines(tmp_path):
+    trail = AuditTrail(tmp_path / "audit.log")
+    trail.log("alice", "read", {"resource": "doc", 1: "x"})
+    trail.log("bob", "write", {"resource": "café"})
+    raw = (tmp_path / "audit.log").read_bytes()
+    assert raw.count(b"\n") == 2 and raw.endswith(b"\n")
+    events = trail.read_recent()
+    assert [event["actor"] for event in events] == ["alice", "bob"]
+    assert events[0]["metadata"] == {"resource": "doc", "1": "x"}
+    assert events[1]["metadata"]["resource"] == "café"
+
+
+@pytest.mark.asyncio
+async def test_store_secrets_audits_in_one_write(tmp_path, monkeypatch):
+    security = UnifiedSecurityManager(credential_dir=tmp_path)
+    writes = []
+    original = AuditTrail.append
+
+    def _recording(self, lines):
+        writes.append(lines.count(b"\n"))
+        original(self, lines)
+
+    monkeypatch.setattr(AuditTrail, "append", _recording)
+    await security.store_secrets({"a": "1", "b": "2", "c": "3"})
+    await security.audit_system.flush()
+    assert writes == [3]
+    assert security.credential_store.load("b") == "2"
+    events = await security.audit_system.recent_events()
+    assert [event.metadata["name"] for event in events] == ["a", "b", "c"]
+    await security.audit_system.log_batch([])
+    await security.audit_system.flush()
+    assert writes == [3]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 7, 40, 100])
+def test_audit_read_recent_scans_from_the_end(tmp_path, monkeypatch, limit):
+    from vortex.security import audit
+
+    monkeypatch.setattr(audit, "_TAIL_BLOCK", 64)
+    trail = AuditTrail(tmp_path / "audit.log")
+    trail.record_many(
+        audit.AuditEvent(actor=f"user{i}", action="read", metadata={}, timestamp=float(i))
+        for i in range(40)
+    )
+    actors = [event["actor"] for event in trail.read_recent(limit)]
+    expected = [f"user{i}" for i in range(40)]
+    assert actors == (expected[-limit:] if limit else expected)
+
+
+def test_session_encryptor_round_trips_events_and_tokens(tmp_path):
+    import json
+
+    from vortex.security.encryption import SessionEncryptor
+
+    encryptor = SessionEncryptor(CredentialStore(tmp_path))
+    payload = {"summary": "café ☕", "count": 3, 7: "seven"}
+    token = encryptor.encrypt_event("s1", payload)
+    assert encryptor.decrypt_event("s1", token) == {"summary": "café ☕", "count": 3, "7": "seven"}
+    # Events written before the switch were encoded with the json module.
+    legacy = encryptor._session_cipher("s1").encrypt(
+        json.dumps({"summary": "café"}, ensure_ascii=False).encode("utf-8")
+    )
+    assert encryptor.decrypt_event("s1", legacy.decode()) == {"summary": "café"}
+    share = encryptor.generate_share_token("s1", role="observer", read_only=True)
+    assert encryptor.decode_share_token(share) == ("s1", "observer", True)
+
+
+def test_missing_files_are_handled_without_a_prior_stat(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from vortex.security.encryption import SessionEncryptor
+    from vortex.utils.errors import SecurityError
+
+    store = CredentialStore(tmp_path)
+    encryptor = SessionEncryptor(store)
+    key = encryptor.ensure_session_key("s1")
+
+    def _no_exists(self):
+        raise AssertionError("exists() should not be called")
+
+    monkeypatch.setattr(Path, "exists", _no_exists)
+    assert CredentialStore(tmp_path).key == store.key
+    assert SessionEncryptor(store).ensure_session_key("s1") == key
+    with pytest.raises(SecurityError, match="missing"):
+        store.load("absent")
+    assert AuditTrail(tmp_path / "none.log").read_recent() == []
+
+
+@pytest.mark.asyncio
+async def test_audit_system_coalesces_queued_writes(tmp_path, monkeypatch):
+    from vortex.security.audit_system import AuditSystem
+
+    system = AuditSystem(tmp_path / "audit.log")
+    writes = []
+    original = system._trail.append
+
+    def _append(lines):
+        writes.append(lines.count(b"\n"))
+        original(lines)
+
+    monkeypatch.setattr(system._trail, "append", _append)
+    for index in range(20):
+        await system.log(f"user{index}", "read", {})
+    await system.log_batch([("batch", "write", {}), ("batch", "delete", {})])
+    events = await system.recent_events(limit=100)
+    assert [event.actor for event in events][:2] == ["user0", "user1"]
+    assert len(events) == 22
+    assert sum(writes) == 22 and len(writes) < 22
+    await system.close()
+    assert system._writer_task is None
+
+
+def test_audit_events_survive_event_loop_shutdown(tmp_path):
+    import asyncio
+
+    from vortex.security.audit_system import AuditSystem
+
+    system = AuditSystem(tmp_path / "audit.log")
+    asyncio.run(system.log("first", "read", {}))
+    asyncio.run(system.log("second", "read", {}))
+    events = asyncio.run(system.recent_events())
+    assert [event.actor for event in events] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_audit_system_encodes_events_when_logged(tmp_path, monkeypatch):
+    security = UnifiedSecurityManager(credential_dir=tmp_path)
+    system = security.audit_system
+    with pytest.raises(TypeError):
+        await system.log("mallory", "write", {"payload": object()})
+    metadata = {"resource": "doc"}
+    await system.log("alice", "read", metadata)
+    metadata["resource"] = "changed"
+    await system.flush()
+
+    original = system._trail.append
+
+    def _fail_once(lines):
+        monkeypatch.setattr(system._trail, "append", original)
+        raise ValueError("disk on fire")
+
+    monkeypatch.setattr(system._trail, "append", _fail_once)
+    await system.log("bob", "read", {})
+    await system.flush()
+    await system.log("carol", "read", {})
+    events = await system.recent_events()
+    assert [(e.actor, e.metadata) for e in events] == [
+        ("alice", {"resource": "doc"}),
+        ("carol", {}),
+    ]
+    await security.close()
+    assert system._writer_task is None
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from vortex.performance.analytics import SessionAnalyticsStore
-from vortex.ui_tui.session_manager import SessionManager
+from vortex.ui_tui.session_manager import SessionEvent, SessionManager, _read_records
 
 
 @pytest.mark.asyncio
@@ -14,6 +14,12 @@ async def test_session_manager_broadcast_and_share(tmp_path: Path) -> None:
     manager = SessionManager(root=tmp_path / "sessions", analytics=analytics)
 
     metadata = await manager.create_session("Collab", "alice")
+    assert sorted(p.name for p in metadata.path.iterdir()) == [
+        "events.jsonl",
+        "metadata.json",
+        "metrics.jsonl",
+        "transcript.md",
+    ]
     sessions = await manager.list_sessions()
     assert metadata.session_id in {item.session_id for item in sessions}
 
@@ -42,3 +48,149 @@ async def test_session_manager_broadcast_and_share(tmp_path: Path) -> None:
     assert session_id == metadata.session_id
     assert role == "observer"
     assert read_only is True
+
+
+def test_read_records_streams_complete_lines(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(
+        b'{"kind": "a"}\n\nnot json\n[1, 2]\n{"kind": "b", "text": "caf\xc3\xa9"}\n{"kind"'
+    )
+    records, position = _read_records(path, 0)
+    assert [record["kind"] for record in records] == ["a", "b"]
+    assert records[1]["text"] == "café"
+    with path.open("ab") as handle:
+        handle.write(b': "c"}\n')
+    more, end = _read_records(path, position)
+    assert more == [{"kind": "c"}]
+    assert end == path.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_metadata_cached_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    manager = SessionManager(root=tmp_path / "sessions")
+    metadata = await manager.create_session("Cached", "alice")
+    reads = []
+    original = Path.read_bytes
+
+    def _counting_read(self: Path) -> bytes:
+        reads.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _counting_read)
+    first = await manager._load_metadata(metadata.session_id)
+    first.collaborators.clear()
+    second = await manager._load_metadata(metadata.session_id)
+    assert len(second.collaborators) == 1
+    assert [s.title for s in await manager.list_sessions()] == ["Cached"]
+    assert reads == []
+
+    path = metadata.path / "metadata.json"
+    payload = path.read_text(encoding="utf-8").replace('"Cached"', '"Renamed!"')
+    path.write_text(payload, encoding="utf-8")
+    assert (await manager._load_metadata(metadata.session_id)).title == "Renamed!"
+    assert reads == ["metadata.json"]
+
+
+def test_session_event_is_slotted_and_serialises_in_order() -> None:
+    event = SessionEvent(identifier="e1", kind="plan", payload={}, author="a", timestamp=1.5)
+    assert not hasattr(event, "__dict__")
+    line = event.to_json_bytes(encrypted=False, payload={1: "x"})
+    assert line == (
+        b'{"id":"e1","kind":"plan","author":"a","timestamp":1.5,'
+        b'"encrypted":false,"payload":{"1":"x"}}'
+    )
+    assert event.to_json(encrypted=True, payload="token") == line.decode().replace(
+        'false,"payload":{"1":"x"}', 'true,"payload":"token"'
+    )
+
+
+@pytest.mark.asyncio
+async def test_side_logs_are_written_in_batches(tmp_path: Path, monkeypatch) -> None:
+    from vortex.ui_tui import session_manager as module
+
+    calls = []
+    original = module._append_batches
+
+    def _recording(batches):
+        calls.append({path.name: len(chunks) for path, chunks in batches.items()})
+        original(batches)
+
+    monkeypatch.setattr(module, "_append_batches", _recording)
+    manager = SessionManager(root=tmp_path / "sessions")
+    metadata = await manager.create_session("Batched", "alice")
+    await asyncio.gather(
+        *(
+            manager.broadcast(metadata.session_id, "note", {"summary": f"n{i}"}, author="alice")
+            for i in range(5)
+        )
+    )
+    await manager.flush()
+    transcript = (metadata.path / "transcript.md").read_text(encoding="utf-8").splitlines()
+    assert [line.rsplit("| ", 1)[1] for line in transcript] == [f"n{i}" for i in range(5)]
+    assert len((metadata.path / "metrics.jsonl").read_bytes().splitlines()) == 5
+    assert sum(batch["transcript.md"] for batch in calls) == 5
+
+    calls.clear()
+    for index in range(10):
+        manager._queue_write(metadata.path / "extra.log", b"%d\n" % index)
+    await manager.flush()
+    assert calls == [{"extra.log": 10}]
+    assert (metadata.path / "extra.log").read_bytes().split() == [b"%d" % i for i in range(10)]
+
+
+def test_session_writer_follows_the_event_loop_and_closes(tmp_path: Path) -> None:
+    manager = SessionManager(root=tmp_path / "sessions")
+    log = tmp_path / "loops.log"
+
+    async def _write(line: bytes) -> None:
+        manager._queue_write(log, line)
+        await manager.flush()
+
+    asyncio.run(_write(b"first\n"))
+    asyncio.run(_write(b"second\n"))
+
+    async def _close() -> None:
+        manager._queue_write(log, b"third\n")
+        await manager.close()
+
+    asyncio.run(_close())
+    assert log.read_bytes() == b"first\nsecond\nthird\n"
+    assert manager._writer_task is None
+
+
+@pytest.mark.asyncio
+async def test_polled_events_share_interned_kind_and_author(tmp_path: Path) -> None:
+    writer = SessionManager(root=tmp_path / "sessions")
+    reader = SessionManager(root=tmp_path / "sessions", poll_interval=0.25)
+    metadata = await writer.create_session("Interned", "alice")
+    iterator = await reader.subscribe(metadata.session_id)
+    for index in range(2):
+        await writer.broadcast(metadata.session_id, "note", {"summary": str(index)}, author="al")
+    received = [await asyncio.wait_for(iterator.__anext__(), timeout=2) for _ in range(2)]
+    assert received[0].kind is received[1].kind
+    assert received[0].author is received[1].author
+
+
+def test_sanitize_payload_drops_private_keys_and_copies() -> None:
+    clean = {"summary": "ok"}
+    copied = SessionManager._sanitize_payload(clean)
+    assert copied == clean and copied is not clean
+    dirty = {"summary": "ok", "diff": "+x", "raw": b"", "secret": "s", "n": 1}
+    assert SessionManager._sanitize_payload(dirty) == {"summary": "ok", "n": 1}
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_reads_changed_metadata_together(tmp_path: Path) -> None:
+    manager = SessionManager(root=tmp_path / "sessions")
+    created = [await manager.create_session(f"S{i}", "alice") for i in range(4)]
+    big = created[0].path / "metadata.json"
+    # Pushes the batch past the inline-read threshold onto worker threads.
+    big.write_bytes(big.read_bytes().rstrip(b"}") + b', "notes": "' + b"x" * 8192 + b'"}')
+    (created[1].path / "metadata.json").write_bytes(b"{broken")
+    (created[2].path / "metadata.json").unlink()
+    (tmp_path / "sessions" / "stray").mkdir()
+    manager._metadata_cache.clear()
+    sessions = await manager.list_sessions()
+    assert sorted(s.title for s in sessions) == ["S0", "S3"]
+    assert created[1].path / "metadata.json" not in manager._metadata_cache
+    assert manager._cached_metadata(big, big.stat())["title"] == "S0"
@@ -31,3 +31,28 @@ async def test_analytics_reports_and_comparison(tmp_path):
 
     insights = await store.insights("s1")
     assert any("Session" in item for item in insights)
+
+
+@pytest.mark.asyncio
+async def test_session_summary_single_pass_totals(tmp_path, monkeypatch):
+    store = SessionAnalyticsStore(database=tmp_path / "analytics.sqlite")
+    await store.register_session("s1", "Session 1", owner="alice")
+    clock = iter([100.0, 130.0, 160.0])
+    monkeypatch.setattr("vortex.performance.analytics.time.time", lambda: next(clock))
+    for kind, metrics in [
+        ("test", {"success": False, "duration": 3.0, "cost": 0.5}),
+        ("plan", {"success": True, "duration": 1.0, "tokens": 10}),
+        ("test", {"success": True, "duration": 1.0, "cost": 0.25}),
+    ]:
+        await store.record_session_event("s1", kind, metrics=metrics, author="alice")
+    summary = await store.session_summary("s1")
+    assert summary["duration"] == 60.0
+    assert [(e["kind"], e["count"], e["avg_duration"]) for e in summary["events"]] == [
+        ("plan", 1, 1.0),
+        ("test", 2, 2.0),
+    ]
+    assert summary["kpis"] == {"events": 3.0, "cost": 0.75, "tokens": 10.0, "avg_duration": 1.5}
+    assert summary["success_rate"] == pytest.approx(2 / 3)
+    insights = await store.insights("s1")
+    assert "Most frequent action: test (2 times, success 1)." in insights
+    assert "Slowest step: test averaging 2.00s." in insights
@@ -205,3 +205,27 @@ async def test_accessibility_and_theme_commands(
     assert help_cmd is not None
     help_result = await actions.handle(help_cmd)
     assert "Help" in help_result.message
+
+
+def test_extract_files_from_diff_reads_only_headers() -> None:
+    diff = (
+        "diff --git a/src/app.py b/src/app.py\r\n"
+        "--- a/src/app.py\r\n"
+        "+++ b/src/app.py\r\n"
+        "@@ -1 +1 @@\r\n"
+        "--- removed line that looks like a header\r\n"
+        "+added\r\n"
+        "--- /dev/null\n"
+        "+++ b/new.txt\n"
+        "--- a/gone.txt\n"
+        "+++ b/dev/null\n"
+    )
+    files = TUIActionCenter._extract_files_from_diff(diff)
+    expected = set()
+    for line in diff.splitlines():
+        if line.startswith("+++") and line != "+++ b/dev/null":
+            expected.add(line.split(" b/")[-1])
+        elif line.startswith("---") and line != "--- a/dev/null":
+            expected.add(line.split(" a/")[-1])
+    assert files == expected
+    assert {"src/app.py", "new.txt", "gone.txt"} <= files
@@ -3,10 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+import orjson
 import pytest
 
 pytest.importorskip("textual")
 
+from vortex.ui_tui.context import CollaboratorState, TUIRuntimeBridge, TUISessionState
 from vortex.ui_tui.layout import build_layout
 from vortex.ui_tui.palette import PaletteEntry
 from vortex.ui_tui.panels import (
@@ -45,6 +47,7 @@ def test_command_bar_suggestions_toggle() -> None:
     bar.update_suggestions([entry])
     assert not bar.suggestions.has_class("hidden")
     assert len(bar.suggestions.children) == 1
+    assert bar.suggestions.children[0].data == "/plan"  # type: ignore[attr-defined]
     bar.clear_suggestions()
     assert bar.suggestions.has_class("hidden")
 
@@ -112,3 +115,74 @@ async def test_settings_manager_persistence(tmp_path: Path) -> None:
     assert reloaded.model == "gpt-4"
     assert reloaded.theme == "light"
     assert reloaded.custom_theme_path == tmp_path / "theme.yaml"
+
+
+@pytest.mark.asyncio
+async def test_settings_manager_yaml_round_trip(tmp_path: Path) -> None:
+    manager = TUISettingsManager(
+        global_path=tmp_path / "config.yml", local_path=tmp_path / "missing.yml"
+    )
+    settings = await manager.load()
+    settings.model = "gpt-4"
+    await manager.persist(settings)
+    assert "model: gpt-4" in (tmp_path / "config.yml").read_text()
+    assert (await manager.reload()).model == "gpt-4"
+
+
+def test_runtime_bridge_state_round_trip(tmp_path: Path) -> None:
+    bridge = TUIRuntimeBridge(SimpleNamespace(), session_dir=tmp_path)
+    state = TUISessionState(mode="plan", session_metrics={"latency": 0.5})
+    state.add_log("info", "café")
+    state.record_history("/plan")
+    state.add_checkpoint("init", "+x", ["a.py"])
+    state.collaborators["bob"] = CollaboratorState("bob", "box", "viewer", True, 1.0)
+    bridge.save_state(state)
+    raw = bridge.session_file().read_bytes()
+    assert raw.startswith(b'{\n  "mode": "plan"')
+    assert orjson.loads(raw) == state.to_dict()
+    loaded = bridge.load_state()
+    assert loaded is not None
+    assert loaded.to_dict() == state.to_dict()
+    bridge.session_file().write_bytes(b"{not json")
+    assert bridge.load_state() is None
+
+
+@pytest.mark.asyncio
+async def test_settings_manager_io_runs_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    threads = []
+    read, write = TUISettingsManager._read_config, TUISettingsManager._write_config
+
+    def _read(path):
+        threads.append(threading.current_thread())
+        return read(path)
+
+    def _write(path, payload):
+        threads.append(threading.current_thread())
+        write(path, payload)
+
+    monkeypatch.setattr(TUISettingsManager, "_read_config", staticmethod(_read))
+    monkeypatch.setattr(TUISettingsManager, "_write_config", staticmethod(_write))
+    manager = TUISettingsManager(
+        global_path=tmp_path / "config.toml", local_path=tmp_path / "local.toml"
+    )
+    settings = await manager.load()
+    await manager.persist(settings)
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+
+
+def test_workspace_files_walks_breadth_first_within_limit(tmp_path: Path) -> None:
+    from vortex.ui_tui.palette import _workspace_files
+
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "pkg" / "b.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "c.py").write_text("")
+    names = sorted(path.relative_to(tmp_path).as_posix() for path in _workspace_files(tmp_path, 40))
+    assert names == ["a.py", "pkg/b.py", "pkg/sub/c.py"]
+    # a.py and pkg fill the limit; nothing below the top level is reached.
+    assert [path.name for path in _workspace_files(tmp_path, 2)] == ["a.py"]
@@ -61,3 +61,72 @@ palette:
     css = theme_css("dark", no_color=False, custom=palette)
     assert "#222222" in css
     assert "#ff00ff" in css
+
+
+def test_colon_aliases_resolve_from_shared_table() -> None:
+    from vortex.ui_tui.app import _COLON_COMMANDS, VortexTUI
+
+    with pytest.raises(TypeError):
+        _COLON_COMMANDS[":x"] = "/quit"  # type: ignore[index]
+    resolve = VortexTUI._resolve_colon_command
+    assert resolve(None, ":q").name == "quit"  # type: ignore[arg-type]
+    assert resolve(None, ":theme dark").args == ["dark"]  # type: ignore[arg-type]
+    assert resolve(None, ":unknown") is None  # type: ignore[arg-type]
+
+
+def test_theme_css_custom_cached_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from vortex.ui_tui import themes
+
+    palette = tmp_path / "theme.yml"
+    palette.write_text('palette:\n  screen:\n    background: "#111111"\n')
+    reads = []
+    original = themes._read_palette
+    monkeypatch.setattr(themes, "_read_palette", lambda path: reads.append(path) or original(path))
+    first = theme_css("dark", no_color=False, custom=palette)
+    assert theme_css("dark", no_color=False, custom=palette) == first
+    assert reads == [palette]
+
+    palette.write_text('palette:\n  screen:\n    background: "#333333"\n')
+    stat = palette.stat()
+    os.utime(palette, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "#333333" in theme_css("dark", no_color=False, custom=palette)
+    assert len(reads) == 2
+    palette.unlink()
+    with pytest.raises(themes.ThemeError):
+        theme_css("dark", no_color=False, custom=palette)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_renders_insights_from_one_shot_iterable() -> None:
+    from types import SimpleNamespace
+
+    from vortex.ui_tui.app import VortexTUI
+
+    shown: list = []
+    deferred: list = []
+    panel = SimpleNamespace(show=shown.append, append=shown.append)
+    app = SimpleNamespace(
+        _main_panel=panel,
+        _panel_update=deferred.append,
+        state=SimpleNamespace(insights=[]),
+        announcer=None,
+    )
+    insights = (text for text in ["Fewer retries"])
+    await VortexTUI._show_dashboard(app, {}, insights)  # type: ignore[arg-type]
+    assert app.state.insights == ["Fewer retries"]
+    deferred[0]()
+    assert "Fewer retries" in str(shown[0].render().renderable.renderables[-1])
+
+
+def test_collaborators_built_from_session_entries() -> None:
+    from vortex.ui_tui.app import _collaborator_from_entry
+    from vortex.ui_tui.context import CollaboratorState
+
+    existing = CollaboratorState("a", "h", "owner", False, 1.0)
+    assert _collaborator_from_entry("a@h", existing) is existing
+    built = _collaborator_from_entry("b@h", {"host": "h", "read_only": 1, "last_seen": "2"})
+    assert built == CollaboratorState("b@h", "h", "collaborator", True, 2.0)
+    assert _collaborator_from_entry("c@h", {"last_seen": "never"}) is None
+    assert _collaborator_from_entry("d@h", None) is None
@@ -44,3 +44,12 @@ def test_rich_bridge_and_desktop_gui() -> None:
     bridge.render_table("Title", ["A"], [["1"]])
     desktop = DesktopGUI()
     desktop.render("Dash", {"Panel": "Content"})
+
+
+def test_print_json_serialises_paths() -> None:
+    ui = UnifiedRichUI()
+    with ui.console.capture() as capture:
+        ui.print_json({"path": Path("a/b"), 1: [1, 2]})
+    output = capture.get()
+    assert '"path": "a/b"' in output
+    assert '"1": [' in output
@@ -42,3 +42,21 @@ async def test_scheduler_runs_job() -> None:
     await asyncio.sleep(0.05)
     assert result.get("ran")
     await scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_for_sooner_job() -> None:
+    scheduler = WorkflowScheduler()
+    ran = []
+
+    async def late():
+        ran.append("late")
+
+    async def soon():
+        ran.append("soon")
+
+    await scheduler.schedule("late", 5, late)
+    await asyncio.wait_for(scheduler.schedule("soon", 0.01, soon), timeout=0.5)
+    await asyncio.sleep(0.05)
+    assert ran == ["soon"]
+    await scheduler.shutdown()
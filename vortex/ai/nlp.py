@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from vortex.utils.logging import get_logger
 
@@ -16,12 +16,17 @@ class NLPEngine:
 
     SENTENCE_SPLIT = re.compile(r"(?<=[.!?]) +")
     WORD_SPLIT = re.compile(r"[^a-zA-Z0-9']+")
+    POSITIVE = frozenset({"good", "great", "excellent", "happy", "love"})
+    NEGATIVE = frozenset({"bad", "terrible", "sad", "hate", "poor"})
 
     def tokenize(self, text: str) -> List[str]:
-        tokens = [token for token in self.WORD_SPLIT.split(text.lower()) if token]
+        tokens = self._tokens(text)
         logger.debug("tokenized", extra={"tokens": len(tokens)})
         return tokens
 
+    def _tokens(self, text: str) -> List[str]:
+        return [token for token in self.WORD_SPLIT.split(text.lower()) if token]
+
     def sentences(self, text: str) -> List[str]:
         return [segment.strip() for segment in self.SENTENCE_SPLIT.split(text.strip()) if segment]
 
@@ -30,19 +35,33 @@ class NLPEngine:
         counts = Counter(tokens)
         return [word for word, _ in counts.most_common(top_k)]
 
+    def keyword_summary_batch(self, texts: Iterable[str], *, top_k: int = 5) -> List[List[str]]:
+        """:meth:`keyword_summary` for many texts in one call."""
+
+        return [
+            [word for word, _ in Counter(self._tokens(text)).most_common(top_k)] for text in texts
+        ]
+
     def sentiment(self, text: str) -> float:
         """Naive sentiment by counting positive/negative tokens."""
 
-        positive = {"good", "great", "excellent", "happy", "love"}
-        negative = {"bad", "terrible", "sad", "hate", "poor"}
-        tokens = self.tokenize(text)
-        score = sum(1 for token in tokens if token in positive) - sum(
-            1 for token in tokens if token in negative
-        )
-        normalised = score / max(len(tokens), 1)
+        normalised = self._sentiment(self.tokenize(text))
         logger.debug("sentiment score", extra={"score": normalised})
         return normalised
 
+    def sentiment_batch(self, texts: Iterable[str]) -> List[float]:
+        """:meth:`sentiment` for many texts, logging once for the batch."""
+
+        scores = [self._sentiment(self._tokens(text)) for text in texts]
+        logger.debug("sentiment scores", extra={"documents": len(scores)})
+        return scores
+
+    def _sentiment(self, tokens: List[str]) -> float:
+        score = sum(token in self.POSITIVE for token in tokens) - sum(
+            token in self.NEGATIVE for token in tokens
+        )
+        return score / max(len(tokens), 1)
+
     def detect_entities(self, text: str) -> Dict[str, List[str]]:
         """Perform rule-based entity extraction from capitalisation."""
 
@@ -3,44 +3,73 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass
+import functools
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+import orjson
 import typer
 
-from vortex.ai import AdvancedCodeIntelligence, ContextManager, ContinuousLearningSystem, NLPEngine
-from vortex.core.config import UnifiedConfigManager, VortexSettings
-from vortex.core.memory import UnifiedMemorySystem
-from vortex.core.model import UnifiedModelManager
-from vortex.core.planner import TaskSpec, UnifiedAdvancedPlanner
-from vortex.core.plugin import UnifiedPluginSystem
-from vortex.core.ui import UnifiedRichUI
-from vortex.devtools import Debugger, DevOpsHelper, DevToolsSuite, TestFramework
-from vortex.education import CodeExplainer, LearningMode
-from vortex.experimental import MultiAgentCoordinator, Predictor, SelfImprovementLoop
-from vortex.integration import APIHub, CloudIntegration, DatabaseManager, GitManager
-from vortex.intelligence import (
-    UnifiedAudioSystem,
-    UnifiedCodeIntelligence,
-    UnifiedDataAnalyst,
-    UnifiedVisionPro,
-)
-from vortex.performance import (
-    CacheManager,
-    ConnectionPool,
-    CostTracker,
-    LazyLoader,
-    ParallelProcessor,
-    PerformanceAnalytics,
-    PerformanceMonitor,
-)
-from vortex.security.manager import UnifiedSecurityManager
-from vortex.ui import DesktopGUI, MobileAPI, RichUIBridge, WebUI
+from vortex.core.planner import TaskSpec
 from vortex.utils.errors import MemoryError, ProviderError, SecurityError, WorkflowError
-from vortex.utils.logging import configure_logging, get_logger
-from vortex.workflow import MacroSystem, WorkflowEngine, WorkflowScheduler
+from vortex.utils.logging import get_logger
+from vortex.workflow import WorkflowEngine
+
+if TYPE_CHECKING:  # pragma: no cover - annotations only; main.py builds the instances
+    from vortex.ai import (
+        AdvancedCodeIntelligence,
+        ContextManager,
+        ContinuousLearningSystem,
+        NLPEngine,
+    )
+    from vortex.core.config import UnifiedConfigManager, VortexSettings
+    from vortex.core.memory import UnifiedMemorySystem
+    from vortex.core.model import UnifiedModelManager
+    from vortex.core.planner import UnifiedAdvancedPlanner
+    from vortex.core.plugin import UnifiedPluginSystem
+    from vortex.core.ui import UnifiedRichUI
+    from vortex.devtools import Debugger, DevOpsHelper, DevToolsSuite, TestFramework
+    from vortex.education import CodeExplainer, LearningMode
+    from vortex.experimental import MultiAgentCoordinator, Predictor, SelfImprovementLoop
+    from vortex.integration import APIHub, CloudIntegration, DatabaseManager, GitManager
+    from vortex.intelligence import (
+        UnifiedAudioSystem,
+        UnifiedCodeIntelligence,
+        UnifiedDataAnalyst,
+        UnifiedVisionPro,
+    )
+    from vortex.performance import (
+        CacheManager,
+        ConnectionPool,
+        CostTracker,
+        LazyLoader,
+        ParallelProcessor,
+        PerformanceAnalytics,
+        PerformanceMonitor,
+    )
+    from vortex.security.manager import UnifiedSecurityManager
+    from vortex.ui import DesktopGUI, MobileAPI, RichUIBridge, WebUI
+    from vortex.workflow import MacroSystem, WorkflowScheduler
+
+try:  # pragma: no cover - optional dependency for richer line editing
+    from prompt_toolkit import PromptSession
+except ModuleNotFoundError:  # pragma: no cover - fall back to threaded input()
+    PromptSession = None  # type: ignore[assignment,misc]
 
 logger = get_logger(__name__)
 
@@ -67,7 +96,27 @@ app.add_typer(experimental_app, name="experimental")
 app.add_typer(education_app, name="education")
 
 
-@dataclass
+_T = TypeVar("_T")
+
+
+class _Deferred(Generic[_T]):
+    """A :class:`RuntimeContext` component built by its factory on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, ctx: Optional[RuntimeContext], owner: Optional[type] = None) -> _T:
+        if ctx is None:
+            return self  # type: ignore[return-value]
+        built = ctx._deferred
+        try:
+            return built[self._name]
+        except KeyError:
+            value = built[self._name] = ctx.factories[self._name]()
+            return value
+
+
+@dataclass(slots=True)
 class RuntimeContext:
     settings: VortexSettings
     config_manager: UnifiedConfigManager
@@ -99,9 +148,6 @@ class RuntimeContext:
     workflow_engine: WorkflowEngine
     macro_system: MacroSystem
     scheduler: WorkflowScheduler
-    web_ui: WebUI
-    desktop_gui: DesktopGUI
-    mobile_api: MobileAPI
     rich_bridge: RichUIBridge
     devtools: DevToolsSuite
     test_framework: TestFramework
@@ -109,23 +155,98 @@ class RuntimeContext:
     devops: DevOpsHelper
     learning_mode: LearningMode
     code_explainer: CodeExplainer
-    multiagent: MultiAgentCoordinator
-    self_improvement: SelfImprovementLoop
-    predictor: Predictor
+    # Zero-argument builders for the components declared with _Deferred below.
+    factories: Dict[str, Callable[[], Any]] = field(default_factory=dict)
+    _deferred: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    web_ui: ClassVar[_Deferred[WebUI]] = _Deferred()
+    desktop_gui: ClassVar[_Deferred[DesktopGUI]] = _Deferred()
+    mobile_api: ClassVar[_Deferred[MobileAPI]] = _Deferred()
+    multiagent: ClassVar[_Deferred[MultiAgentCoordinator]] = _Deferred()
+    self_improvement: ClassVar[_Deferred[SelfImprovementLoop]] = _Deferred()
+    predictor: ClassVar[_Deferred[Predictor]] = _Deferred()
+
+    async def aclose(self) -> None:
+        """Release what components hold on the running event loop.
+
+        Each command runs in its own loop, so worker processes, HTTP clients
+        and similar resources are released when it ends; they are recreated on
+        next use.
+        """
+
+        await self.devops.close()
+        await self.cloud.close()
+        await self.code.close()
+        await self.security.close()
 
 
 runtime: Optional[RuntimeContext] = None
 
 
+def _runtime_missing() -> RuntimeContext:  # pragma: no cover - runtime is always set in CLI
+    raise RuntimeError("Runtime not initialised")
+
+
+_require_runtime: Callable[[], RuntimeContext] = _runtime_missing
+
+
 def set_runtime(value: RuntimeContext) -> None:
-    global runtime
+    global runtime, _require_runtime
     runtime = value
+    # Commands fetch the context on every invocation; once it exists, swap the
+    # guard for a plain accessor so lookups skip the ``None`` check entirely.
+
+    def _current_runtime() -> RuntimeContext:
+        return value
 
+    _require_runtime = _current_runtime
 
-def _require_runtime() -> RuntimeContext:
-    if runtime is None:  # pragma: no cover - runtime is always set during CLI usage
-        raise RuntimeError("Runtime not initialised")
-    return runtime
+
+def _run_async(ctx: RuntimeContext, main: Awaitable[_T]) -> _T:
+    """Run a command's coroutine, then release the runtime's loop-bound resources."""
+
+    async def _main() -> _T:
+        try:
+            return await main
+        finally:
+            await ctx.aclose()
+
+    return asyncio.run(_main())
+
+
+_ALLOWED_THEMES: FrozenSet[str] = frozenset({"auto", "dark", "light", "high_contrast"})
+_SHELL_EXIT_WORDS: FrozenSet[str] = frozenset({"exit", "quit"})
+
+
+# Engines built by ``workflow run`` keyed by a digest of the definition file, so
+# re-running an unchanged workflow in the same process skips registration. Kept
+# small and least-recently-used, since every edit of a file yields a new digest.
+_WORKFLOW_CACHE: "OrderedDict[str, WorkflowEngine]" = OrderedDict()
+_WORKFLOW_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=4096)
+def _deps(key: Tuple[str, ...]) -> FrozenSet[str]:
+    """Intern dependency sets so tasks sharing a dependency list share one frozenset."""
+
+    return frozenset(key)
+
+
+async def _emit(ui: UnifiedRichUI, message: str) -> None:
+    """Shared plan task action; bound per task with :func:`functools.partial`."""
+
+    ui.info(message)
+    await asyncio.sleep(0)
+
+
+async def _workflow_step(
+    ui: UnifiedRichUI, name: str, message: str, payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Shared workflow step action; bound per step with :func:`functools.partial`."""
+
+    await asyncio.sleep(0)
+    ui.info(message)
+    return {name: message}
 
 
 @app.command()
@@ -142,7 +263,7 @@ def run(prompt: str = typer.Option(..., help="Prompt to send to the model")) ->
         except ProviderError as exc:
             ctx.ui.error(str(exc))
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @app.command()
@@ -150,32 +271,30 @@ def plan(file: Path = typer.Option(..., help="Path to JSON plan definition")) ->
     """Execute a plan defined in JSON format."""
 
     ctx = _require_runtime()
-    tasks_data = json.loads(file.read_text())
-    for item in tasks_data:
-
-        async def _action(message: str = item.get("message", "task complete")) -> None:
-            ctx.ui.info(message)
-            await asyncio.sleep(0)
-
-        task = TaskSpec(
-            name=item["name"],
-            description=item.get("description", ""),
-            action=_action,
-            depends_on=set(item.get("depends_on", [])),
-            retries=item.get("retries", 0),
-        )
-        ctx.planner.add_task(task)
+    tasks_data = orjson.loads(file.read_bytes())
+    ctx.planner.add_tasks(
+        [
+            TaskSpec(
+                name=item["name"],
+                description=item.get("description", ""),
+                action=functools.partial(_emit, ctx.ui, item.get("message", "task complete")),
+                depends_on=_deps(tuple(sorted(item.get("depends_on", ())))),
+                retries=item.get("retries", 0),
+            )
+            for item in tasks_data
+        ]
+    )
 
     async def _run() -> None:
         results = await ctx.planner.execute()
         table = ctx.ui.table(
             "Plan Results",
             ["Task", "Success"],
-            [[r.name, "✅" if r.success else "❌"] for r in results],
+            ((r.name, "✅" if r.success else "❌") for r in results),
         )
         ctx.ui.console.print(table)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @app.command()
@@ -196,7 +315,7 @@ def tui(
     ctx = _require_runtime()
     from vortex.ui_tui import TUIOptions, launch_tui
 
-    if theme not in {"auto", "dark", "light", "high_contrast"}:
+    if theme not in _ALLOWED_THEMES:
         raise typer.BadParameter("Theme must be auto, dark, light, or high_contrast")
 
     options = TUIOptions(
@@ -205,7 +324,7 @@ def tui(
         no_color=no_color,
         screen_reader=screen_reader,
     )
-    asyncio.run(launch_tui(ctx, options))
+    _run_async(ctx, launch_tui(ctx, options))
 
 
 @app.command()
@@ -213,9 +332,9 @@ def analyze(
     file: Path = typer.Option(..., help="JSON file mapping column to list of numbers")
 ) -> None:
     ctx = _require_runtime()
-    data = json.loads(file.read_text())
+    data = orjson.loads(file.read_bytes())
     summaries = ctx.data_analyst.summarise(data)
-    rows = [[s.column, str(s.count), f"{s.mean:.2f}", f"{s.median:.2f}"] for s in summaries]
+    rows = ((s.column, str(s.count), f"{s.mean:.2f}", f"{s.median:.2f}") for s in summaries)
     table = ctx.ui.table("Data Summary", ["Column", "Count", "Mean", "Median"], rows)
     ctx.ui.console.print(table)
 
@@ -224,7 +343,7 @@ def analyze(
 def plugin_list() -> None:
     ctx = _require_runtime()
     discovered = ctx.plugins.discover()
-    rows = [[name, str(path)] for name, path in discovered.items()]
+    rows = ((name, str(path)) for name, path in discovered.items())
     table = ctx.ui.table("Plugins", ["Name", "Path"], rows)
     ctx.ui.console.print(table)
 
@@ -232,7 +351,7 @@ def plugin_list() -> None:
 @plugin_app.command("run")
 def plugin_run(name: str, payload: str = typer.Argument(..., help="JSON payload")) -> None:
     ctx = _require_runtime()
-    data = json.loads(payload)
+    data = orjson.loads(payload)
 
     async def _run() -> None:
         try:
@@ -243,14 +362,14 @@ def plugin_run(name: str, payload: str = typer.Argument(..., help="JSON payload"
         except Exception as exc:  # pragma: no cover - plugin errors environment specific
             ctx.ui.error(f"Plugin failed: {exc}")
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @config_app.command("show")
 def config_show() -> None:
     ctx = _require_runtime()
     settings = ctx.settings
-    ctx.ui.console.print(settings.model_dump())
+    ctx.ui.print_json(settings.model_dump())
 
 
 @config_app.command("reload")
@@ -260,9 +379,9 @@ def config_reload() -> None:
     async def _run() -> None:
         settings = await ctx.config_manager.reload()
         ctx.ui.info("Configuration reloaded")
-        ctx.ui.console.print(settings.model_dump())
+        ctx.ui.print_json(settings.model_dump())
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @memory_app.command("add")
@@ -276,33 +395,39 @@ def memory_add(kind: str, content: str) -> None:
         except MemoryError as exc:
             ctx.ui.error(str(exc))
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @memory_app.command("list")
-def memory_list() -> None:
+def memory_list(
+    limit: int = typer.Option(20, "--limit", min=1, help="Maximum records to show"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Records to skip"),
+) -> None:
     ctx = _require_runtime()
 
     async def _run() -> None:
-        records = await ctx.memory.list()
-        rows = [[str(r.id), r.kind, r.content] for r in records]
+        records = await ctx.memory.list(limit=limit, offset=offset)
+        rows = ((str(r.id), r.kind, r.content) for r in records)
         table = ctx.ui.table("Memories", ["ID", "Kind", "Content"], rows)
         ctx.ui.console.print(table)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @memory_app.command("search")
-def memory_search(query: str) -> None:
+def memory_search(
+    query: str,
+    limit: int = typer.Option(5, "--limit", min=1, help="Maximum matches to show"),
+) -> None:
     ctx = _require_runtime()
 
     async def _run() -> None:
-        records = await ctx.memory.search(query)
-        rows = [[str(r.id), r.kind, r.content] for r in records]
+        records = await ctx.memory.search(query, limit=limit)
+        rows = ((str(r.id), r.kind, r.content) for r in records)
         table = ctx.ui.table("Search Results", ["ID", "Kind", "Content"], rows)
         ctx.ui.console.print(table)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @ai_app.command("summary")
@@ -313,7 +438,7 @@ def ai_summary() -> None:
         summary = await ctx.ai_context.summarise()
         ctx.ui.info(summary or "No context captured yet")
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @ai_app.command("sentiment")
@@ -332,41 +457,40 @@ def ai_feedback(category: str, score: int) -> None:
         average = await ctx.ai_learning.average_score(category)
         ctx.ui.info(f"Average score for {category}: {average:.2f}")
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @workflow_app.command("run")
 def workflow_run(file: Path) -> None:
     ctx = _require_runtime()
-    steps = json.loads(file.read_text())
-    ctx.workflow_engine = WorkflowEngine(ctx.perf_monitor)
-
-    for spec in steps:
-        step_name = spec["name"]
-
-        async def _action(
-            payload: Dict[str, Any],
-            message: str = spec.get("message", "done"),
-            name: str = step_name,
-        ) -> Dict[str, Any]:
-            await asyncio.sleep(0)
-            ctx.ui.info(message)
-            return {name: message}
-
-        ctx.workflow_engine.register(
-            step_name,
-            _action,
-            depends_on=spec.get("depends_on", []),
-        )
+    raw = file.read_bytes()
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    engine = _WORKFLOW_CACHE.get(key)
+    if engine is not None:
+        _WORKFLOW_CACHE.move_to_end(key)
+    else:
+        engine = WorkflowEngine(ctx.perf_monitor)
+        for spec in orjson.loads(raw):
+            engine.register(
+                spec["name"],
+                functools.partial(
+                    _workflow_step, ctx.ui, spec["name"], spec.get("message", "done")
+                ),
+                depends_on=spec.get("depends_on", []),
+            )
+        _WORKFLOW_CACHE[key] = engine
+        while len(_WORKFLOW_CACHE) > _WORKFLOW_CACHE_SIZE:
+            _WORKFLOW_CACHE.popitem(last=False)
+    ctx.workflow_engine = engine
 
     async def _run() -> None:
         try:
             result = await ctx.workflow_engine.execute({})
-            ctx.ui.console.print(result)
+            ctx.ui.print_json(result)
         except WorkflowError as exc:
             ctx.ui.error(str(exc))
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @workflow_app.command("macros")
@@ -375,11 +499,11 @@ def workflow_macros() -> None:
 
     async def _run() -> None:
         macros = await ctx.macro_system.list_macros()
-        rows = [[macro.name, macro.description, str(len(macro.steps))] for macro in macros]
+        rows = ((macro.name, macro.description, str(len(macro.steps))) for macro in macros)
         table = ctx.ui.table("Macros", ["Name", "Description", "Steps"], rows)
         ctx.ui.console.print(table)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @perf_app.command("metrics")
@@ -388,9 +512,9 @@ def perf_metrics() -> None:
 
     async def _run() -> None:
         snapshot = await ctx.perf_analytics.snapshot()
-        ctx.ui.console.print(snapshot)
+        ctx.ui.print_json(snapshot)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @perf_app.command("costs")
@@ -401,7 +525,7 @@ def perf_costs() -> None:
         total = await ctx.cost_tracker.total_cost()
         ctx.ui.info(f"Estimated spend: ${total:.4f}")
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @integration_app.command("git-status")
@@ -412,7 +536,7 @@ def integration_git_status() -> None:
         result = await ctx.git.status()
         ctx.ui.console.print(result.stdout or result.stderr)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @integration_app.command("apis")
@@ -421,9 +545,9 @@ def integration_list_apis() -> None:
 
     async def _run() -> None:
         names = await ctx.api_hub.list_apis()
-        ctx.ui.console.print({"apis": names})
+        ctx.ui.print_json({"apis": names})
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @integration_app.command("cloud")
@@ -432,9 +556,9 @@ def integration_list_cloud() -> None:
 
     async def _run() -> None:
         names = await ctx.cloud.list_accounts()
-        ctx.ui.console.print({"accounts": names})
+        ctx.ui.print_json({"accounts": names})
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @dev_app.command("tests")
@@ -443,9 +567,9 @@ def dev_run_tests() -> None:
 
     async def _run() -> None:
         report = await ctx.devtools.run_tests("tests")
-        ctx.ui.console.print(report)
+        ctx.ui.print_json(report)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @dev_app.command("health")
@@ -454,9 +578,9 @@ def dev_health() -> None:
 
     async def _run() -> None:
         info = await ctx.devtools.health_check()
-        ctx.ui.console.print(info)
+        ctx.ui.print_json(info)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @experimental_app.command("broadcast")
@@ -465,9 +589,9 @@ def experimental_broadcast(message: str) -> None:
 
     async def _run() -> None:
         result = await ctx.multiagent.broadcast(message)
-        ctx.ui.console.print(result)
+        ctx.ui.print_json(result)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @education_app.command("explain")
@@ -477,9 +601,9 @@ def education_explain(description: str, file: Path) -> None:
 
     async def _run() -> None:
         report = await ctx.code_explainer.explain(description, source)
-        ctx.ui.console.print(report)
+        ctx.ui.print_json(report)
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @app.command()
@@ -488,12 +612,34 @@ def shell() -> None:
 
     ctx = _require_runtime()
     ctx.ui.print_header("Vortex Shell (type 'exit' to quit)")
-    while True:
-        prompt = input("> ")
-        if prompt.strip().lower() in {"exit", "quit"}:
-            break
-        result = asyncio.run(ctx.model_manager.generate(prompt))
-        ctx.ui.info(result["text"])
+
+    async def _read_prompt(session: Optional[PromptSession[str]]) -> str:
+        if session is not None:
+            return await session.prompt_async("> ")
+        return await asyncio.to_thread(input, "> ")
+
+    async def _shell() -> None:
+        # A single event loop serves the whole session so pending work keeps
+        # running while the operator types the next prompt.
+        session: Optional[PromptSession[str]] = (
+            PromptSession() if PromptSession is not None else None
+        )
+        while True:
+            try:
+                prompt = await _read_prompt(session)
+            except (EOFError, KeyboardInterrupt):
+                break
+            if prompt.strip().lower() in _SHELL_EXIT_WORDS:
+                break
+            try:
+                result = await ctx.model_manager.generate(prompt)
+            except ProviderError as exc:
+                ctx.ui.error(str(exc))
+                continue
+            ctx.ui.info(result["text"])
+        await ctx.model_manager.close()
+
+    _run_async(ctx, _shell())
 
 
 def main() -> None:
@@ -10,6 +10,7 @@ Pydantic models to guarantee type safety throughout the codebase.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
 import threading
@@ -18,17 +19,38 @@ from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from vortex.utils.errors import ConfigurationError
 from vortex.utils.logging import get_logger
 
+try:  # pragma: no cover - standard library from Python 3.11
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - older interpreters
+    tomllib = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency for native file notifications
+    from watchfiles import watch
+except ModuleNotFoundError:  # pragma: no cover - fall back to mtime polling
+    watch = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# libyaml's C loader is ~10x faster than the pure-Python SafeLoader on config
+# sized documents; PyYAML only exposes it when built against libyaml.
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+logger.debug("yaml loader selected", extra={"loader": _YAML_LOADER.__name__})
+
+# Settings are immutable snapshots: a reload swaps in a new tree rather than
+# mutating the one subsystems were built from.
+_SETTINGS_CONFIG = ConfigDict(frozen=True)
+
 
 class ProviderSettings(BaseModel):
     """Configuration describing an AI provider."""
 
+    model_config = _SETTINGS_CONFIG
+
     name: str
     type: str = Field(..., description="Provider implementation identifier")
     api_key: Optional[str] = Field(default=None, repr=False)
@@ -41,6 +63,8 @@ class ProviderSettings(BaseModel):
 class MemorySettings(BaseModel):
     """Configuration for persistent memory backends."""
 
+    model_config = _SETTINGS_CONFIG
+
     database: str = Field(default="sqlite:///vortex_memory.db")
     vector_backend: str = Field(default="simple", description="Vector store type")
     embedding_model: str = Field(default="openai:text-embedding-ada-002")
@@ -50,6 +74,8 @@ class MemorySettings(BaseModel):
 class SecuritySettings(BaseModel):
     """Security knobs exposed to operators."""
 
+    model_config = _SETTINGS_CONFIG
+
     sandbox_enabled: bool = True
     allowed_modules: List[str] = Field(default_factory=lambda: ["math", "json"])
     forbidden_modules: List[str] = Field(default_factory=lambda: ["os", "sys"])
@@ -60,13 +86,19 @@ class SecuritySettings(BaseModel):
 class PlannerSettings(BaseModel):
     """Tuning options for the advanced planner."""
 
+    model_config = _SETTINGS_CONFIG
+
     max_parallel_tasks: int = 4
     recovery_retries: int = 3
+    retry_backoff: float = Field(default=0.1, description="Base retry delay in seconds")
+    max_backoff: float = Field(default=5.0, description="Upper bound on a retry delay")
 
 
 class UISettings(BaseModel):
     """Settings for the terminal UI."""
 
+    model_config = _SETTINGS_CONFIG
+
     enable_progress: bool = True
     theme: str = "default"
 
@@ -74,18 +106,19 @@ class UISettings(BaseModel):
 class VortexSettings(BaseModel):
     """Root configuration schema."""
 
+    model_config = _SETTINGS_CONFIG
+
     providers: List[ProviderSettings]
     memory: MemorySettings = Field(default_factory=MemorySettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     planner: PlannerSettings = Field(default_factory=PlannerSettings)
     ui: UISettings = Field(default_factory=UISettings)
 
-    @field_validator("providers")
-    @classmethod
-    def validate_providers(cls, value: List[ProviderSettings]) -> List[ProviderSettings]:
-        if not value:
+    @model_validator(mode="after")
+    def validate_providers(self) -> "VortexSettings":
+        if not self.providers:
             raise ValueError("At least one provider must be configured")
-        return value
+        return self
 
 
 class UnifiedConfigManager:
@@ -93,9 +126,9 @@ class UnifiedConfigManager:
 
     The manager is intentionally implemented as a singleton-like component so it
     can be initialised once in :mod:`vortex.main` and then injected into other
-    subsystems. Live reload is achieved via a background thread that polls the
-    configuration file modification timestamp; the approach avoids extra
-    dependencies while still providing near-real-time updates in development.
+    subsystems. Live reload runs on a background thread that waits for native
+    filesystem notifications when :mod:`watchfiles` is installed and otherwise
+    polls the configuration file modification timestamp.
     """
 
     def __init__(self, config_path: Optional[Path] = None, *, poll_interval: float = 2.0) -> None:
@@ -115,8 +148,15 @@ class UnifiedConfigManager:
         async with self._lock:
             try:
                 logger.debug("loading configuration", extra={"path": str(self.config_path)})
-                data = self._read_file(self.config_path)
-                settings = VortexSettings(**data)
+                try:
+                    stat = os.stat(self.config_path)
+                except FileNotFoundError as exc:
+                    raise ConfigurationError(
+                        f"Configuration file {self.config_path} does not exist"
+                    ) from exc
+                settings = _load_settings(
+                    os.fspath(self.config_path), stat.st_mtime_ns, stat.st_size
+                )
                 self._settings = settings
                 return settings
             except Exception as exc:  # pragma: no cover - defensive
@@ -130,12 +170,17 @@ class UnifiedConfigManager:
         return settings
 
     def start_watching(self) -> None:
-        """Begin polling the configuration file for changes."""
+        """Begin watching the configuration file for changes.
+
+        With :mod:`watchfiles` installed the watcher thread blocks on native
+        filesystem notifications (inotify, FSEvents, ReadDirectoryChangesW);
+        otherwise it falls back to polling the modification timestamp.
+        """
 
         if self._watch_task and self._watch_task.is_alive():  # pragma: no cover - simple guard
             return
 
-        def _watch() -> None:
+        def _poll() -> None:
             last_mtime = 0.0
             while not self._stop_event.is_set():
                 try:
@@ -149,12 +194,31 @@ class UnifiedConfigManager:
                     )
                 time.sleep(self.poll_interval)
 
+        def _notify_on_change() -> None:
+            # Watch the directory rather than the file so editors that replace
+            # the file atomically (write + rename) are still observed.
+            target = self.config_path.resolve()
+            for _ in watch(
+                target.parent,
+                watch_filter=lambda _change, changed: Path(changed) == target,
+                stop_event=self._stop_event,
+                recursive=False,
+            ):
+                try:
+                    asyncio.run(self.reload())
+                except ConfigurationError as exc:
+                    logger.warning("configuration reload failed", extra={"error": str(exc)})
+
         self._stop_event.clear()
-        self._watch_task = threading.Thread(target=_watch, name="config-watcher", daemon=True)
+        self._watch_task = threading.Thread(
+            target=_poll if watch is None else _notify_on_change,
+            name="config-watcher",
+            daemon=True,
+        )
         self._watch_task.start()
 
     def stop_watching(self) -> None:
-        """Stop polling the configuration file."""
+        """Stop watching the configuration file."""
 
         self._stop_event.set()
         if self._watch_task and self._watch_task.is_alive():  # pragma: no cover - thread cleanup
@@ -181,17 +245,41 @@ class UnifiedConfigManager:
 
     @staticmethod
     def _read_file(path: Path) -> Dict[str, Any]:
-        if not path.exists():
-            raise ConfigurationError(f"Configuration file {path} does not exist")
-        if path.suffix in {".yml", ".yaml"}:
-            with path.open("r", encoding="utf-8") as handle:
-                return yaml.safe_load(handle) or {}
-        if path.suffix == ".toml":
-            import tomllib  # Python 3.11+ built-in
-
-            with path.open("rb") as handle:
-                return tomllib.load(handle)
-        raise ConfigurationError(f"Unsupported configuration format: {path.suffix}")
+        parser = _PARSERS.get(path.suffix)
+        if parser is None:
+            raise ConfigurationError(f"Unsupported configuration format: {path.suffix}")
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError as exc:
+            raise ConfigurationError(f"Configuration file {path} does not exist") from exc
+        return parser(raw)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_settings(path: str, mtime_ns: int, size: int) -> VortexSettings:
+    # Keyed on the file's stat, so loading an unchanged file again (a second
+    # manager, an explicit reload) skips the parse and validation. Settings
+    # are frozen, which makes sharing one instance between callers safe.
+    return VortexSettings.model_validate(UnifiedConfigManager._read_file(Path(path)))
+
+
+def _parse_yaml(raw: bytes) -> Dict[str, Any]:
+    # libyaml scans the bytes directly, so there is no Python-level decode.
+    return yaml.load(raw, Loader=_YAML_LOADER) or {}
+
+
+def _parse_toml(raw: bytes) -> Dict[str, Any]:
+    if tomllib is None:
+        raise ConfigurationError("TOML configuration requires Python 3.11 or newer")
+    return tomllib.loads(raw.decode("utf-8"))
+
+
+# Parsers keyed by file suffix; new formats only need an entry here.
+_PARSERS: Dict[str, Callable[[bytes], Dict[str, Any]]] = {
+    ".yml": _parse_yaml,
+    ".yaml": _parse_yaml,
+    ".toml": _parse_toml,
+}
 
 
 __all__ = [
@@ -3,19 +3,54 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import hashlib
+import heapq
 import math
+import operator
 import sqlite3
+import struct
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import orjson
 
 from vortex.utils.errors import MemoryError
 from vortex.utils.logging import get_logger
 
+try:  # pragma: no cover - optional dependency shipped with the ``ai`` extra
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python fallback
+    np = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
+
+class _LazyEmbedding:
+    """Descriptor behind ``MemoryRecord.embedding``.
+
+    Records loaded from SQLite are given the raw column value, which is kept
+    aside and decoded on first read, so listings that never read vectors skip
+    the work. Assigning a list stores it as is.
+    """
+
+    def __get__(self, record: Optional["MemoryRecord"], owner: Any = None) -> Any:
+        if record is None:
+            return self
+        value = record.__dict__["_raw_embedding"]
+        if not isinstance(value, list):
+            value = record.__dict__["_raw_embedding"] = _decode_embedding(value)
+        return value
+
+    def __set__(self, record: "MemoryRecord", value: Any) -> None:
+        record.__dict__["_raw_embedding"] = value
+
 
 @dataclass
 class MemoryRecord:
@@ -29,48 +64,217 @@ class MemoryRecord:
     created_at: float
 
 
+# Installed once the dataclass is built, so ``embedding`` stays a required field
+# and the generated ``__init__`` assigns through the descriptor.
+MemoryRecord.embedding = _LazyEmbedding()  # type: ignore[assignment]
+
+
+def _py_dot(a: Sequence[float], b: Sequence[float]) -> float:
+    # Mismatched dimensions are an error, as with math.sumprod and NumPy, rather
+    # than a score silently computed over the shorter vector.
+    if len(a) != len(b):
+        raise ValueError("Inputs are not the same length")
+    # map(operator.mul) keeps the loop in C instead of a generator frame.
+    return sum(map(operator.mul, a, b))
+
+
+# math.sumprod (3.12+) is a single C call with extended-precision accumulation.
+_dot: Callable[[Sequence[float], Sequence[float]], float] = getattr(math, "sumprod", _py_dot)
+
+
 class SimpleVectorStore:
-    """Naive in-memory vector store with cosine similarity."""
+    """In-memory vector store with cosine similarity.
+
+    Vectors are stored L2-normalised so a search only needs dot products. When
+    NumPy is available they live in a single contiguous ``(N, D)`` float32
+    matrix and a search is one matrix-vector product plus a partial sort.
+    Without NumPy each stored list is scored with a C-level dot product and the
+    top hits are picked with :func:`heapq.nlargest`.
+    """
+
+    _INITIAL_CAPACITY = 64
 
     def __init__(self) -> None:
         self._vectors: Dict[int, List[float]] = {}
-
-    def add(self, record_id: int, vector: List[float]) -> None:
-        self._vectors[record_id] = vector
+        self._matrix: Any = None
+        self._ids: Any = None
+        self._rows: Dict[int, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._vectors) if np is None else self._size
+
+    def add(self, record_id: int, vector: Sequence[float]) -> None:
+        if np is None:
+            self._vectors[record_id] = self._normalise_list(vector)
+            return
+        row = self._normalise(vector)
+        index = self._rows.get(record_id)
+        if index is None:
+            index = self._append_slot(record_id, row.shape[0])
+        self._matrix[index] = row
+
+    def add_many(self, record_ids: Sequence[int], vectors: Any) -> None:
+        """Insert several vectors, growing the matrix at most once."""
+
+        if np is None or any(record_id in self._rows for record_id in record_ids):
+            for record_id, vector in zip(record_ids, vectors):
+                self.add(record_id, vector)
+            return
+        if not len(record_ids):
+            return
+        rows = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        rows = np.divide(rows, norms, out=rows.copy(), where=norms != 0)
+        start, end = self._size, self._size + rows.shape[0]
+        if self._matrix is None:
+            capacity = max(self._INITIAL_CAPACITY, end)
+            self._matrix = np.zeros((capacity, rows.shape[1]), dtype=np.float32)
+            self._ids = np.zeros(capacity, dtype=np.int64)
+        elif end > self._matrix.shape[0]:
+            extra = max(self._matrix.shape[0], end - self._matrix.shape[0])
+            self._matrix = np.concatenate(
+                [self._matrix, np.zeros((extra, self._matrix.shape[1]), dtype=np.float32)]
+            )
+            self._ids = np.concatenate([self._ids, np.zeros(extra, dtype=np.int64)])
+        self._matrix[start:end] = rows
+        self._ids[start:end] = record_ids
+        self._rows.update(
+            (record_id, start + offset) for offset, record_id in enumerate(record_ids)
+        )
+        self._size = end
 
     def remove(self, record_id: int) -> None:
-        self._vectors.pop(record_id, None)
+        if np is None:
+            self._vectors.pop(record_id, None)
+            return
+        index = self._rows.pop(record_id, None)
+        if index is None:
+            return
+        last = self._size - 1
+        if index != last:
+            # Keep rows dense by moving the final row into the freed slot.
+            moved = int(self._ids[last])
+            self._matrix[index] = self._matrix[last]
+            self._ids[index] = moved
+            self._rows[moved] = index
+        self._size = last
+
+    def search(self, vector: Sequence[float], limit: int = 5) -> List[Tuple[int, float]]:
+        if np is None:
+            query = self._normalise_list(vector)
+            scores = ((rid, _dot(query, stored)) for rid, stored in self._vectors.items())
+            return heapq.nlargest(limit, scores, key=operator.itemgetter(1))
+        limit = min(limit, self._size)
+        if limit <= 0:
+            return []
+        scores = self._matrix[: self._size] @ self._normalise(vector)
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self._ids[index]), float(scores[index])) for index in top]
+
+    def _append_slot(self, record_id: int, dimensions: int) -> int:
+        if self._matrix is None:
+            self._matrix = np.zeros((self._INITIAL_CAPACITY, dimensions), dtype=np.float32)
+            self._ids = np.zeros(self._INITIAL_CAPACITY, dtype=np.int64)
+        elif self._size == self._matrix.shape[0]:
+            # Double the capacity so appends stay amortised O(1).
+            self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+            self._ids = np.concatenate([self._ids, np.zeros_like(self._ids)])
+        index = self._size
+        self._ids[index] = record_id
+        self._rows[record_id] = index
+        self._size += 1
+        return index
 
-    def search(self, vector: List[float], limit: int = 5) -> List[Tuple[int, float]]:
-        results: List[Tuple[int, float]] = []
-        for record_id, stored in self._vectors.items():
-            score = self._cosine_similarity(vector, stored)
-            results.append((record_id, score))
-        results.sort(key=lambda item: item[1], reverse=True)
-        return results[:limit]
+    @staticmethod
+    def _normalise(vector: Sequence[float]) -> Any:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        # Zero vectors stay zero so they score 0.0, matching the Python path.
+        return array / norm if norm else array
 
     @staticmethod
-    def _cosine_similarity(a: List[float], b: List[float]) -> float:
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(y * y for y in b))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+    def _normalise_list(vector: Sequence[float]) -> List[float]:
+        values = list(vector)
+        norm = math.sqrt(_dot(values, values))
+        return [value / norm for value in values] if norm else values
+
 
+# Bind the constructor once; CPython backs it with OpenSSL (SHA-NI / ARMv8
+# crypto extensions) when available and falls back to its own implementation.
+_sha256 = hashlib.sha256
+logger.debug(
+    "sha256 backend selected",
+    extra={"backend": "openssl" if _sha256.__module__ == "_hashlib" else "builtin"},
+)
 
-def _hash_embedding(text: str, dimensions: int = 16) -> List[float]:
+
+@functools.lru_cache(maxsize=256)
+def _hash_embedding(text: str, dimensions: int = 16) -> Any:
     """Deterministically map text to a vector.
 
     Real deployments would rely on an embedding provider such as OpenAI or
     HuggingFace. The deterministic hash-based embedding keeps tests hermetic and
     ensures the vector store stays functional without external services.
+
+    The digest is reinterpreted as big-endian 16-bit integers in one call:
+    a float32 ``ndarray`` when NumPy is available, otherwise a tuple of floats.
+    Results are memoised so repeated searches skip the hashing; both forms are
+    immutable (the array is marked read-only) because they are shared.
     """
 
-    import hashlib
+    return _hash_embedding_bytes(text.encode("utf-8"), dimensions)
+
+
+def _hash_embedding_bytes(data: bytes, dimensions: int = 16) -> Any:
+    """:func:`_hash_embedding` for callers that already hold encoded bytes."""
+
+    digest = _sha256(data).digest()
+    if np is not None:
+        vector = np.frombuffer(digest, dtype=">u2", count=dimensions).astype(np.float32) / 65535.0
+        vector.flags.writeable = False
+        return vector
+    return tuple(value / 65535.0 for value in struct.unpack_from(f">{dimensions}H", digest))
+
+
+def _hash_embeddings(texts: Sequence[str], dimensions: int = 16) -> Any:
+    """Vectorised :func:`_hash_embedding` returning one row per text."""
 
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    return [int.from_bytes(digest[i : i + 2], "big") / 65535.0 for i in range(0, dimensions * 2, 2)]
+    if np is None:
+        return [_hash_embedding(text, dimensions) for text in texts]
+    digests = b"".join(_sha256(text.encode("utf-8")).digest() for text in texts)
+    matrix = np.frombuffer(digests, dtype=">u2").reshape(len(texts), -1)[:, :dimensions]
+    return matrix.astype(np.float32) / 65535.0
+
+
+def _dump_metadata(metadata: Dict[str, Any]) -> str:
+    # Kept as TEXT rather than raw bytes so SQLite's JSON functions still apply.
+    return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _as_list(vector: Any) -> List[float]:
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
+def _encode_embedding(vector: Any) -> bytes:
+    """Pack a vector as native float32 bytes for the ``embedding`` BLOB column."""
+
+    if np is not None:
+        return np.asarray(vector, dtype=np.float32).tobytes()
+    return array("f", vector).tobytes()
+
+
+def _decode_embedding(raw: Any) -> List[float]:
+    if raw is None:
+        return []
+    if isinstance(raw, bytes):
+        values = array("f")
+        values.frombytes(raw)
+        return values.tolist()
+    if isinstance(raw, str):  # rows written before embeddings were stored as BLOBs
+        return orjson.loads(raw or "[]")
+    return _as_list(raw)
 
 
 class UnifiedMemorySystem:
@@ -85,10 +289,37 @@ class UnifiedMemorySystem:
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         self._lock = asyncio.Lock()
+        # Writes hold SQLite's lock and fsync, so they run on one dedicated
+        # thread instead of competing for slots in the default executor.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vortex-memory")
         self._vector_store = vector_store or SimpleVectorStore()
         self._setup()
+        # Reads get their own connection: under WAL it sees the last committed
+        # snapshot even while the writer thread is mid-transaction on ``_conn``.
+        # A private in-memory database exists only on ``_conn``, so it is shared.
+        self._read_conn = self._conn
+        if path != ":memory:":
+            self._read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._read_conn.row_factory = sqlite3.Row
+            for pragma in (
+                "PRAGMA query_only=ON",
+                "PRAGMA mmap_size=268435456",
+                "PRAGMA cache_size=-65536",
+            ):
+                self._read_conn.execute(pragma)
 
     def _setup(self) -> None:
+        # WAL turns each commit into an append instead of a rollback-journal
+        # fsync and lets readers proceed during writes; NORMAL sync is durable
+        # across application crashes, which is what a local memory store needs.
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA cache_size=-65536",
+        ):
+            self._conn.execute(pragma)
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS memory (
@@ -96,11 +327,15 @@ class UnifiedMemorySystem:
                 kind TEXT NOT NULL,
                 content TEXT NOT NULL,
                 metadata TEXT,
-                embedding TEXT,
+                embedding BLOB,
                 created_at REAL
             )
             """
         )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS memory_created_at ON memory (created_at)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS memory_kind_created_at ON memory (kind, created_at)"
+        )
         self._conn.commit()
 
     async def add(
@@ -109,67 +344,120 @@ class UnifiedMemorySystem:
         """Persist a memory and update the vector store."""
 
         metadata = metadata or {}
-        embedding = _hash_embedding(content)
-        async with self._lock:
-            cursor = await asyncio.to_thread(
-                self._conn.execute,
-                "INSERT INTO memory (kind, content, metadata, embedding, created_at) VALUES (?, ?, ?, ?, ?)",
-                (kind, content, json.dumps(metadata), json.dumps(embedding), time.time()),
+        vector = _hash_embedding(content)
+        row = (kind, content, _dump_metadata(metadata), _encode_embedding(vector), time.time())
+
+        def _insert() -> int:
+            cursor = self._conn.execute(
+                "INSERT INTO memory (kind, content, metadata, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                row,
             )
             self._conn.commit()
-            record_id = cursor.lastrowid
-            self._vector_store.add(record_id, embedding)
-            return MemoryRecord(record_id, kind, content, metadata, embedding, time.time())
+            return cursor.lastrowid
 
-    async def delete(self, record_id: int) -> None:
         async with self._lock:
-            await asyncio.to_thread(
-                self._conn.execute, "DELETE FROM memory WHERE id = ?", (record_id,)
+            record_id = await self._write(_insert)
+            self._vector_store.add(record_id, vector)
+            return MemoryRecord(record_id, kind, content, metadata, vector, time.time())
+
+    async def add_many(
+        self, items: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> List[MemoryRecord]:
+        """Persist ``(kind, content, metadata)`` items in a single transaction."""
+
+        batch = [(kind, content, metadata or {}) for kind, content, metadata in items]
+        if not batch:
+            return []
+        vectors = _hash_embeddings([content for _, content, _ in batch])
+        created_at = time.time()
+        rows = [
+            (kind, content, _dump_metadata(metadata), _encode_embedding(vector), created_at)
+            for (kind, content, metadata), vector in zip(batch, vectors)
+        ]
+
+        def _insert() -> int:
+            self._conn.executemany(
+                "INSERT INTO memory (kind, content, metadata, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
             )
+            # executemany leaves ``lastrowid`` untouched; the batch occupies a
+            # contiguous id range ending at last_insert_rowid().
+            last_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
             self._conn.commit()
+            return last_id
+
+        async with self._lock:
+            last_id = await self._write(_insert)
+            first_id = last_id - len(rows) + 1
+            record_ids = list(range(first_id, last_id + 1))
+            self._vector_store.add_many(record_ids, vectors)
+        return [
+            MemoryRecord(record_id, kind, content, metadata, vector, created_at)
+            for record_id, (kind, content, metadata), vector in zip(record_ids, batch, vectors)
+        ]
+
+    async def delete(self, record_id: int) -> None:
+        def _delete() -> None:
+            self._conn.execute("DELETE FROM memory WHERE id = ?", (record_id,))
+            self._conn.commit()
+
+        async with self._lock:
+            await self._write(_delete)
             self._vector_store.remove(record_id)
 
     async def search(self, query: str, limit: int = 5) -> List[MemoryRecord]:
         """Semantic search using cosine similarity."""
 
         vector = _hash_embedding(query)
-        ids = self._vector_store.search(vector, limit=limit)
-        records: List[MemoryRecord] = []
-        for record_id, score in ids:
-            cursor = await asyncio.to_thread(
-                self._conn.execute, "SELECT * FROM memory WHERE id = ?", (record_id,)
-            )
-            row = cursor.fetchone()
-            if not row:
-                continue
-            records.append(
-                MemoryRecord(
-                    id=row["id"],
-                    kind=row["kind"],
-                    content=row["content"],
-                    metadata=json.loads(row["metadata"] or "{}"),
-                    embedding=json.loads(row["embedding"] or "[]"),
-                    created_at=row["created_at"],
-                )
-            )
-        return records
+        ranked = self._vector_store.search(vector, limit=limit)
+        if not ranked:
+            return []
+        ids = [record_id for record_id, _ in ranked]
+        placeholders = ", ".join("?" * len(ids))
+        # One IN query (served by the primary-key index) instead of a SELECT and
+        # thread hop per hit; rows come back unordered, so re-rank them here.
+        rows = await self._fetchall(f"SELECT * FROM memory WHERE id IN ({placeholders})", ids)
+        by_id = {row["id"]: row for row in rows}
+        return [self._to_record(by_id[record_id]) for record_id in ids if record_id in by_id]
+
+    async def list(
+        self, limit: int = 20, *, offset: int = 0, kind: Optional[str] = None
+    ) -> List[MemoryRecord]:
+        """Return a page of the most recent memories, optionally filtered by ``kind``."""
+
+        if kind is None:
+            sql = "SELECT * FROM memory ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            params: Tuple[Any, ...] = (limit, offset)
+        else:
+            sql = "SELECT * FROM memory WHERE kind = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            params = (kind, limit, offset)
+        rows = await self._fetchall(sql, params)
+        return [self._to_record(row) for row in rows]
+
+    async def _write(self, operation: Callable[[], _T]) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._writer, operation)
+
+    async def _fetchall(self, sql: str, params: Sequence[Any]) -> List[sqlite3.Row]:
+        # Reads are index lookups that finish in tens of microseconds, less than
+        # a round trip through a worker thread, so they run on the loop thread.
+        if self._read_conn is self._conn:
+            # Sharing the writer's connection: wait out any write in progress.
+            async with self._lock:
+                return self._conn.execute(sql, params).fetchall()
+        return self._read_conn.execute(sql, params).fetchall()
 
-    async def list(self, limit: int = 20) -> List[MemoryRecord]:
-        cursor = await asyncio.to_thread(
-            self._conn.execute, "SELECT * FROM memory ORDER BY created_at DESC LIMIT ?", (limit,)
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> MemoryRecord:
+        return MemoryRecord(
+            id=row["id"],
+            kind=row["kind"],
+            content=row["content"],
+            metadata=orjson.loads(row["metadata"] or "{}"),
+            embedding=row["embedding"],
+            created_at=row["created_at"],
         )
-        rows = cursor.fetchall()
-        return [
-            MemoryRecord(
-                id=row["id"],
-                kind=row["kind"],
-                content=row["content"],
-                metadata=json.loads(row["metadata"] or "{}"),
-                embedding=json.loads(row["embedding"] or "[]"),
-                created_at=row["created_at"],
-            )
-            for row in rows
-        ]
 
     async def summarise(self, limit: int = 5) -> str:
         """Produce a naive summary of the most recent memories.
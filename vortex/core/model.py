@@ -6,7 +6,7 @@ import asyncio
 import math
 import time
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple, Type
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type
 
 import httpx
 
@@ -26,6 +26,7 @@ class BaseProvider:
         self.settings = settings
         self.api_key = settings.get("api_key")
         self.base_url = settings.get("base_url")
+        self._client: Optional[httpx.AsyncClient] = None
 
     async def generate(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
         """Return a text completion for ``prompt``.
@@ -48,6 +49,13 @@ class BaseProvider:
         result = await self.generate(prompt, **kwargs)
         yield result.get("text", "")
 
+    async def aclose(self) -> None:
+        """Release network resources held by the provider, if any."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
 
 class EchoProvider(BaseProvider):
     """Deterministic provider returning the prompt.
@@ -81,26 +89,65 @@ class OpenAIProvider(BaseProvider):
     name = "openai"
     default_model = "gpt-3.5-turbo"
 
+    def __init__(self, *, settings: Dict[str, Any]) -> None:
+        super().__init__(settings=settings)
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._guard: Optional[asyncio.Task[None]] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use.
+
+        Keep-alive connections are bound to the event loop that opened them, so
+        a caller on a different loop (e.g. successive ``asyncio.run`` calls from
+        the CLI) gets a fresh client instead of a pool of dead sockets. Each
+        client is closed on its own loop when that loop shuts down.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            client = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+            self._client, self._client_loop = client, loop
+            self._guard = loop.create_task(self._close_with_loop(client))
+        return self._client
+
+    async def _close_with_loop(self, client: httpx.AsyncClient) -> None:
+        # Parked for the life of the loop: asyncio.run() cancels it on the way
+        # out, the last point at which the client's sockets can be closed.
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if self._client is client:
+                self._client = None
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        guard, self._guard = self._guard, None
+        if guard is not None and guard.get_loop() is asyncio.get_running_loop():
+            guard.cancel()
+        await super().aclose()
+
     async def generate(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
         if not self.api_key:
             raise ProviderError("OpenAI API key missing")
         model = kwargs.get("model", self.default_model)
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                self.base_url or "https://api.openai.com/v1/chat/completions",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={
-                    "model": model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "stream": False,
-                },
-            )
-            if response.status_code >= 400:
-                raise ProviderError(f"OpenAI error: {response.text}")
-            payload = response.json()
-            choice = payload["choices"][0]
-            usage = payload.get("usage", {})
-            return {"text": choice["message"]["content"], "usage": usage}
+        response = await self._get_client().post(
+            self.base_url or "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": False,
+            },
+        )
+        if response.status_code >= 400:
+            raise ProviderError(f"OpenAI error: {response.text}")
+        payload = response.json()
+        choice = payload["choices"][0]
+        usage = payload.get("usage", {})
+        return {"text": choice["message"]["content"], "usage": usage}
 
     async def stream(
         self, prompt: str, **kwargs: Any
@@ -108,26 +155,49 @@ class OpenAIProvider(BaseProvider):
         if not self.api_key:
             raise ProviderError("OpenAI API key missing")
         model = kwargs.get("model", self.default_model)
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream(
-                "POST",
-                self.base_url or "https://api.openai.com/v1/chat/completions",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={
-                    "model": model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "stream": True,
-                },
-            ) as response:
-                if response.status_code >= 400:
-                    raise ProviderError(f"OpenAI error: {await response.aread()}")
-                async for line in response.aiter_lines():
-                    if not line or not line.startswith("data:"):
-                        continue
-                    chunk = line[5:].strip()
-                    if chunk == "[DONE]":
-                        break
-                    yield chunk
+        async with self._get_client().stream(
+            "POST",
+            self.base_url or "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": True,
+            },
+            timeout=None,
+        ) as response:
+            if response.status_code >= 400:
+                body = (await response.aread()).decode("utf-8", "replace")
+                raise ProviderError(f"OpenAI error: {body}")
+            async for chunk in _iter_sse_data(response.aiter_bytes()):
+                yield chunk
+
+
+async def _iter_sse_data(stream: AsyncIterator[bytes]) -> AsyncGenerator[str, None]:
+    """Yield the ``data:`` payloads of a server-sent event stream.
+
+    Works on raw byte chunks and emits each event as soon as its terminating
+    blank line arrives, skipping httpx's line decoder. Stops at ``[DONE]``.
+    """
+
+    buffer = bytearray()
+    async for chunk in stream:
+        # A CRLF can straddle two chunks, so a trailing "\r" left by the last
+        # one also calls for normalising once this chunk is appended.
+        split_crlf = buffer.endswith(b"\r")
+        buffer += chunk
+        if split_crlf or b"\r" in chunk:
+            buffer = bytearray(buffer.replace(b"\r\n", b"\n"))
+        while (end := buffer.find(b"\n\n")) != -1:
+            event = bytes(buffer[:end])
+            del buffer[: end + 2]
+            for line in event.split(b"\n"):
+                if not line.startswith(b"data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == b"[DONE]":
+                    return
+                yield payload.decode("utf-8")
 
 
 PROVIDER_REGISTRY: Dict[str, Type[BaseProvider]] = {
@@ -168,7 +238,6 @@ class UnifiedModelManager:
         if not self.providers:
             raise ProviderError("No providers configured")
         self._cache = AsyncTTLCache(ttl=5.0)
-        self._lock = asyncio.Lock()
 
     def _create_provider(self, conf: Dict[str, Any]) -> ProviderState:
         provider_type = conf.get("type")
@@ -186,22 +255,24 @@ class UnifiedModelManager:
         The manager iterates through providers until one succeeds. Failures are
         logged and the next provider is tried automatically. Token accounting and
         cost calculation happen per provider.
+
+        Calls are not serialised: metrics are only touched synchronously on the
+        event loop thread, so independent prompts can be in flight at once.
         """
 
-        async with self._lock:
-            for state in self.providers:
-                try:
-                    if streaming:
-                        return state.instance.stream(prompt, model=model)
-                    result = await state.instance.generate(prompt, model=model)
-                    self._update_metrics(state, result)
-                    return result
-                except ProviderError as exc:
-                    logger.warning(
-                        "provider failed",
-                        extra={"provider": state.instance.name, "error": str(exc)},
-                    )
-                    continue
+        for state in self.providers:
+            try:
+                if streaming:
+                    return state.instance.stream(prompt, model=model)
+                result = await state.instance.generate(prompt, model=model)
+                self._update_metrics(state, result)
+                return result
+            except ProviderError as exc:
+                logger.warning(
+                    "provider failed",
+                    extra={"provider": state.instance.name, "error": str(exc)},
+                )
+                continue
         raise ProviderError("All providers failed")
 
     async def cached_generate(self, cache_key: str, prompt: str, **kwargs: Any) -> Any:
@@ -213,6 +284,11 @@ class UnifiedModelManager:
         usage = result.get("usage", {})
         state.metrics.update(usage, rate=float(state.settings.get("cost_per_1k_tokens", 0.0)))
 
+    async def close(self) -> None:
+        """Close provider HTTP clients to free pooled connections."""
+
+        await asyncio.gather(*(state.instance.aclose() for state in self.providers))
+
     def token_usage(self) -> Dict[str, ProviderMetrics]:
         """Return aggregated usage metrics per provider."""
 
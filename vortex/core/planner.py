@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import random
 from collections import defaultdict
 from dataclasses import dataclass, field
 from graphlib import TopologicalSorter
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from vortex.utils.errors import VortexError
 from vortex.utils.logging import get_logger
@@ -22,7 +24,7 @@ class TaskSpec:
     name: str
     description: str
     action: Callable[[], Awaitable[Any]]
-    depends_on: Set[str] = field(default_factory=set)
+    depends_on: AbstractSet[str] = field(default_factory=set)
     retries: int = 0
 
 
@@ -37,15 +39,45 @@ class TaskResult:
 class UnifiedAdvancedPlanner:
     """Plan and execute tasks with dependency awareness."""
 
-    def __init__(self, *, max_parallel_tasks: int = 4, recovery_retries: int = 2) -> None:
+    def __init__(
+        self,
+        *,
+        max_parallel_tasks: int = 4,
+        recovery_retries: int = 2,
+        retry_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+    ) -> None:
         self.max_parallel_tasks = max_parallel_tasks
         self.recovery_retries = recovery_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self._cancelled: Optional[asyncio.Event] = None
         self._tasks: Dict[str, TaskSpec] = {}
+        # Kahn's algorithm bookkeeping, maintained as tasks are registered.
+        self._children: Dict[str, List[str]] = defaultdict(list)
+        self._indegree: Dict[str, int] = {}
 
     def add_task(self, task: TaskSpec) -> None:
         if task.name in self._tasks:
             raise VortexError(f"Task {task.name} already registered")
+        self._register(task)
+
+    def _register(self, task: TaskSpec) -> None:
         self._tasks[task.name] = task
+        self._indegree[task.name] = len(task.depends_on)
+        for dep in task.depends_on:
+            self._children[dep].append(task.name)
+
+    def add_tasks(self, tasks: Iterable[TaskSpec]) -> None:
+        """Register several tasks at once; nothing is added if any name clashes."""
+
+        batch: Dict[str, TaskSpec] = {}
+        for task in tasks:
+            if task.name in self._tasks or task.name in batch:
+                raise VortexError(f"Task {task.name} already registered")
+            batch[task.name] = task
+        for task in batch.values():
+            self._register(task)
 
     def plan(self) -> List[str]:
         sorter = TopologicalSorter({name: task.depends_on for name, task in self._tasks.items()})
@@ -55,62 +87,62 @@ class UnifiedAdvancedPlanner:
 
     async def execute(self) -> List[TaskResult]:
         order = self.plan()
-        pending_dependencies: Dict[str, Set[str]] = {
-            name: set(self._tasks[name].depends_on) for name in order
-        }
-        completed: Dict[str, TaskResult] = {}
-        in_progress: Set[str] = set()
+        missing = [name for name in order if name not in self._tasks]
+        if missing:
+            raise VortexError(f"Unknown task dependencies: {', '.join(missing)}")
+        indegree = dict(self._indegree)
         semaphore = asyncio.Semaphore(self.max_parallel_tasks)
-        results: List[TaskResult] = []
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        completed: Dict[str, TaskResult] = {}
+        cancelled = self._cancelled = asyncio.Event()
 
         async def run_task(name: str) -> None:
-            task = self._tasks[name]
-            async with semaphore:
-                with profile(f"task:{name}"):
-                    attempt = 0
-                    while attempt <= task.retries + self.recovery_retries:
-                        try:
-                            result = await task.action()
-                            res = TaskResult(name=name, success=True, result=result)
-                            completed[name] = res
-                            results.append(res)
-                            break
-                        except Exception as exc:
-                            attempt += 1
-                            if attempt > task.retries + self.recovery_retries:
-                                res = TaskResult(name=name, success=False, error=exc)
-                                completed[name] = res
-                                results.append(res)
-                                logger.exception(
-                                    "task failed", extra={"task": name, "error": str(exc)}
-                                )
-                                break
-                            await asyncio.sleep(0.1 * attempt)
-                            logger.warning(
-                                "retrying task", extra={"task": name, "attempt": attempt}
-                            )
-
-        async def scheduler() -> None:
-            queue: asyncio.Queue[str] = asyncio.Queue()
-            for name in order:
-                if not pending_dependencies[name]:
-                    await queue.put(name)
-            while len(results) < len(order):
-                name = await queue.get()
-                if name in in_progress:
-                    continue
-                in_progress.add(name)
-                asyncio.create_task(run_task(name))
-                for downstream, deps in pending_dependencies.items():
-                    deps.discard(name)
-                    if not deps and downstream not in in_progress:
-                        await queue.put(downstream)
-
-        await scheduler()
-        # Wait for all tasks to finish
-        while len(results) < len(order):
-            await asyncio.sleep(0.05)
-        return results
+            try:
+                async with semaphore:
+                    with profile(f"task:{name}"):
+                        completed[name] = await self._run_with_retries(self._tasks[name], cancelled)
+            finally:
+                for child in self._children.get(name, ()):
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        queue.put_nowait(child)
+
+        for name in order:
+            if indegree[name] == 0:
+                queue.put_nowait(name)
+        task_handles: List[asyncio.Task[None]] = []
+        # Every task is dispatched exactly once, when its last dependency finishes.
+        for _ in order:
+            name = await queue.get()
+            task_handles.append(asyncio.create_task(run_task(name)))
+        await asyncio.gather(*task_handles, return_exceptions=True)
+        # Report in plan order so callers see the same sequence on every run,
+        # whatever order the tasks happened to finish in.
+        return [completed[name] for name in order]
+
+    def cancel(self) -> None:
+        """Stop retrying failed tasks in the current :meth:`execute` run."""
+
+        if self._cancelled is not None:
+            self._cancelled.set()
+
+    async def _run_with_retries(self, task: TaskSpec, cancelled: asyncio.Event) -> TaskResult:
+        max_attempts = task.retries + self.recovery_retries + 1
+        attempt = 0
+        while True:
+            try:
+                return TaskResult(name=task.name, success=True, result=await task.action())
+            except Exception as exc:
+                attempt += 1
+                if attempt < max_attempts and not cancelled.is_set():
+                    # Exponential backoff with full jitter; cancel() cuts the wait short.
+                    delay = min(self.max_backoff, self.retry_backoff * 2 ** (attempt - 1))
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(cancelled.wait(), timeout=delay * random.random())
+                if attempt >= max_attempts or cancelled.is_set():
+                    logger.exception("task failed", extra={"task": task.name, "error": str(exc)})
+                    return TaskResult(name=task.name, success=False, error=exc)
+                logger.warning("retrying task", extra={"task": task.name, "attempt": attempt})
 
 
 __all__ = ["UnifiedAdvancedPlanner", "TaskSpec", "TaskResult"]
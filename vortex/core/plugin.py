@@ -3,21 +3,36 @@
 from __future__ import annotations
 
 import asyncio
-import importlib
-import inspect
+import importlib.util
+import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, Iterable, Optional, Type
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type
 
-from vortex.security.sandbox import Sandbox
+from vortex.security.sandbox import PLUGIN_NAMESPACE, Sandbox
 from vortex.utils.errors import PluginError
 from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _namespace_package(directory: Path) -> ModuleType:
+    # Plugins are imported as ``vortex_plugins.<stem>`` so a plugin file named
+    # after a real module (``csv.py``) never replaces it in ``sys.modules``. The
+    # parent package exists too, for relative imports between plugins in one
+    # directory and for pickling objects whose classes live in a plugin.
+    package = sys.modules.get(PLUGIN_NAMESPACE)
+    if package is None:
+        package = ModuleType(PLUGIN_NAMESPACE)
+        package.__path__ = []
+        sys.modules[PLUGIN_NAMESPACE] = package
+    if str(directory) not in package.__path__:
+        package.__path__.append(str(directory))
+    return package
+
+
 class BasePlugin:
     """Plugins extend the agent with domain-specific skills."""
 
@@ -46,43 +61,81 @@ class PluginState:
     module: ModuleType
     instance: BasePlugin
     sandbox: Sandbox
+    # Serialises runs of this plugin only; other plugins execute concurrently.
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 class UnifiedPluginSystem:
     """Locate, load, and execute plugins safely."""
 
-    def __init__(self, plugin_paths: Iterable[Path], *, sandbox: Optional[Sandbox] = None) -> None:
+    def __init__(
+        self,
+        plugin_paths: Iterable[Path],
+        *,
+        sandbox: Optional[Sandbox] = None,
+        pool_size: int = 4,
+    ) -> None:
         self.plugin_paths = list(plugin_paths)
         self._plugins: Dict[str, PluginState] = {}
         self._sandbox = sandbox or Sandbox()
+        # Warm sandboxes leased on load and returned (reset) on unload.
+        self._pool_size = pool_size
+        self._sandbox_pool: List[Sandbox] = [self._sandbox.clone() for _ in range(pool_size)]
         self._lock = asyncio.Lock()
+        self._discovery_cache: Dict[Path, Tuple[int, Dict[str, Path]]] = {}
+        self._plugin_class_cache: Dict[str, Type[BasePlugin]] = {}
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
 
     def discover(self) -> Dict[str, Path]:
         """Return a mapping of plugin name to module path."""
 
         discovered: Dict[str, Path] = {}
         for path in self.plugin_paths:
-            if not path.exists():
-                continue
-            for file in path.glob("*.py"):
-                name = file.stem
-                discovered[name] = file
+            discovered.update(self._scan(path))
         return discovered
 
+    def _scan(self, path: Path) -> Dict[str, Path]:
+        # Adding, removing or renaming a file bumps the directory mtime, so a
+        # single stat tells us whether the cached listing is still valid.
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._discovery_cache.pop(path, None)
+            return {}
+        cached = self._discovery_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(path) as entries:
+                found = {
+                    entry.name[:-3]: Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".py")
+                }
+        except NotADirectoryError:
+            found = {}
+        self._discovery_cache[path] = (mtime, found)
+        return found
+
     async def load(self, name: str) -> BasePlugin:
         """Load a plugin by name."""
 
         async with self._lock:
-            discovered = self.discover()
-            if name not in discovered:
-                raise PluginError(f"Plugin {name} not found")
-            module = self._import(discovered[name])
-            plugin_cls = self._resolve_plugin(module)
-            instance = plugin_cls()
-            sandbox = self._sandbox.clone()
-            await instance.setup()
-            self._plugins[name] = PluginState(module=module, instance=instance, sandbox=sandbox)
-            return instance
+            state = await self._load_locked(name)
+        return state.instance
+
+    async def _load_locked(self, name: str) -> PluginState:
+        discovered = self.discover()
+        if name not in discovered:
+            raise PluginError(f"Plugin {name} not found")
+        module = self._import(discovered[name])
+        plugin_cls = self._resolve_plugin(module)
+        instance = plugin_cls()
+        sandbox = self._sandbox_pool.pop() if self._sandbox_pool else self._sandbox.clone()
+        await instance.setup()
+        state = PluginState(module=module, instance=instance, sandbox=sandbox)
+        self._plugins[name] = state
+        return state
 
     async def unload(self, name: str) -> None:
         async with self._lock:
@@ -91,31 +144,81 @@ class UnifiedPluginSystem:
                 return
             await state.instance.teardown()
             self._unimport(state.module)
+            if len(self._sandbox_pool) < self._pool_size:
+                state.sandbox.reset()
+                self._sandbox_pool.append(state.sandbox)
 
     async def execute(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a plugin, sharing the result between identical in-flight calls.
+
+        Calls whose name and (hashable) arguments match a run that is still in
+        progress await that run instead of starting another sandbox round trip.
+        """
+
+        try:
+            key: Optional[Hashable] = (name, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            return await self._execute(name, args, kwargs)
+        run = self._inflight.get(key)
+        if run is None:
+            run = asyncio.ensure_future(self._execute(name, args, kwargs))
+            self._inflight[key] = run
+            run.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the shared run.
+        return await asyncio.shield(run)
+
+    async def _execute(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        # The registry lock only covers the lookup (and a first load); the run
+        # itself holds just this plugin's lock.
         async with self._lock:
             state = self._plugins.get(name)
             if not state:
-                await self.load(name)
-                state = self._plugins[name]
+                state = await self._load_locked(name)
+        async with state.lock:
             return await state.sandbox.run(state.instance.execute, *args, **kwargs)
 
     def _import(self, path: Path) -> ModuleType:
-        sys.path.insert(0, str(path.parent))
-        module_name = path.stem
+        module_name = f"{PLUGIN_NAMESPACE}.{path.stem}"
+        module = sys.modules.get(module_name)
+        if module is not None and getattr(module, "__file__", None) == str(path):
+            return module
+        # Load straight from the file: no sys.path mutation and no finder scan,
+        # and a same-named module from another directory is never picked up.
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise PluginError(f"Failed to import plugin {path.stem}: no loader for {path}")
+        package = _namespace_package(path.parent)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
         try:
-            return importlib.import_module(module_name)
+            spec.loader.exec_module(module)
         except Exception as exc:  # pragma: no cover - import errors rare in tests
-            raise PluginError(f"Failed to import plugin {module_name}: {exc}") from exc
-        finally:
-            sys.path.pop(0)
+            sys.modules.pop(module_name, None)
+            raise PluginError(f"Failed to import plugin {path.stem}: {exc}") from exc
+        setattr(package, path.stem, module)
+        return module
 
     def _unimport(self, module: ModuleType) -> None:
         sys.modules.pop(module.__name__, None)
+        package = sys.modules.get(PLUGIN_NAMESPACE)
+        stem = module.__name__.rpartition(".")[2]
+        if package is not None and getattr(package, stem, None) is module:
+            delattr(package, stem)
+        self._plugin_class_cache.pop(module.__name__, None)
 
     def _resolve_plugin(self, module: ModuleType) -> Type[BasePlugin]:
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, BasePlugin) and obj is not BasePlugin:
+        cached = self._plugin_class_cache.get(module.__name__)
+        # Still bound in the module, i.e. not replaced by a reload since.
+        if cached is not None and module.__dict__.get(cached.__name__) == cached:
+            return cached
+        # A plain namespace scan: only top-level definitions, no sorted copy and
+        # no attribute hooks triggered the way ``inspect.getmembers`` does.
+        for obj in module.__dict__.values():
+            if isinstance(obj, type) and issubclass(obj, BasePlugin) and obj is not BasePlugin:
+                self._plugin_class_cache[module.__name__] = obj
                 return obj
         raise PluginError("No plugin class found")
 
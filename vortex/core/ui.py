@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import contextlib
-from typing import Iterable, List, Optional
+from typing import Any, Iterable, List, Optional, Sequence
 
+import orjson
 from rich.console import Console
+from rich.highlighter import JSONHighlighter
 from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 from rich.text import Text
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 class UnifiedRichUI:
     """Wrap the Rich console to provide consistent UX."""
@@ -19,6 +23,7 @@ class UnifiedRichUI:
         self.console = Console()
         self.theme = theme
         self.enable_progress = enable_progress
+        self._json_highlighter = JSONHighlighter()
 
     def print_header(self, title: str) -> None:
         self.console.rule(Text(title, style="bold cyan"))
@@ -32,6 +37,17 @@ class UnifiedRichUI:
     def error(self, message: str) -> None:
         self.console.print(Text(message, style="bold red"))
 
+    def print_json(self, payload: Any) -> None:
+        """Print ``payload`` as highlighted JSON.
+
+        Serialising with orjson up front avoids Rich's recursive pretty-printer
+        on large dictionaries. Values orjson cannot encode natively, such as
+        paths, fall back to ``str``.
+        """
+
+        rendered = orjson.dumps(payload, default=str, option=_JSON_OPTIONS).decode()
+        self.console.print(self._json_highlighter(Text(rendered)), soft_wrap=True)
+
     @contextlib.contextmanager
     def spinner(self, message: str) -> Iterable[None]:
         if not self.enable_progress:
@@ -44,7 +60,9 @@ class UnifiedRichUI:
             yield
             progress.update(task, completed=1)
 
-    def table(self, title: str, columns: List[str], rows: List[List[str]]) -> Table:
+    def table(self, title: str, columns: List[str], rows: Iterable[Sequence[str]]) -> Table:
+        """Build a table, consuming ``rows`` lazily so callers can pass generators."""
+
         table = Table(title=title)
         for column in columns:
             table.add_column(column)
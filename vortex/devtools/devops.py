@@ -3,31 +3,236 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import errno
+import os
+import shlex
+import shutil
+import uuid
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Worker pipes buffer a whole command's output before the end marker is found.
+_WORKER_STREAM_LIMIT = 256 * 1024 * 1024
+
 
 class DevOpsHelper:
-    """Execute shell commands used in deployment workflows."""
+    """Execute shell commands used in deployment workflows.
+
+    On POSIX systems commands are sent to a small pool of long-lived ``/bin/sh``
+    workers instead of spawning a fresh process tree per call. Each command
+    runs in a subshell with stdin detached, so ``cd``/``export``/``exit`` in one
+    command cannot leak into the next, and its output is framed by a per-helper
+    random marker. Workers are replaced when ``os.environ`` changes and are
+    shut down with the event loop that started them, or by :meth:`close`.
+    """
 
-    def __init__(self, *, workdir: Path | None = None) -> None:
+    def __init__(self, *, workdir: Path | None = None, pool_size: int = 2) -> None:
         self._workdir = workdir or Path.cwd()
+        self._pool_size = pool_size
+        self._marker = f"__vortex_{uuid.uuid4().hex}__".encode()
+        self._idle: Optional[asyncio.Queue[Optional[asyncio.subprocess.Process]]] = None
+        self._workers: List[asyncio.subprocess.Process] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The environment the current workers were started with.
+        self._environ: Dict[str, str] = {}
+        self._guard: Optional[asyncio.Task[None]] = None
+
+    async def run_command(
+        self,
+        *args: str,
+        capture_output: bool = True,
+        on_line: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, str]:
+        """Run ``args`` and return its output and exit status as strings.
+
+        With ``capture_output=False`` the command's output is discarded at the
+        file-descriptor level and only the return code is reported. Passing
+        ``on_line`` streams stdout to the callback line by line instead of
+        buffering it; ``stdout`` is then empty in the result.
+        """
+
+        if on_line is not None:
+            stdout, stderr, returncode = await self._stream(args, on_line, capture_output)
+        elif os.name != "posix" or self._pool_size <= 0:
+            stdout, stderr, returncode = await self._spawn(args, capture_output)
+        else:
+            stdout, stderr, returncode = await self._run_in_worker(args, capture_output)
+        logger.debug("devops command", extra={"args": args, "returncode": returncode})
+        return {
+            "stdout": stdout.decode("utf-8", "replace") if stdout else "",
+            "stderr": stderr.decode("utf-8", "replace") if stderr else "",
+            "returncode": str(returncode),
+        }
 
-    async def run_command(self, *args: str) -> Dict[str, str]:
+    async def close(self) -> None:
+        """Terminate the shell workers."""
+
+        workers, self._workers, self._idle = self._workers, [], None
+        guard, self._guard = self._guard, None
+        if guard is not None and guard is not asyncio.current_task():
+            guard.cancel()
+        if self._loop is not asyncio.get_running_loop():
+            # Their pipes belong to another loop and cannot be awaited here.
+            for worker in workers:
+                _kill(worker)
+            return
+        for worker in workers:
+            if worker.returncode is None:
+                assert worker.stdin is not None
+                worker.stdin.close()
+        await asyncio.gather(*(worker.wait() for worker in workers))
+
+    async def _spawn(
+        self, args: Tuple[str, ...], capture_output: bool = True
+    ) -> Tuple[bytes, bytes, Optional[int]]:
+        output = asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL
+        process = await asyncio.create_subprocess_exec(
+            *args, cwd=str(self._workdir), stdout=output, stderr=output
+        )
+        stdout, stderr = await process.communicate()
+        return stdout or b"", stderr or b"", process.returncode
+
+    async def _stream(
+        self, args: Tuple[str, ...], on_line: Callable[[str], None], capture_stderr: bool
+    ) -> Tuple[bytes, bytes, Optional[int]]:
         process = await asyncio.create_subprocess_exec(
             *args,
             cwd=str(self._workdir),
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
         )
-        stdout, stderr = await process.communicate()
-        logger.debug("devops command", extra={"args": args, "returncode": process.returncode})
-        return {
-            "stdout": stdout.decode(),
-            "stderr": stderr.decode(),
-            "returncode": str(process.returncode),
-        }
+        assert process.stdout is not None
+        # Drain stderr concurrently so a chatty command cannot block on a full pipe.
+        stderr = None
+        if capture_stderr:
+            assert process.stderr is not None
+            stderr = asyncio.ensure_future(process.stderr.read())
+        try:
+            async for line in process.stdout:
+                on_line(line.decode("utf-8", "replace").rstrip("\r\n"))
+        except BaseException:
+            if stderr is not None:
+                stderr.cancel()
+            if process.returncode is None:
+                process.kill()
+            raise
+        await process.wait()
+        return b"", await stderr if stderr is not None else b"", process.returncode
+
+    async def _run_in_worker(
+        self, args: Tuple[str, ...], capture_output: bool = True
+    ) -> Tuple[bytes, bytes, int]:
+        _check_executable(args[0], self._workdir)
+        worker = await self._acquire()
+        assert worker.stdin is not None
+        assert worker.stdout is not None
+        assert worker.stderr is not None
+        marker = self._marker
+        redirect = "" if capture_output else " >/dev/null 2>&1"
+        script = (
+            # ``exec`` resolves the program from PATH as a direct spawn does;
+            # without it sh would run its own echo/printf/test builtins.
+            f"( exec {shlex.join(args)} ) </dev/null{redirect}; "
+            f"printf '\\n%s %d\\n' {marker.decode()} $?; "
+            f"printf '\\n%s\\n' {marker.decode()} >&2\n"
+        )
+        try:
+            worker.stdin.write(script.encode())
+            await worker.stdin.drain()
+            stdout, stderr = await asyncio.gather(
+                worker.stdout.readuntil(b"\n" + marker + b" "),
+                worker.stderr.readuntil(b"\n" + marker + b"\n"),
+            )
+            status = await worker.stdout.readline()
+        except BaseException:
+            # The worker's stream position is unknown now; never reuse it.
+            self._discard(worker)
+            raise
+        self._release(worker)
+        return stdout[: -len(marker) - 2], stderr[: -len(marker) - 2], int(status)
+
+    async def _acquire(self) -> asyncio.subprocess.Process:
+        loop = asyncio.get_running_loop()
+        if self._idle is None or self._loop is not loop or os.environ != self._environ:
+            self._start_pool(loop)
+        assert self._idle is not None
+        while True:
+            if self._idle.empty() and len(self._workers) < self._pool_size:
+                worker = await asyncio.create_subprocess_exec(
+                    "/bin/sh",
+                    cwd=str(self._workdir),
+                    env=self._environ,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_WORKER_STREAM_LIMIT,
+                )
+                self._workers.append(worker)
+                return worker
+            candidate = await self._idle.get()
+            # ``None`` is a wake-up left by _discard: a pool slot became free.
+            if candidate is not None and candidate.returncode is None:
+                return candidate
+            if candidate is not None:
+                self._discard(candidate)
+
+    def _start_pool(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Pipes belong to the loop that created them and a worker keeps the
+        # environment it started with, so a change in either retires the pool.
+        stale, self._workers = self._workers, []
+        for worker in stale:
+            _kill(worker)
+        if self._guard is not None and self._loop is loop:
+            self._guard.cancel()
+        self._idle, self._loop = asyncio.Queue(), loop
+        self._environ = dict(os.environ)
+        self._guard = loop.create_task(self._close_with_loop())
+
+    async def _close_with_loop(self) -> None:
+        # Parked for the life of the loop: asyncio.run() cancels it on the way
+        # out, the last point at which the workers' pipes can be closed cleanly.
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.create_future()
+        finally:
+            if self._guard is asyncio.current_task() and self._loop is loop:
+                await self.close()
+
+    def _release(self, worker: asyncio.subprocess.Process) -> None:
+        if self._idle is not None and worker in self._workers:
+            self._idle.put_nowait(worker)
+        else:
+            # Retired while it was busy.
+            _kill(worker)
+
+    def _discard(self, worker: asyncio.subprocess.Process) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+            if self._idle is not None:
+                self._idle.put_nowait(None)
+        _kill(worker)
+
+
+def _kill(worker: asyncio.subprocess.Process) -> None:
+    if worker.returncode is None:
+        # Its loop may already be closed; the process is gone either way.
+        with contextlib.suppress(ProcessLookupError, RuntimeError):
+            worker.kill()
+
+
+def _check_executable(program: str, workdir: Path) -> None:
+    # The shell would report a missing program as exit status 127; raise what
+    # spawning it directly raises instead.
+    if os.sep in program:
+        path = workdir / program
+        if not path.exists():
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
+        if path.is_dir() or not os.access(path, os.X_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), program)
+    elif shutil.which(program) is None:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
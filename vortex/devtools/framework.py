@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import fnmatch
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Pattern
 
 import pytest
 
@@ -13,6 +17,11 @@ from vortex.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _compile(pattern: str) -> Pattern[str]:
+    return re.compile(fnmatch.translate(pattern))
+
+
 class TestFramework:
     """Programmatic interface over pytest for automated diagnostics."""
 
@@ -30,4 +39,30 @@ class TestFramework:
         return await asyncio.to_thread(_run_pytest)
 
     def discover(self, pattern: str = "test_*.py") -> Iterable[Path]:
-        return self._root.glob(pattern)
+        """Yield paths under the root matching the glob ``pattern``.
+
+        Plain name patterns (``test_*.py``) and recursive ones (``**/test_*.py``)
+        are matched against ``os.scandir`` entries with a precompiled regex, so
+        no ``Path`` is built for entries that do not match. Other patterns fall
+        back to :meth:`Path.glob`.
+        """
+
+        recursive = pattern.startswith("**/")
+        name_pattern = pattern[3:] if recursive else pattern
+        if "/" in name_pattern or "**" in name_pattern:
+            return self._root.glob(pattern)
+        return self._scan(str(self._root), _compile(name_pattern), recursive)
+
+    def _scan(self, directory: str, regex: Pattern[str], recursive: bool) -> Iterator[Path]:
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    if regex.match(entry.name):
+                        yield Path(entry.path)
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for subdir in subdirs:
+            yield from self._scan(subdir, regex, recursive)
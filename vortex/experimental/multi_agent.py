@@ -23,9 +23,10 @@ class Agent:
 class MultiAgentCoordinator:
     """Coordinate concurrent agent interactions."""
 
-    def __init__(self, model_manager: UnifiedModelManager) -> None:
+    def __init__(self, model_manager: UnifiedModelManager, *, max_concurrent: int = 8) -> None:
         self._model_manager = model_manager
         self._agents: Dict[str, Agent] = {}
+        self._max_concurrent = max_concurrent
 
     def register(self, name: str, callback: AgentCallback) -> None:
         if name in self._agents:
@@ -33,11 +34,29 @@ class MultiAgentCoordinator:
         self._agents[name] = Agent(name=name, callback=callback)
 
     async def broadcast(self, message: str) -> Dict[str, str]:
-        async def _send(agent: Agent) -> str:
-            prompt = f"Agent {agent.name}, respond to: {message}"
-            await self._model_manager.generate(prompt)  # prime usage metrics
-            return await agent.callback(message)
+        """Send ``message`` to every agent, at most ``max_concurrent`` at a time.
+
+        If any agent fails (or the broadcast itself is cancelled) the remaining
+        agents are cancelled rather than left running in the background.
+        """
 
-        tasks = [_send(agent) for agent in self._agents.values()]
-        results = await asyncio.gather(*tasks)
-        return {agent.name: result for agent, result in zip(self._agents.values(), results)}
+        semaphore = asyncio.Semaphore(self._max_concurrent)
+        agents = list(self._agents.values())
+
+        async def _send(agent: Agent) -> str:
+            async with semaphore:
+                prompt = f"Agent {agent.name}, respond to: {message}"
+                await self._model_manager.generate(prompt)  # prime usage metrics
+                return await agent.callback(message)
+
+        # asyncio.TaskGroup needs 3.11; cancelling the peers by hand gives the
+        # same behaviour on every supported version.
+        tasks = [asyncio.ensure_future(_send(agent)) for agent in agents]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return {agent.name: result for agent, result in zip(agents, results)}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import statistics
+from collections import Counter
 from typing import Iterable, List
 
 from vortex.ai.nlp import NLPEngine
@@ -17,14 +19,15 @@ class Predictor:
         self._nlp = nlp
 
     def predict_sentiment_trend(self, documents: Iterable[str]) -> float:
-        scores = [self._nlp.sentiment(doc) for doc in documents]
-        trend = sum(scores) / max(len(scores), 1)
+        scores = self._nlp.sentiment_batch(documents)
+        trend = statistics.fmean(scores) if scores else 0.0
         logger.debug("sentiment trend", extra={"trend": trend})
         return trend
 
     def top_keywords(self, documents: Iterable[str], *, limit: int = 5) -> List[str]:
-        keywords: List[str] = []
-        for doc in documents:
-            keywords.extend(self._nlp.keyword_summary(doc, top_k=limit))
-        unique = list(dict.fromkeys(keywords))
-        return unique[:limit]
+        """Keywords ranked by how many documents list them; ties keep first-seen order."""
+
+        counts: Counter[str] = Counter()
+        for summary in self._nlp.keyword_summary_batch(documents, top_k=limit):
+            counts.update(summary)
+        return [word for word, _ in counts.most_common(limit)]
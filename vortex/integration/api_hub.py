@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict, Mapping, MutableMapping, Optional, Tuple
 
 import httpx
+import orjson
 
 from vortex.security.manager import UnifiedSecurityManager
-from vortex.utils.async_cache import AsyncTTLCache
+from vortex.utils.async_cache import AsyncTTLCache, request_digest
 from vortex.utils.errors import IntegrationError
 from vortex.utils.logging import get_logger
 
@@ -42,6 +45,7 @@ class APIHub:
         cache_ttl: float = 30.0,
         cache_size: int = 128,
         client: Optional[httpx.AsyncClient] = None,
+        token_ttl: float = 1.0,
     ) -> None:
         self._security = security
         self._clients: MutableMapping[str, APIClientConfig] = {}
@@ -49,7 +53,13 @@ class APIHub:
         self._cache = AsyncTTLCache(maxsize=cache_size, ttl=cache_ttl)
         self._shared_client = client
         self._sessions: Dict[str, httpx.AsyncClient] = {}
-        self._lock = asyncio.Lock()
+        # One lock per API name: registering or connecting one API never
+        # waits on another's secret storage or client setup.
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Request headers with the bearer token merged in, kept briefly so a
+        # burst of calls decrypts the secret once rather than per request.
+        self._token_ttl = token_ttl
+        self._auth_headers: Dict[str, Tuple[float, Mapping[str, str]]] = {}
 
     async def register_api(
         self,
@@ -65,21 +75,21 @@ class APIHub:
         encryption at rest. Registration is idempotent and thread-safe.
         """
 
-        async with self._lock:
+        async with self._locks.setdefault(name, asyncio.Lock()):
             logger.debug("registering api", extra={"name": name, "base_url": base_url})
             if secret is not None:
                 await self._security.store_secret(f"api:{name}", secret)
             config = APIClientConfig(
                 base_url=base_url,
-                default_headers=headers or {},
+                default_headers=MappingProxyType(dict(headers or {})),
                 secret_name=f"api:{name}" if secret else None,
             )
             self._clients[name] = config
+            self._auth_headers.pop(name, None)
             await self._cache.invalidate(("client", name))
 
     async def list_apis(self) -> list[str]:
-        async with self._lock:
-            return list(self._clients)
+        return list(self._clients)
 
     async def _get_client(self, name: str) -> Tuple[APIClientConfig, httpx.AsyncClient]:
         config = self._clients.get(name)
@@ -89,13 +99,34 @@ class APIHub:
         if self._shared_client is not None:
             return config, self._shared_client
 
-        async with self._lock:
+        # Sessions are only ever added, so a hit needs no lock; the lock just
+        # stops two first calls from both creating a client.
+        session = self._sessions.get(name)
+        if session is not None:
+            return config, session
+        async with self._locks.setdefault(name, asyncio.Lock()):
             session = self._sessions.get(name)
             if session is None:
                 session = httpx.AsyncClient(base_url=config.base_url, timeout=self._timeout)
                 self._sessions[name] = session
             return config, session
 
+    async def _request_headers(self, name: str, config: APIClientConfig) -> Mapping[str, str]:
+        headers = config.default_headers
+        if not config.secret_name or "Authorization" in headers:
+            return headers
+        now = time.monotonic()
+        cached = self._auth_headers.get(name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        token = await self._security.retrieve_secret(config.secret_name)
+        merged = MappingProxyType({**headers, "Authorization": f"Bearer {token}"})
+        # Only cache against the config the token was read for; a concurrent
+        # re-registration must not be shadowed by the old secret.
+        if self._clients.get(name) is config:
+            self._auth_headers[name] = (now + self._token_ttl, merged)
+        return merged
+
     async def call(
         self,
         name: str,
@@ -120,16 +151,14 @@ class APIHub:
                     "use_cache": use_cache,
                 },
             )
-            headers = dict(config.default_headers)
-            if config.secret_name:
-                token = await self._security.retrieve_secret(config.secret_name)
-                headers.setdefault("Authorization", f"Bearer {token}")
+            headers = await self._request_headers(name, config)
             response = await client.request(
                 method, endpoint, params=params, json=json, headers=headers
             )
             response.raise_for_status()
             try:
-                return response.json()
+                # orjson parses the raw bytes, skipping httpx's text decode.
+                return orjson.loads(response.content)
             except ValueError:  # pragma: no cover - defensive if API returns non JSON
                 return response.text
 
@@ -140,15 +169,16 @@ class APIHub:
             name,
             endpoint,
             method,
-            frozenset(params.items()) if params else None,
-            frozenset(json.items()) if json else None,
+            request_digest(params or None, json or None),
         )
         return await self._cache.get_or_set(cache_key, _perform_request)
 
     async def close(self) -> None:
         """Close any underlying HTTP clients to free sockets."""
 
-        async with self._lock:
-            for session in self._sessions.values():  # pragma: no cover - trivial cleanup
-                await session.aclose()
-            self._sessions.clear()
+        # Detached before closing, so a client created meanwhile is kept
+        # rather than closed mid-iteration.
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:  # pragma: no cover - trivial cleanup
+            await session.aclose()
@@ -7,9 +7,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Optional
 
 import httpx
+import orjson
 
 from vortex.security.manager import UnifiedSecurityManager
-from vortex.utils.async_cache import AsyncTTLCache
+from vortex.utils.async_cache import AsyncTTLCache, request_digest
 from vortex.utils.errors import IntegrationError
 from vortex.utils.logging import get_logger
 
@@ -29,31 +30,60 @@ class CloudAccount:
 class CloudIntegration:
     """Interact with cloud control planes via signed requests."""
 
-    def __init__(self, security: UnifiedSecurityManager, *, ttl: float = 60.0) -> None:
+    def __init__(
+        self,
+        security: UnifiedSecurityManager,
+        *,
+        ttl: float = 60.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self._security = security
         self._accounts: Dict[str, CloudAccount] = {}
         self._cache = AsyncTTLCache(ttl=ttl)
-        self._lock = asyncio.Lock()
+        # Per-account locks, so one account's credential write or client
+        # setup does not hold up requests to the others.
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._shared_client = client
+        self._sessions: Dict[str, httpx.AsyncClient] = {}
 
     async def add_account(
         self, name: str, base_url: str, credential: str, *, region: Optional[str] = None
     ) -> None:
         """Register a new cloud account and persist its credential securely."""
 
-        async with self._lock:
+        async with self._locks.setdefault(name, asyncio.Lock()):
             secret_name = f"cloud:{name}"
             await self._security.store_secret(secret_name, credential)
             self._accounts[name] = CloudAccount(
                 name=name, base_url=base_url, credential_key=secret_name, region=region
             )
+            # A client built for the previous registration still points at its
+            # base URL; drop it so the next request connects to the new one.
+            stale = self._sessions.pop(name, None)
+        if stale is not None:
+            await stale.aclose()
 
     async def list_accounts(self) -> list[str]:
-        async with self._lock:
-            return list(self._accounts)
+        return list(self._accounts)
 
     async def _client(self, account: CloudAccount) -> httpx.AsyncClient:
         return httpx.AsyncClient(base_url=account.base_url, timeout=15.0)
 
+    async def _get_session(self, account: CloudAccount) -> httpx.AsyncClient:
+        """Return the pooled client for ``account``, creating it on first use."""
+
+        if self._shared_client is not None:
+            return self._shared_client
+        session = self._sessions.get(account.name)
+        if session is not None:
+            return session
+        async with self._locks.setdefault(account.name, asyncio.Lock()):
+            session = self._sessions.get(account.name)
+            if session is None:
+                session = await self._client(account)
+                self._sessions[account.name] = session
+            return session
+
     async def request(
         self,
         account_name: str,
@@ -73,12 +103,12 @@ class CloudIntegration:
         async def _perform() -> Any:
             token = await self._security.retrieve_secret(account.credential_key)
             headers = {"Authorization": f"Bearer {token}"}
-            async with await self._client(account) as client:
-                response = await client.request(
-                    method, path, params=params, json=payload, headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
+            client = await self._get_session(account)
+            response = await client.request(
+                method, path, params=params, json=payload, headers=headers
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         if not cache:
             return await _perform()
@@ -87,7 +117,14 @@ class CloudIntegration:
             account_name,
             method,
             path,
-            frozenset(params.items()) if params else None,
-            frozenset(payload.items()) if payload else None,
+            request_digest(params or None, payload or None),
         )
         return await self._cache.get_or_set(cache_key, _perform)
+
+    async def close(self) -> None:
+        """Close the per-account HTTP clients to free sockets."""
+
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.aclose()
@@ -5,8 +5,19 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterable, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 import aiosqlite
 
@@ -18,14 +29,36 @@ from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# sqlite3 keeps compiled statements per connection; the default of 128 is easy
+# to exhaust with generated SQL, after which every call re-prepares.
+_STATEMENT_CACHE_SIZE = 512
+
 
 @dataclass
 class QueryResult:
-    """Structure describing a database query outcome."""
+    """Structure describing a database query outcome.
+
+    Results are kept column-oriented: the column names once and the raw row
+    tuples from sqlite, so no per-row dict is built unless a caller asks.
+    """
 
-    rows: list[Dict[str, Any]]
+    columns: List[str]
+    values: List[Sequence[Any]]
     rowcount: int
 
+    def as_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield each row as a ``{column: value}`` dict."""
+
+        columns = self.columns
+        for row in self.values:
+            yield dict(zip(columns, row))
+
+    @cached_property
+    def rows(self) -> List[Dict[str, Any]]:
+        """All rows as dicts, built on first access."""
+
+        return list(self.as_rows())
+
 
 class DatabaseManager:
     """Provide encrypted async access to SQLite databases."""
@@ -36,6 +69,7 @@ class DatabaseManager:
         security: UnifiedSecurityManager,
         *,
         cache_ttl: float = 5.0,
+        read_pool_size: int = 2,
     ) -> None:
         if database_url.startswith("sqlite:///"):
             path = Path(database_url.split("sqlite:///")[-1])
@@ -50,15 +84,52 @@ class DatabaseManager:
         self._encryptor = DataEncryptor(security.credential_store)
         self._pool_lock = asyncio.Lock()
         self._pool: Optional[aiosqlite.Connection] = None
+        # Private in-memory databases are per connection, so they cannot be
+        # shared with a pool of readers.
+        in_memory = self._connect_target == ":memory:" or "mode=memory" in self._connect_target
+        self._read_pool_size = 0 if in_memory else read_pool_size
+        self._readers: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+        self._reader_connections: List[aiosqlite.Connection] = []
+
+    async def _open(self, *, read_only: bool = False) -> aiosqlite.Connection:
+        logger.debug(
+            "opening database", extra={"url": self._connect_target, "read_only": read_only}
+        )
+        conn = await aiosqlite.connect(
+            self._connect_target, uri=self._use_uri, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        if read_only:
+            await conn.execute("PRAGMA query_only=ON")
+        return conn
 
     async def _connect(self) -> aiosqlite.Connection:
         async with self._pool_lock:
             if self._pool is None:
-                logger.debug("opening database", extra={"url": self._connect_target})
-                self._pool = await aiosqlite.connect(self._connect_target, uri=self._use_uri)
-                self._pool.row_factory = aiosqlite.Row
+                self._pool = await self._open()
             return self._pool
 
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Lease a read-only connection so reads do not queue behind writes."""
+
+        if not self._read_pool_size:
+            async with self.connection() as conn:
+                yield conn
+            return
+        async with self._pool_lock:
+            if self._readers is None:
+                readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+                for _ in range(self._read_pool_size):
+                    conn = await self._open(read_only=True)
+                    self._reader_connections.append(conn)
+                    readers.put_nowait(conn)
+                self._readers = readers
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
     @asynccontextmanager
     async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
         conn = await self._connect()
@@ -73,8 +144,13 @@ class DatabaseManager:
         async with self.connection() as conn:
             cursor = await conn.execute(sql, tuple(parameters or ()))
             await conn.commit()
-            rows = [dict(row) for row in await cursor.fetchall()] if cursor.description else []
-            return QueryResult(rows=rows, rowcount=cursor.rowcount)
+            if not cursor.description:
+                return QueryResult(columns=[], values=[], rowcount=cursor.rowcount)
+            return QueryResult(
+                columns=_column_names(cursor.description),
+                values=list(await cursor.fetchall()),
+                rowcount=cursor.rowcount,
+            )
 
     async def fetch(
         self, sql: str, parameters: Iterable[Any] | None = None, *, use_cache: bool = False
@@ -82,10 +158,12 @@ class DatabaseManager:
         """Execute a read-only query with optional caching."""
 
         async def _run_query() -> QueryResult:
-            async with self.connection() as conn:
+            async with self._reader() as conn:
                 cursor = await conn.execute(sql, tuple(parameters or ()))
-                rows = [dict(row) for row in await cursor.fetchall()]
-                return QueryResult(rows=rows, rowcount=len(rows))
+                values: List[Sequence[Any]] = list(await cursor.fetchall())
+                return QueryResult(
+                    columns=_column_names(cursor.description), values=values, rowcount=len(values)
+                )
 
         if not use_cache:
             return await _run_query()
@@ -105,6 +183,37 @@ class DatabaseManager:
         sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
         await self.execute(sql, encrypted_values)
 
+    async def store_secret_records(self, table: str, payloads: Sequence[Mapping[str, Any]]) -> int:
+        """Encrypt and insert many payloads in a single transaction.
+
+        Every payload must have the same columns. Values are encrypted off the
+        event loop and the rows are written with one ``executemany`` call and a
+        single commit. Returns the number of rows inserted.
+        """
+
+        if not payloads:
+            return 0
+        columns = list(payloads[0])
+        if not columns:
+            raise IntegrationError("payload may not be empty")
+        expected = set(columns)
+        if any(payload.keys() != expected for payload in payloads):
+            raise IntegrationError("all payloads must share the same columns")
+
+        encrypt = self._encryptor.encrypt_value
+
+        def _encrypt_rows() -> List[tuple]:
+            return [
+                tuple(encrypt(str(payload[column])) for column in columns) for payload in payloads
+            ]
+
+        rows = await asyncio.to_thread(_encrypt_rows)
+        placeholders = ", ".join(["?"] * len(columns))
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        async with self.connection() as conn:
+            await conn.executemany(sql, rows)
+        return len(rows)
+
     async def close(self) -> None:
         """Close the underlying connection to free resources."""
 
@@ -112,3 +221,11 @@ class DatabaseManager:
             if self._pool is not None:
                 await self._pool.close()
                 self._pool = None
+            for conn in self._reader_connections:
+                await conn.close()
+            self._reader_connections.clear()
+            self._readers = None
+
+
+def _column_names(description: Sequence[Sequence[Any]]) -> List[str]:
+    return [column[0] for column in description]
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from vortex.security.manager import UnifiedSecurityManager
 from vortex.utils.errors import IntegrationError
@@ -30,28 +31,55 @@ class GitCommandResult:
 class GitManager:
     """Execute git commands with permission checks and safe environments."""
 
-    def __init__(self, security: UnifiedSecurityManager, *, workdir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        security: UnifiedSecurityManager,
+        *,
+        workdir: Optional[Path] = None,
+        max_concurrent: int = 4,
+    ) -> None:
         self._security = security
         self._workdir = workdir or Path.cwd()
+        self._cwd = str(self._workdir)
+        self._max_concurrent = max_concurrent
+        # Built once: git never blocks on a credential prompt and its messages
+        # are not localised.
+        self._env: Dict[str, str] = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "LC_ALL": "C"}
 
     async def _run(self, args: Iterable[str]) -> GitCommandResult:
+        argv = ("git", *args)
         await self._security.ensure_permission("cli", "git:run")
         process = await asyncio.create_subprocess_exec(
-            "git",
-            *args,
-            cwd=str(self._workdir),
+            *argv,
+            cwd=self._cwd,
+            env=self._env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, stderr = await process.communicate()
         result = GitCommandResult(
-            returncode=process.returncode, stdout=stdout.decode(), stderr=stderr.decode()
+            returncode=process.returncode,
+            stdout=stdout.decode("utf-8", "replace") if stdout else "",
+            stderr=stderr.decode("utf-8", "replace") if stderr else "",
         )
         if not result.success:
-            logger.error("git command failed", extra={"args": list(args), "stderr": result.stderr})
+            logger.error(
+                "git command failed", extra={"git_args": argv[1:], "stderr": result.stderr}
+            )
             raise IntegrationError(result.stderr)
         return result
 
+    async def _run_many(self, commands: Sequence[Iterable[str]]) -> List[GitCommandResult]:
+        """Run independent (read-only) git commands concurrently, in order."""
+
+        semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        async def _bounded(args: Iterable[str]) -> GitCommandResult:
+            async with semaphore:
+                return await self._run(args)
+
+        return list(await asyncio.gather(*(_bounded(args) for args in commands)))
+
     async def clone(
         self, repo: str, *, destination: Optional[Path] = None, depth: Optional[int] = None
     ) -> GitCommandResult:
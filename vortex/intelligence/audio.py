@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import struct
 import wave
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Optional
 
 from vortex.core.model import UnifiedModelManager
 
@@ -17,13 +19,89 @@ class AudioAnalysis:
     sample_rate: int
 
 
+_RIFF = struct.Struct("<4sI4s")
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT_PCM = struct.Struct("<HHIIHH")
+# WAVE_FORMAT_PCM and WAVE_FORMAT_EXTENSIBLE, the formats ``wave`` accepts.
+_PCM_TAGS = frozenset({0x0001, 0xFFFE})
+# Canonical files have ``fmt `` and ``data`` within the first 44 bytes; one
+# read this size normally covers every header we need.
+_HEADER_READ = 512
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover - Windows has no pread
+    return os.read(fd, size)  # pragma: no cover
+
+
+def _read_wav_header(path: Path) -> Optional[AudioAnalysis]:
+    """Read duration and format from the RIFF chunk headers alone.
+
+    Only the RIFF header and the chunk headers up to ``data`` are read, with
+    positioned reads on a raw descriptor, whatever the length of the audio.
+    Returns ``None`` for anything unusual so the caller can fall back to
+    :mod:`wave`.
+    """
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        buf = _pread(fd, _HEADER_READ, 0)
+        if len(buf) < _RIFF.size:
+            return None
+        riff, _, wave_id = _RIFF.unpack_from(buf)
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            return None
+        fmt: Optional[tuple] = None
+        base, pos = 0, _RIFF.size
+        while True:
+            if pos - base + _CHUNK_HEADER.size > len(buf):
+                # Chunk header lies past what we have read; fetch from there.
+                base, buf = pos, _pread(fd, _HEADER_READ, pos)
+                if len(buf) < _CHUNK_HEADER.size:
+                    return None
+            chunk_id, size = _CHUNK_HEADER.unpack_from(buf, pos - base)
+            pos += _CHUNK_HEADER.size
+            if chunk_id == b"data":
+                break
+            if chunk_id == b"fmt ":
+                if size < _FMT_PCM.size:
+                    return None
+                if pos - base + _FMT_PCM.size > len(buf):
+                    base, buf = pos, _pread(fd, _HEADER_READ, pos)
+                    if len(buf) < _FMT_PCM.size:
+                        return None
+                fmt = _FMT_PCM.unpack_from(buf, pos - base)
+            pos += size + (size & 1)
+    finally:
+        os.close(fd)
+    if fmt is None:
+        return None
+    tag, channels, rate, _, block_align, _ = fmt
+    if tag not in _PCM_TAGS or not channels or not rate or not block_align:
+        return None
+    frames = size // block_align
+    return AudioAnalysis(duration=frames / float(rate), channels=channels, sample_rate=rate)
+
+
 class UnifiedAudioSystem:
     """Perform lightweight audio analysis and transcription prompts."""
 
     def __init__(self, model_manager: UnifiedModelManager) -> None:
         self.model_manager = model_manager
 
-    def analyse(self, path: Path) -> AudioAnalysis:
+    def analyse(self, path: Path, *, strict: bool = False) -> AudioAnalysis:
+        """Return duration, channels and sample rate of a WAV file.
+
+        The RIFF headers are parsed directly; ``strict=True`` (or a file the
+        header reader does not recognise) goes through :mod:`wave` instead.
+        """
+
+        if not strict:
+            analysis = _read_wav_header(path)
+            if analysis is not None:
+                return analysis
         with wave.open(str(path), "rb") as wav:
             frames = wav.getnframes()
             rate = wav.getframerate()
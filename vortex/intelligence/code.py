@@ -3,12 +3,136 @@
 from __future__ import annotations
 
 import ast
+import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from vortex.core.model import UnifiedModelManager
 
+# Fields that hold nested statements (or clauses wrapping them). Functions can
+# only be defined at statement level, so expression subtrees are never visited.
+_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+# Simple statements have no nested blocks; skipping them outright avoids five
+# ``getattr`` probes for the assignments and imports that fill most modules.
+_LEAF_STATEMENTS = frozenset(
+    {
+        ast.Expr,
+        ast.Assign,
+        ast.AnnAssign,
+        ast.AugAssign,
+        ast.Import,
+        ast.ImportFrom,
+        ast.Return,
+        ast.Pass,
+        ast.Break,
+        ast.Continue,
+        ast.Raise,
+        ast.Assert,
+        ast.Delete,
+        ast.Global,
+        ast.Nonlocal,
+    }
+)
+
+
+def _function_defs(tree: ast.AST) -> Iterator[Union[ast.FunctionDef, ast.AsyncFunctionDef]]:
+    # A stack of iterators over statement blocks: descending into a compound
+    # statement pushes its blocks, and the enclosing block resumes where it
+    # left off once they are exhausted, so definitions come out in source order.
+    stack: List[Iterator[ast.AST]] = [iter((tree,))]
+    while stack:
+        for node in stack[-1]:
+            kind = type(node)
+            if kind is ast.FunctionDef or kind is ast.AsyncFunctionDef:
+                yield node  # type: ignore[misc]
+            elif kind in _LEAF_STATEMENTS:
+                continue
+            blocks: List[Optional[List[ast.AST]]] = [
+                getattr(node, field, None) for field in _BLOCK_FIELDS
+            ]
+            stack.extend(iter(block) for block in reversed(blocks) if block)
+            break
+        else:
+            stack.pop()
+
+
+_Signatures = Tuple[Tuple[str, Tuple[str, ...]], ...]
+_CacheKey = Tuple[str, int, int]
+
+# Parsed signatures keyed on (path, st_mtime_ns, st_size): an edited file gets
+# a new key. Plain tuples are stored so callers can never mutate an entry.
+_CACHE_SIZE = 4096
+_signature_cache: "OrderedDict[_CacheKey, _Signatures]" = OrderedDict()
+# Rendered prompt text for cached entries, evicted together with them.
+_signature_text_cache: Dict[_CacheKey, str] = {}
+# Below this many files to parse, starting worker processes costs more than it saves.
+_PARALLEL_PARSE_THRESHOLD = 8
+
+
+def _parse_signatures(path: str) -> _Signatures:
+    # Module level so it can run in a ProcessPoolExecutor worker.
+    with open(path, "rb") as handle:
+        tree = ast.parse(handle.read())
+    return tuple(
+        (node.name, tuple(arg.arg for arg in node.args.args)) for node in _function_defs(tree)
+    )
+
+
+def _cache_key(path: Path) -> _CacheKey:
+    stat = os.stat(path)
+    return os.fspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _cache_get(key: _CacheKey) -> Optional[_Signatures]:
+    signatures = _signature_cache.get(key)
+    if signatures is not None:
+        _signature_cache.move_to_end(key)
+    return signatures
+
+
+def _cache_put(key: _CacheKey, signatures: _Signatures) -> None:
+    _signature_cache[key] = signatures
+    _signature_cache.move_to_end(key)
+    _signature_text_cache.pop(key, None)
+    while len(_signature_cache) > _CACHE_SIZE:
+        evicted, _ = _signature_cache.popitem(last=False)
+        _signature_text_cache.pop(evicted, None)
+
+
+def _load_signatures(key: _CacheKey) -> _Signatures:
+    signatures = _cache_get(key)
+    if signatures is None:
+        signatures = _parse_signatures(key[0])
+        _cache_put(key, signatures)
+    return signatures
+
+
+def _signature_text(key: _CacheKey, signatures: _Signatures) -> str:
+    # An unchanged file reuses its rendered text; otherwise one join over a
+    # list, which str.join handles faster than a generator.
+    text = _signature_text_cache.get(key)
+    if text is None:
+        text = ", ".join([f"{name}({', '.join(args)})" for name, args in signatures])
+        if key in _signature_cache:
+            _signature_text_cache[key] = text
+    return text
+
+
+def _to_signatures(signatures: _Signatures) -> List["FunctionSignature"]:
+    return [FunctionSignature(name=name, args=list(args)) for name, args in signatures]
+
+
+def _test_prompt(signature_text: str) -> str:
+    return (
+        "Given the following functions: "
+        f"{signature_text}. Suggest targeted unit tests focusing on edge cases."
+    )
+
 
 @dataclass
 class FunctionSignature:
@@ -21,25 +145,98 @@ class UnifiedCodeIntelligence:
 
     def __init__(self, model_manager: UnifiedModelManager) -> None:
         self.model_manager = model_manager
+        self._pool: Optional[ProcessPoolExecutor] = None
 
     def inspect_file(self, path: Path) -> List[FunctionSignature]:
-        tree = ast.parse(path.read_text())
-        signatures: List[FunctionSignature] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                args = [arg.arg for arg in node.args.args]
-                signatures.append(FunctionSignature(name=node.name, args=args))
-        return signatures
+        """Return the function signatures defined in ``path``.
 
-    async def suggest_tests(self, path: Path) -> str:
-        signatures = self.inspect_file(path)
-        signature_text = ", ".join(f"{s.name}({', '.join(s.args)})" for s in signatures)
-        prompt = (
-            "Given the following functions: "
-            f"{signature_text}. Suggest targeted unit tests focusing on edge cases."
+        Results are cached on ``(path, mtime, size)``, so an unchanged file costs
+        one ``stat`` instead of a read and parse.
+        """
+
+        return _to_signatures(_load_signatures(_cache_key(path)))
+
+    async def inspect_files(
+        self, paths: Sequence[Path], *, executor: Optional[Executor] = None
+    ) -> List[List[FunctionSignature]]:
+        """:meth:`inspect_file` for many files, parsing cache misses in parallel.
+
+        Misses are parsed on ``executor`` when given, otherwise on a shared
+        process pool once there are enough of them to be worth it.
+        """
+
+        loaded = await self._load_many(paths, executor)
+        return [_to_signatures(signatures) for _, signatures in loaded]
+
+    async def _load_many(
+        self, paths: Sequence[Path], executor: Optional[Executor]
+    ) -> List[Tuple[_CacheKey, _Signatures]]:
+        keys = [_cache_key(path) for path in paths]
+        results: Dict[_CacheKey, _Signatures] = {}
+        # Insertion-ordered set of keys to parse; duplicates collapse in O(1).
+        missing: Dict[_CacheKey, None] = {}
+        for key in keys:
+            cached = _cache_get(key)
+            if cached is not None:
+                results[key] = cached
+            elif key not in results:
+                missing[key] = None
+        if missing:
+            parsed = await self._parse_many([key[0] for key in missing], executor)
+            for key, signatures in zip(missing, parsed):
+                _cache_put(key, signatures)
+                results[key] = signatures
+        return [(key, results[key]) for key in keys]
+
+    async def _parse_many(
+        self, paths: List[str], executor: Optional[Executor]
+    ) -> List[_Signatures]:
+        if executor is None and len(paths) < _PARALLEL_PARSE_THRESHOLD:
+            return [_parse_signatures(path) for path in paths]
+        if executor is None:
+            executor = self._process_pool()
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, _parse_signatures, path) for path in paths)
+            )
         )
-        result = await self.model_manager.generate(prompt)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        # Kept across calls so worker start-up is paid once, and spawned rather
+        # than forked: forking a process that runs an event loop and executor
+        # threads can copy their locks mid-operation into the child.
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    async def close(self) -> None:
+        """Shut down the shared parse pool, if one was started."""
+
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            # shutdown() joins the workers; keep that wait off the event loop.
+            await asyncio.to_thread(pool.shutdown)
+
+    async def suggest_tests(self, path: Path) -> str:
+        key = _cache_key(path)
+        text = _signature_text(key, _load_signatures(key))
+        result = await self.model_manager.generate(_test_prompt(text))
         return result["text"]
 
+    async def suggest_tests_many(
+        self, paths: Sequence[Path], *, executor: Optional[Executor] = None
+    ) -> Dict[Path, str]:
+        """Suggest tests for several files, with the model calls in flight together."""
+
+        loaded = await self._load_many(paths, executor)
+        results = await asyncio.gather(
+            *(
+                self.model_manager.generate(_test_prompt(_signature_text(key, sigs)))
+                for key, sigs in loaded
+            )
+        )
+        return {path: result["text"] for path, result in zip(paths, results)}
+
 
 __all__ = ["UnifiedCodeIntelligence", "FunctionSignature"]
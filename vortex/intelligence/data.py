@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import statistics
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from vortex.core.model import UnifiedModelManager
 from vortex.utils.logging import get_logger
 
+try:  # pragma: no cover - optional dependency shipped with the ``ai`` extra
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python fallback
+    np = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 
@@ -29,17 +34,11 @@ class UnifiedDataAnalyst:
     def summarise(self, data: Dict[str, Iterable[float]]) -> List[DataSummary]:
         summaries: List[DataSummary] = []
         for column, values in data.items():
-            values_list = list(values)
-            if not values_list:
+            stats = _describe(values)
+            if stats is None:
                 continue
-            summaries.append(
-                DataSummary(
-                    column=column,
-                    count=len(values_list),
-                    mean=statistics.fmean(values_list),
-                    median=statistics.median(values_list),
-                )
-            )
+            count, mean, median = stats
+            summaries.append(DataSummary(column=column, count=count, mean=mean, median=median))
         return summaries
 
     async def explain(self, context: str, question: str) -> str:
@@ -48,4 +47,30 @@ class UnifiedDataAnalyst:
         return result["text"]
 
 
+def _describe(values: Iterable[float]) -> Optional[Tuple[int, float, float]]:
+    """Return ``(count, mean, median)``, or ``None`` for an empty column."""
+
+    if np is None:
+        values_list = list(values)
+        if not values_list:
+            return None
+        return len(values_list), statistics.fmean(values_list), statistics.median(values_list)
+    if isinstance(values, (list, tuple, np.ndarray)):
+        arr = np.asarray(values, dtype=np.float64)
+    else:
+        arr = np.fromiter(values, dtype=np.float64)
+    n = arr.size
+    if not n:
+        return None
+    # Selection rather than a full sort: partition places the middle
+    # element(s) where a sorted array would have them.
+    k = n // 2
+    if n & 1:
+        median = float(np.partition(arr, k)[k])
+    else:
+        part = np.partition(arr, (k - 1, k))
+        median = float((part[k - 1] + part[k]) / 2)
+    return n, float(arr.mean()), median
+
+
 __all__ = ["UnifiedDataAnalyst", "DataSummary"]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
 
 from vortex.core.model import UnifiedModelManager
 
+try:  # pragma: no cover - optional dependency shipped with the ``ai`` extra
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python fallback
+    np = None  # type: ignore[assignment]
+
 
 @dataclass
 class ImageDescription:
@@ -22,10 +28,20 @@ class UnifiedVisionPro:
     def __init__(self, model_manager: UnifiedModelManager) -> None:
         self.model_manager = model_manager
 
-    def analyse(self, path: Path) -> ImageDescription:
+    def analyse(self, path: Path, *, most_frequent: bool = False) -> ImageDescription:
+        """Describe ``path`` from its raw bytes.
+
+        By default the dominant colour is the per-channel byte sum modulo 256.
+        ``most_frequent=True`` reports the most common RGB triple instead,
+        quantised to 5 bits per channel.
+        """
+
         data = path.read_bytes()
         size = len(data)
-        dominant = self._dominant_colour(data)
+        if most_frequent:
+            dominant = self._most_frequent_colour(data)
+        else:
+            dominant = self._dominant_colour(data)
         return ImageDescription(path=path, dominant_colour=dominant, size=size)
 
     async def describe(self, path: Path) -> str:
@@ -40,9 +56,42 @@ class UnifiedVisionPro:
     def _dominant_colour(self, data: bytes) -> str:
         if not data:
             return "unknown"
-        r = sum(data[0::3]) % 256
-        g = sum(data[1::3]) % 256
-        b = sum(data[2::3]) % 256
+        if np is None:
+            r = sum(data[0::3]) % 256
+            g = sum(data[1::3]) % 256
+            b = sum(data[2::3]) % 256
+        else:
+            # One pass over a zero-copy view; uint8 accumulation wraps, which is
+            # exactly the modulo 256 the pure-Python path applies.
+            buf = np.frombuffer(data, dtype=np.uint8)
+            whole = buf.size - buf.size % 3
+            r, g, b = (int(v) for v in buf[:whole].reshape(-1, 3).sum(axis=0, dtype=np.uint8))
+            # Trailing bytes belong to the red, then green, channel.
+            tail = data[whole:]
+            if tail:
+                r = (r + tail[0]) % 256
+                if len(tail) > 1:
+                    g = (g + tail[1]) % 256
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+    def _most_frequent_colour(self, data: bytes) -> str:
+        # Each complete RGB triple is binned on its top 5 bits per channel
+        # (32768 bins); ties go to the lowest bin, as with ``argmax``.
+        if len(data) < 3:
+            return "unknown"
+        if np is None:
+            counts = Counter(
+                (r >> 3) << 10 | (g >> 3) << 5 | b >> 3
+                for r, g, b in zip(data[0::3], data[1::3], data[2::3])
+            )
+            top = max(counts.items(), key=lambda item: (item[1], -item[0]))[0]
+        else:
+            buf = np.frombuffer(data, dtype=np.uint8)
+            rgb = (buf[: buf.size - buf.size % 3].reshape(-1, 3) >> 3).astype(np.uint16)
+            bins = rgb[:, 0] << 10 | rgb[:, 1] << 5 | rgb[:, 2]
+            top = int(np.bincount(bins, minlength=1 << 15).argmax())
+        # Report the centre of the winning bin.
+        r, g, b = (top >> 10 & 31) << 3 | 4, (top >> 5 & 31) << 3 | 4, (top & 31) << 3 | 4
         return f"#{r:02x}{g:02x}{b:02x}"
 
 
@@ -45,6 +45,12 @@ async def _initialise_runtime() -> None:
     settings = await config_manager.load()
     configure_logging()
 
+    # Opening the memory database (connect, WAL pragmas, schema) is the
+    # slowest constructor; run it in a thread while the rest are built.
+    memory_task = asyncio.ensure_future(
+        asyncio.to_thread(UnifiedMemorySystem, settings.memory.database)
+    )
+
     security = UnifiedSecurityManager(
         credential_dir=settings.security.credential_store,
         allowed_modules=settings.security.allowed_modules,
@@ -56,10 +62,11 @@ async def _initialise_runtime() -> None:
     await security.access_control.assign_role("cli", "mobile")
 
     model_manager = UnifiedModelManager([provider.model_dump() for provider in settings.providers])
-    memory = UnifiedMemorySystem(settings.memory.database)
     planner = UnifiedAdvancedPlanner(
         max_parallel_tasks=settings.planner.max_parallel_tasks,
         recovery_retries=settings.planner.recovery_retries,
+        retry_backoff=settings.planner.retry_backoff,
+        max_backoff=settings.planner.max_backoff,
     )
     plugin_paths = [Path("plugins"), Path.home() / ".vortex" / "plugins"]
     plugins = UnifiedPluginSystem(plugin_paths, sandbox=security.sandbox.clone())
@@ -74,6 +81,7 @@ async def _initialise_runtime() -> None:
     database = DatabaseManager(settings.memory.database, security)
     cloud = CloudIntegration(security)
     git = GitManager(security)
+    memory = await memory_task
     ai_context = ContextManager(model_manager, memory)
     ai_learning = ContinuousLearningSystem(memory)
     ai_nlp = NLPEngine()
@@ -88,9 +96,6 @@ async def _initialise_runtime() -> None:
     workflow_engine = WorkflowEngine(perf_monitor)
     macro_system = MacroSystem()
     scheduler = WorkflowScheduler()
-    web_ui = WebUI()
-    desktop_gui = DesktopGUI()
-    mobile_api = MobileAPI(security)
     rich_bridge = RichUIBridge(ui)
     test_framework = TestFramework(root=Path("tests"))
     devtools = DevToolsSuite(test_framework)
@@ -98,14 +103,14 @@ async def _initialise_runtime() -> None:
     devops = DevOpsHelper()
     learning_mode = LearningMode(ai_context)
     code_explainer = CodeExplainer(ai_code)
-    multiagent = MultiAgentCoordinator(model_manager)
 
-    async def _echo_agent(message: str) -> str:
-        return f"echo:{message}"
+    def _multiagent() -> MultiAgentCoordinator:
+        async def _echo_agent(message: str) -> str:
+            return f"echo:{message}"
 
-    multiagent.register("echo", _echo_agent)
-    self_improvement = SelfImprovementLoop(lambda idea: float(len(idea)))
-    predictor = Predictor(ai_nlp)
+        coordinator = MultiAgentCoordinator(model_manager)
+        coordinator.register("echo", _echo_agent)
+        return coordinator
 
     await ai_learning.bootstrap_from_memory()
 
@@ -140,9 +145,6 @@ async def _initialise_runtime() -> None:
         workflow_engine=workflow_engine,
         macro_system=macro_system,
         scheduler=scheduler,
-        web_ui=web_ui,
-        desktop_gui=desktop_gui,
-        mobile_api=mobile_api,
         rich_bridge=rich_bridge,
         devtools=devtools,
         test_framework=test_framework,
@@ -150,9 +152,15 @@ async def _initialise_runtime() -> None:
         devops=devops,
         learning_mode=learning_mode,
         code_explainer=code_explainer,
-        multiagent=multiagent,
-        self_improvement=self_improvement,
-        predictor=predictor,
+        # Rarely used components are only built when a command first uses them.
+        factories={
+            "web_ui": WebUI,
+            "desktop_gui": DesktopGUI,
+            "mobile_api": lambda: MobileAPI(security),
+            "multiagent": _multiagent,
+            "self_improvement": lambda: SelfImprovementLoop(lambda idea: float(len(idea))),
+            "predictor": lambda: Predictor(ai_nlp),
+        },
     )
     set_runtime(context)
     config_manager.start_watching()
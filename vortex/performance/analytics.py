@@ -8,8 +8,7 @@ import sqlite3
 import time
 from collections import defaultdict
 from pathlib import Path
-from statistics import mean
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from vortex.performance.monitor import PerformanceMonitor
 from vortex.utils.logging import get_logger
@@ -86,44 +85,54 @@ class SessionAnalyticsStore:
         )
 
     async def session_summary(self, session_id: str) -> Dict[str, Any]:
+        # One grouped query returns each kind's time span as well, and a single
+        # pass over the rows folds counts, KPIs and the session span together.
         rows = await self._fetch(
             """
-            SELECT kind, COUNT(*), AVG(duration), SUM(tokens), SUM(cost), SUM(success)
+            SELECT kind, COUNT(*), AVG(duration), SUM(tokens), SUM(cost), SUM(success),
+                   MIN(timestamp), MAX(timestamp)
             FROM events WHERE session_id=? GROUP BY kind ORDER BY kind
             """,
             (session_id,),
         )
-        totals = await self._fetch(
-            "SELECT MIN(timestamp), MAX(timestamp) FROM events WHERE session_id=?",
-            (session_id,),
-        )
-        duration = 0.0
-        if totals and totals[0][0] is not None and totals[0][1] is not None:
-            duration = max(0.0, float(totals[0][1]) - float(totals[0][0]))
-        summary: Dict[str, Any] = {
-            "session_id": session_id,
-            "duration": duration,
-            "events": [],
-            "success_rate": 0.0,
-        }
+        events: List[Dict[str, Any]] = []
+        kpis = {"events": 0.0, "cost": 0.0, "tokens": 0.0, "avg_duration": 0.0}
         success_count = 0.0
         total_count = 0.0
-        for kind, count, avg_duration, tokens, cost, successes in rows:
-            summary["events"].append(
-                {
-                    "kind": kind,
-                    "count": int(count),
-                    "avg_duration": float(avg_duration or 0.0),
-                    "tokens": float(tokens or 0.0),
-                    "cost": float(cost or 0.0),
-                    "successes": int(successes or 0),
-                }
-            )
+        first: Optional[float] = None
+        last: Optional[float] = None
+        for kind, count, avg_duration, tokens, cost, successes, started, ended in rows:
+            entry = {
+                "kind": kind,
+                "count": int(count),
+                "avg_duration": float(avg_duration or 0.0),
+                "tokens": float(tokens or 0.0),
+                "cost": float(cost or 0.0),
+                "successes": int(successes or 0),
+            }
+            events.append(entry)
+            kpis["events"] += entry["count"]
+            kpis["cost"] += entry["cost"]
+            kpis["tokens"] += entry["tokens"]
+            kpis["avg_duration"] += entry["avg_duration"]
             success_count += float(successes or 0.0)
             total_count += float(count or 0.0)
-        summary["success_rate"] = success_count / total_count if total_count else 0.0
-        summary["kpis"] = self._aggregate_kpis(summary["events"])
-        return summary
+            if started is not None and (first is None or started < first):
+                first = started
+            if ended is not None and (last is None or ended > last):
+                last = ended
+        if events:
+            kpis["avg_duration"] /= len(events)
+        duration = 0.0
+        if first is not None and last is not None:
+            duration = max(0.0, float(last) - float(first))
+        return {
+            "session_id": session_id,
+            "duration": duration,
+            "events": events,
+            "success_rate": success_count / total_count if total_count else 0.0,
+            "kpis": kpis,
+        }
 
     async def generate_report(self, session_id: str) -> Dict[str, Any]:
         summary = await self.session_summary(session_id)
@@ -156,12 +165,17 @@ class SessionAnalyticsStore:
             insights.append(
                 f"Session ran for {summary['duration'] / 60:.1f} minutes with {len(summary['events'])} activity types."
             )
-        highest = max(summary["events"], key=lambda item: item["count"], default=None)
+        highest: Optional[Dict[str, Any]] = None
+        slow: Optional[Dict[str, Any]] = None
+        for entry in summary["events"]:
+            if highest is None or entry["count"] > highest["count"]:
+                highest = entry
+            if slow is None or entry["avg_duration"] > slow["avg_duration"]:
+                slow = entry
         if highest:
             insights.append(
                 f"Most frequent action: {highest['kind']} ({highest['count']} times, success {highest['successes']})."
             )
-        slow = max(summary["events"], key=lambda item: item["avg_duration"], default=None)
         if slow and slow["avg_duration"] > 0:
             insights.append(f"Slowest step: {slow['kind']} averaging {slow['avg_duration']:.2f}s.")
         if summary["success_rate"] < 0.6:
@@ -229,23 +243,6 @@ class SessionAnalyticsStore:
         finally:
             conn.close()
 
-    @staticmethod
-    def _aggregate_kpis(events: Iterable[Dict[str, Any]]) -> Dict[str, float]:
-        totals = {
-            "events": 0.0,
-            "cost": 0.0,
-            "tokens": 0.0,
-            "avg_duration": 0.0,
-        }
-        durations: List[float] = []
-        for entry in events:
-            totals["events"] += entry.get("count", 0.0)
-            totals["cost"] += entry.get("cost", 0.0)
-            totals["tokens"] += entry.get("tokens", 0.0)
-            durations.append(entry.get("avg_duration", 0.0))
-        totals["avg_duration"] = mean(durations) if durations else 0.0
-        return totals
-
     @staticmethod
     def _total_cost(summary: Dict[str, Any]) -> float:
         return sum(event.get("cost", 0.0) for event in summary.get("events", []))
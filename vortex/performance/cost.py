@@ -43,5 +43,7 @@ class CostTracker:
             return snapshot
 
     async def total_cost(self) -> float:
-        data = await self.snapshot()
-        return sum(item.cost for item in data.values())
+        # Folded straight from the provider metrics; the status bar polls this,
+        # and a snapshot would build (and log) per-provider records to sum one field.
+        async with self._lock:
+            return sum(metrics.cost for metrics in self._model_manager.token_usage().values())
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
+
+import orjson
 
 from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read size when scanning the log backwards for its most recent lines.
+_TAIL_BLOCK = 64 * 1024
+_LINE_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
 
 @dataclass
 class AuditEvent:
@@ -29,29 +35,80 @@ class AuditTrail:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
     def record(self, event: AuditEvent) -> None:
-        self.path.write_text(
-            (self.path.read_text(encoding="utf-8") if self.path.exists() else "")
-            + json.dumps(event.__dict__)
-            + "\n",
-            encoding="utf-8",
-        )
-        logger.info("audit", extra=event.__dict__)
+        self.record_many((event,))
+
+    def record_many(self, events: Iterable[AuditEvent]) -> None:
+        """Append ``events`` to the log with a single write."""
+
+        events = list(events)
+        if not events:
+            return
+        self.append(self.encode(events))
+
+    @staticmethod
+    def encode(events: Iterable[AuditEvent]) -> bytes:
+        """Encode ``events`` as JSON lines, logging each one.
+
+        Raises :class:`TypeError` for metadata that cannot be serialised.
+        """
+
+        events = list(events)
+        lines = b"".join(orjson.dumps(event.__dict__, option=_LINE_OPTIONS) for event in events)
+        for event in events:
+            logger.info("audit", extra=event.__dict__)
+        return lines
+
+    def append(self, lines: bytes) -> None:
+        """Append lines produced by :meth:`encode` with a single write."""
+
+        # Append only: the log is never rewritten.
+        with self.path.open("ab") as handle:
+            handle.write(lines)
 
     def log(self, actor: str, action: str, metadata: Dict[str, Any]) -> None:
         event = AuditEvent(actor=actor, action=action, metadata=metadata, timestamp=time.time())
         self.record(event)
 
     def read_recent(self, limit: int = 100) -> list[Dict[str, Any]]:
-        if not self.path.exists():
+        try:
+            lines = _tail_lines(self.path, limit)
+        except FileNotFoundError:
             return []
-        lines = self.path.read_text(encoding="utf-8").strip().splitlines()[-limit:]
         events = []
         for line in lines:
             try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:  # pragma: no cover - handles manual file edits
+                events.append(orjson.loads(line))
+            except orjson.JSONDecodeError:  # pragma: no cover - handles manual file edits
                 continue
         return events
 
 
+def _tail_lines(path: Path, limit: int) -> List[bytes]:
+    """Return the last ``limit`` non-blank lines of ``path``.
+
+    The log is append-only, so the file is read backwards in blocks until
+    enough lines are found; the cost follows ``limit`` rather than the length
+    of the history. A non-positive ``limit`` returns every line.
+    """
+
+    with path.open("rb") as handle:
+        if limit <= 0:
+            return [line for line in handle.read().splitlines() if line.strip()]
+        pos = handle.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        while pos > 0 and newlines <= limit:
+            size = min(_TAIL_BLOCK, pos)
+            pos -= size
+            handle.seek(pos)
+            chunk = handle.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    lines = b"".join(reversed(chunks)).splitlines()
+    if pos > 0:
+        # The first line starts before the data read and is incomplete.
+        lines = lines[1:]
+    return [line for line in lines if line.strip()][-limit:]
+
+
 __all__ = ["AuditTrail", "AuditEvent"]
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from vortex.security.audit import AuditTrail
+from vortex.security.audit import AuditEvent as TrailEvent, AuditTrail
 from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,19 +25,55 @@ class AuditEvent:
 
 
 class AuditSystem:
-    """Load and query audit trails."""
+    """Load and query audit trails.
+
+    Logged events are encoded by the caller, so bad metadata raises there and
+    later changes to it are not recorded, then queued for a background writer
+    that appends everything queued since its previous write in one go.
+    Callers that need the events on disk can ``await flush()``.
+    """
 
     def __init__(self, log_path: Path) -> None:
         self._trail = AuditTrail(log_path)
-        self._lock = asyncio.Lock()
+        self._queue: Optional[asyncio.Queue[bytes]] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
 
     async def log(self, actor: str, action: str, metadata: Dict[str, str]) -> None:
-        async with self._lock:
-            self._trail.log(actor, action, metadata)
+        self._enqueue(
+            [TrailEvent(actor=actor, action=action, metadata=metadata, timestamp=time.time())]
+        )
+
+    async def log_batch(self, entries: Iterable[Tuple[str, str, Dict[str, str]]]) -> None:
+        """Record several ``(actor, action, metadata)`` entries in one append."""
+
+        timestamp = time.time()
+        events = [
+            TrailEvent(actor=actor, action=action, metadata=metadata, timestamp=timestamp)
+            for actor, action, metadata in entries
+        ]
+        if events:
+            self._enqueue(events)
+
+    async def flush(self) -> None:
+        """Wait until every event logged so far has been written."""
+
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Write any queued events and stop the background writer."""
+
+        await self.flush()
+        task, self._writer_task = self._writer_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._queue = None
 
     async def recent_events(self, limit: int = 50) -> List[AuditEvent]:
-        async with self._lock:
-            entries = self._trail.read_recent(limit)
+        await self.flush()
+        entries = self._trail.read_recent(limit)
         events = []
         for entry in entries:
             raw_timestamp = entry.get("timestamp")
@@ -53,3 +91,41 @@ class AuditSystem:
             )
         logger.debug("loaded audit events", extra={"count": len(events)})
         return events
+
+    def _enqueue(self, events: List[TrailEvent]) -> None:
+        lines = self._trail.encode(events)
+        task = self._writer_task
+        # The CLI runs each command in its own event loop; a writer left on a
+        # previous loop can never run again, so each loop gets its own.
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._write_loop(self._queue))
+        assert self._queue is not None
+        self._queue.put_nowait(lines)
+
+    async def _write_loop(self, queue: asyncio.Queue[bytes]) -> None:
+        try:
+            while True:
+                batches = [await queue.get()]
+                while not queue.empty():
+                    batches.append(queue.get_nowait())
+                try:
+                    await asyncio.to_thread(self._trail.append, b"".join(batches))
+                except Exception:
+                    # One failed append must not stop the writer for good.
+                    logger.exception("failed to append audit events")
+                finally:
+                    for _ in batches:
+                        queue.task_done()
+        finally:
+            # Cancelled, typically by an event loop shutting down: audit events
+            # must not be dropped, so whatever is still queued is written here.
+            pending: List[bytes] = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+                queue.task_done()
+            if pending:
+                try:
+                    self._trail.append(b"".join(pending))
+                except Exception:
+                    logger.exception("failed to append audit events")
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+import orjson
+
 from vortex.utils.errors import SecurityError
 
 try:  # pragma: no cover - optional dependency may be missing in CI
@@ -36,8 +37,10 @@ class CredentialStore:
 
     def _load_or_create_key(self) -> EncryptionKey:
         key_path = self.directory / "key"
-        if key_path.exists():
+        try:
             return EncryptionKey(value=key_path.read_bytes())
+        except FileNotFoundError:
+            pass
         if Fernet:
             key_value = Fernet.generate_key()
         else:
@@ -55,9 +58,10 @@ class CredentialStore:
 
     def load(self, name: str) -> str:
         path = self.directory / f"{name}.secret"
-        if not path.exists():
-            raise SecurityError(f"Secret {name} missing")
-        data = path.read_bytes()
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError as exc:
+            raise SecurityError(f"Secret {name} missing") from exc
         if self._fernet:
             return self._fernet.decrypt(data).decode("utf-8")
         return base64.urlsafe_b64decode(data).decode("utf-8")
@@ -98,20 +102,20 @@ class SessionEncryptor:
         """Load or create the symmetric key for ``session_id``."""
 
         key_path = self._store.directory / f"session-{session_id}.key"
-        if key_path.exists():
+        try:
             token = key_path.read_bytes()
-            key_bytes = self._decrypt_bytes(token)
-        else:
+        except FileNotFoundError:
             key_bytes = self._generate_key()
-            token = self._encrypt_bytes(key_bytes)
-            key_path.write_bytes(token)
+            key_path.write_bytes(self._encrypt_bytes(key_bytes))
+        else:
+            key_bytes = self._decrypt_bytes(token)
         self._cache[session_id] = key_bytes
         return base64.urlsafe_b64encode(key_bytes).decode("utf-8")
 
     def encrypt_event(self, session_id: str, payload: dict) -> str:
         """Encrypt a JSON payload for persistence or sharing."""
 
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
         cipher = self._session_cipher(session_id)
         if cipher:
             token = cipher.encrypt(data)
@@ -126,7 +130,8 @@ class SessionEncryptor:
             decoded = cipher.decrypt(data)
         else:  # pragma: no cover - fallback path
             decoded = base64.urlsafe_b64decode(data)
-        return json.loads(decoded.decode("utf-8"))
+        # orjson parses the UTF-8 bytes directly; no intermediate str.
+        return orjson.loads(decoded)
 
     def generate_share_token(self, session_id: str, *, role: str, read_only: bool) -> str:
         """Return a signed token describing share permissions."""
@@ -138,7 +143,7 @@ class SessionEncryptor:
             "read_only": read_only,
             "key": key,
         }
-        raw = json.dumps(payload).encode("utf-8")
+        raw = orjson.dumps(payload)
         token = base64.urlsafe_b64encode(self._encrypt_bytes(raw))
         return token.decode("utf-8")
 
@@ -146,7 +151,7 @@ class SessionEncryptor:
         """Decode a previously generated share token."""
 
         raw = base64.urlsafe_b64decode(token.encode("utf-8"))
-        payload = json.loads(self._decrypt_bytes(raw).decode("utf-8"))
+        payload = orjson.loads(self._decrypt_bytes(raw))
         session_id = payload["session"]
         key = payload["key"].encode("utf-8")
         self._cache[session_id] = base64.urlsafe_b64decode(key)
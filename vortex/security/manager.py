@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from vortex.security.access_control import AccessControl
 from vortex.security.audit import AuditTrail
@@ -64,10 +64,25 @@ class UnifiedSecurityManager:
         self.credential_store.save(name, secret)
         await self.audit_system.log("system", "store_secret", {"name": name})
 
+    async def store_secrets(self, secrets: Mapping[str, str]) -> None:
+        """Store several secrets, auditing them with a single log write."""
+
+        await self.rotate_keys()
+        for name, secret in secrets.items():
+            self.credential_store.save(name, secret)
+        await self.audit_system.log_batch(
+            ("system", "store_secret", {"name": name}) for name in secrets
+        )
+
     async def retrieve_secret(self, name: str) -> str:
         secret = self.credential_store.load(name)
         await self.audit_system.log("system", "load_secret", {"name": name})
         return secret
 
+    async def close(self) -> None:
+        """Write out queued audit events and stop the audit writer."""
+
+        await self.audit_system.close()
+
 
 __all__ = ["UnifiedSecurityManager"]
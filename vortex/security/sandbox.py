@@ -15,6 +15,10 @@ from vortex.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Package that plugin modules are imported under; allow-lists may still name a
+# plugin by its bare module name.
+PLUGIN_NAMESPACE = "vortex_plugins"
+
 
 @dataclass
 class SandboxPolicy:
@@ -29,6 +33,10 @@ class Sandbox:
 
     def __init__(self, policy: Optional[SandboxPolicy] = None) -> None:
         self.policy = policy or SandboxPolicy()
+        self._baseline = (
+            frozenset(self.policy.allowed_modules),
+            frozenset(self.policy.forbidden_builtins),
+        )
 
     def clone(self) -> "Sandbox":
         return Sandbox(
@@ -38,11 +46,18 @@ class Sandbox:
             )
         )
 
+    def reset(self) -> None:
+        """Restore the policy this sandbox was created with so it can be reused."""
+
+        allowed, forbidden = self._baseline
+        self.policy.allowed_modules = set(allowed)
+        self.policy.forbidden_builtins = set(forbidden)
+
     async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute ``func`` in a constrained environment."""
 
         module = inspect.getmodule(func)
-        if module and module.__name__ not in self.policy.allowed_modules:
+        if module and not self._allows(module.__name__):
             raise SecurityError(f"Module {module.__name__} is not allowed")
         for name in self.policy.forbidden_builtins:
             if getattr(builtins, name, None):
@@ -54,6 +69,13 @@ class Sandbox:
             for name in self.policy.forbidden_builtins:
                 setattr(builtins, name, getattr(__builtins__, name, None))
 
+    def _allows(self, name: str) -> bool:
+        allowed = self.policy.allowed_modules
+        if name in allowed:
+            return True
+        package, _, stem = name.rpartition(".")
+        return package == PLUGIN_NAMESPACE and stem in allowed
+
     @staticmethod
     def _blocked_builtin(name: str) -> Callable[..., Any]:
         def _blocked(*_: Any, **__: Any) -> None:
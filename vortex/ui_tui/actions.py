@@ -6,6 +6,7 @@ import asyncio
 import json
 import os
 import platform
+import re
 import shutil
 import socket
 import time
@@ -22,10 +23,13 @@ from vortex.performance.analytics import SessionAnalyticsStore
 
 from .analytics_panel import analytics_event_table, analytics_kpi_table
 from .command_parser import SlashCommand
-from .context import CheckpointSnapshot, TUISessionState
+from .context import DEFAULT_ACTOR, CheckpointSnapshot, TUISessionState
 from .session_manager import SessionManager
 from .status import StatusAggregator
 
+# ``+++``/``---`` file header lines of a unified diff.
+_DIFF_FILE_HEADER = re.compile(r"^(?:\+\+\+|---)[^\r\n]*", re.MULTILINE)
+
 
 @dataclass
 class CommandResult:
@@ -58,7 +62,7 @@ class TUIActionCenter:
         self._syntax_theme = syntax_theme
         self._session_manager = session_manager
         self._analytics = analytics
-        self._user = os.getenv("USER", "operator")
+        self._user = DEFAULT_ACTOR
         self._identity = f"{self._user}@{socket.gethostname()}"
 
     async def _ensure_git_permission(self) -> None:
@@ -670,7 +674,10 @@ class TUIActionCenter:
     @staticmethod
     def _extract_files_from_diff(diff: str) -> Iterable[str]:
         files = set()
-        for line in diff.splitlines():
+        # One regex pass picks out the file header lines, so the hunk bodies,
+        # nearly all of a large diff, are never split into Python strings.
+        for match in _DIFF_FILE_HEADER.finditer(diff):
+            line = match.group()
             if line.startswith("+++") and line != "+++ b/dev/null":
                 files.add(line.split(" b/")[-1])
             elif line.startswith("---") and line != "--- a/dev/null":
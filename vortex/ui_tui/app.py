@@ -7,6 +7,7 @@ import os
 import socket
 from itertools import cycle
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
 
 from rich.table import Table
@@ -30,7 +31,13 @@ from .accessibility import (
 from .actions import CommandResult, TUIActionCenter
 from .analytics_panel import analytics_dashboard, analytics_trend_panel
 from .command_parser import SlashCommand, parse_slash_command
-from .context import CollaboratorState, TUIOptions, TUIRuntimeBridge, TUISessionState
+from .context import (
+    DEFAULT_ACTOR,
+    CollaboratorState,
+    TUIOptions,
+    TUIRuntimeBridge,
+    TUISessionState,
+)
 from .hotkeys import bindings_for_app
 from .layout import build_layout
 from .lyra_assistant import LyraAssistant
@@ -51,6 +58,34 @@ from .themes import ThemeError, theme_css
 
 logger = get_logger(__name__)
 
+# Vim-style aliases, built once rather than on every submitted line.
+_COLON_COMMANDS = MappingProxyType(
+    {
+        ":q": "/quit",
+        ":quit": "/quit",
+        ":help": "/help",
+        ":settings": "/settings",
+    }
+)
+
+
+def _collaborator_from_entry(key: str, raw: Any) -> Optional[CollaboratorState]:
+    """Build a collaborator from a session metadata entry, or ``None`` if malformed."""
+
+    if isinstance(raw, CollaboratorState):
+        return raw
+    try:
+        get = raw.get
+        return CollaboratorState(
+            user=get("user", key),
+            host=get("host", ""),
+            role=get("role", "collaborator"),
+            read_only=bool(get("read_only", False)),
+            last_seen=float(get("last_seen", 0.0)),
+        )
+    except Exception:
+        return None
+
 
 class RefreshCoalescer:
     """Coalesce refresh calls to maintain a stable frame budget."""
@@ -175,7 +210,7 @@ class VortexTUI(App[None]):
         self._session_listener: Optional[asyncio.Task[None]] = None
         self._auto_sync_interval = max(5.0, float(os.getenv("VORTEX_SYNC_INTERVAL", "15")))
         self._last_analytics: Dict[str, Any] = {}
-        self._identity = f"{os.getenv('USER', 'operator')}@{socket.gethostname()}"
+        self._identity = f"{DEFAULT_ACTOR}@{socket.gethostname()}"
 
     def _load_state(self, options: TUIOptions) -> TUISessionState:
         if options.resume:
@@ -280,9 +315,7 @@ class VortexTUI(App[None]):
             details = await self.session_manager.session_details(self.state.session_id)
             self._apply_session_details(details)
         else:
-            metadata = await self.session_manager.create_session(
-                "Vortex Session", os.getenv("USER", "operator")
-            )
+            metadata = await self.session_manager.create_session("Vortex Session", DEFAULT_ACTOR)
             details = await self.session_manager.session_details(metadata.session_id)
             self._apply_session_details(details)
             self.state.session_role = "owner"
@@ -325,21 +358,11 @@ class VortexTUI(App[None]):
         session_id = details.get("session_id")
         if session_id:
             self.state.session_id = session_id
-        collaborators: Dict[str, CollaboratorState] = {}
-        for key, raw in details.get("collaborators", {}).items():
-            if isinstance(raw, CollaboratorState):
-                collaborators[key] = raw
-                continue
-            try:
-                collaborators[key] = CollaboratorState(
-                    user=raw.get("user", key),
-                    host=raw.get("host", ""),
-                    role=raw.get("role", "collaborator"),
-                    read_only=bool(raw.get("read_only", False)),
-                    last_seen=float(raw.get("last_seen", 0.0)),
-                )
-            except Exception:
-                continue
+        collaborators = {
+            key: collaborator
+            for key, raw in details.get("collaborators", {}).items()
+            if (collaborator := _collaborator_from_entry(key, raw)) is not None
+        }
         if collaborators:
             self.state.collaborators = collaborators
             self.state.session_acl = {key: value.role for key, value in collaborators.items()}
@@ -383,15 +406,17 @@ class VortexTUI(App[None]):
 
     async def _show_dashboard(self, summary: Dict[str, Any], insights: Iterable[str]) -> None:
         panel = self._main_panel or self.query_one("#main-panel", MainPanel)
+        # Materialised once: the panel update may run later, and a one-shot
+        # iterable consumed here would leave it nothing to render.
+        insights_list = list(insights)
 
         def display() -> None:
-            panel.show(analytics_dashboard(summary, list(insights)))
+            panel.show(analytics_dashboard(summary, insights_list))
             timeline = summary.get("timeline")
             if timeline:
                 panel.append(analytics_trend_panel(timeline))
 
         self._panel_update(display)
-        insights_list = list(insights)
         self._last_analytics = summary
         self.state.insights = insights_list
         if self.announcer and insights_list:
@@ -462,6 +487,10 @@ class VortexTUI(App[None]):
         self.bridge.save_state(self.state)
         if self.tui_settings:
             await self.settings_manager.persist(self.tui_settings)
+        await self.session_manager.close()
+        model_manager = getattr(self.runtime, "model_manager", None)
+        if model_manager is not None:
+            await model_manager.close()
 
     async def _poll_status(self) -> None:
         await self.refresh_status()
@@ -713,14 +742,9 @@ class VortexTUI(App[None]):
         self._refresh_coalescer.request()
 
     def _resolve_colon_command(self, text: str) -> Optional[SlashCommand]:
-        mapping = {
-            ":q": "/quit",
-            ":quit": "/quit",
-            ":help": "/help",
-            ":settings": "/settings",
-        }
-        if text in mapping:
-            return parse_slash_command(mapping[text])
+        alias = _COLON_COMMANDS.get(text)
+        if alias is not None:
+            return parse_slash_command(alias)
         if text.startswith(":palette"):
             return None
         if text.startswith(":theme"):
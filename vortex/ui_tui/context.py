@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import os
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from rich.console import RenderableType
 
 SESSION_DIR = Path.home() / ".agent" / "sessions"
 SESSION_DIR.mkdir(parents=True, exist_ok=True)
 
+# Resolved once so every audit/presence record names the same operator; USERNAME
+# covers Windows shells where USER is unset.
+DEFAULT_ACTOR = os.getenv("USER") or os.getenv("USERNAME") or "operator"
+
 
 @dataclass
 class CollaboratorState:
@@ -124,11 +129,23 @@ class TUISessionState:
         return [item for item in reversed(self.history) if query_lower in item.lower()][:10]
 
     def to_dict(self) -> Dict[str, Any]:
+        payload = self._persisted()
+        payload["logs"] = [entry.__dict__ for entry in payload["logs"]]
+        payload["checkpoints"] = [snapshot.__dict__ for snapshot in payload["checkpoints"]]
+        payload["collaborators"] = {
+            key: value.__dict__ for key, value in payload["collaborators"].items()
+        }
+        return payload
+
+    def _persisted(self) -> Dict[str, Any]:
+        # The persisted fields with nested dataclasses left as they are: orjson
+        # encodes dataclass instances natively, so ``save_state`` serialises this
+        # directly instead of building a throwaway dict per entry first.
         return {
             "mode": self.mode,
             "active_panel": self.active_panel,
-            "logs": [entry.__dict__ for entry in self.logs][-200:],
-            "checkpoints": [snapshot.__dict__ for snapshot in self.checkpoints][-50:],
+            "logs": self.logs[-200:],
+            "checkpoints": self.checkpoints[-50:],
             "autopilot_steps": self.autopilot_steps,
             "budget_minutes": self.budget_minutes,
             "palette_history": self.palette_history[-50:],
@@ -143,7 +160,7 @@ class TUISessionState:
             "history": self.history[-200:],
             "session_id": self.session_id,
             "session_role": self.session_role,
-            "collaborators": {key: value.__dict__ for key, value in self.collaborators.items()},
+            "collaborators": self.collaborators,
             "session_lock_holder": self.session_lock_holder,
             "session_metrics": self.session_metrics,
             "analytics_trends": self.analytics_trends[-50:],
@@ -231,19 +248,16 @@ class TUIRuntimeBridge:
         return self.session_dir / "latest.json"
 
     def load_state(self) -> Optional[TUISessionState]:
-        path = self.session_file()
-        if not path.exists():
-            return None
         try:
-            data = json.loads(path.read_text())
-        except json.JSONDecodeError:
+            data = orjson.loads(self.session_file().read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return None
         return TUISessionState.from_dict(data)
 
     def save_state(self, state: TUISessionState) -> None:
-        payload = state.to_dict()
+        payload = state._persisted()
         tmp = self.session_file().with_suffix(".tmp")
-        tmp.write_text(json.dumps(payload, indent=2))
+        tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         tmp.replace(self.session_file())
 
     def session_directory(self, session_id: str) -> Path:
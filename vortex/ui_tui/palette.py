@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import os
+from collections import deque
 from dataclasses import dataclass
-from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Deque, Iterable, Iterator, List
 
 try:  # pragma: no cover - optional dependency for fuzzy scoring
     from rapidfuzz import fuzz
@@ -105,15 +106,39 @@ def iter_palette_entries(
             except Exception:  # pragma: no cover - plugin discovery failures are tolerated
                 pass
         repo_root = Path.cwd()
-        for path in islice(repo_root.rglob("*"), 40):
-            if path.is_file():
-                rel = path.relative_to(repo_root)
-                yield PaletteEntry(
-                    label=f"File: {rel}",
-                    hint="Open diff for file",
-                    command=f"/diff {rel}",
-                    category="file",
-                )
+        for path in _workspace_files(repo_root, 40):
+            rel = path.relative_to(repo_root)
+            yield PaletteEntry(
+                label=f"File: {rel}",
+                hint="Open diff for file",
+                command=f"/diff {rel}",
+                category="file",
+            )
+
+
+def _workspace_files(root: Path, limit: int) -> Iterator[Path]:
+    """Yield the files among the first ``limit`` entries of a walk of ``root``.
+
+    Directories are listed breadth first with :func:`os.scandir`, whose entries
+    carry their type, so no per-path ``stat`` is needed. Directory entries count
+    towards ``limit`` and symlinked directories are not followed.
+    """
+
+    pending: Deque[str] = deque([os.fspath(root)])
+    seen = 0
+    while pending and seen < limit:
+        try:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if seen >= limit:
+                        return
+                    seen += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+        except OSError:  # pragma: no cover - unreadable directories are skipped
+            continue
 
 
 def search_entries(
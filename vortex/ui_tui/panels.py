@@ -179,12 +179,11 @@ class CommandBar(Container):
         if not entries:
             self.clear_suggestions()
             return
-        items = [
-            ListItem(Label(f"{entry.command} — {entry.hint}"), id=f"suggestion-{index}")
-            for index, entry in enumerate(entries)
-        ]
-        for entry, item in zip(entries, items, strict=False):
+        items: list[ListItem] = []
+        for index, entry in enumerate(entries):
+            item = ListItem(Label(f"{entry.command} — {entry.hint}"), id=f"suggestion-{index}")
             item.data = entry.command
+            items.append(item)
         if self.suggestions.is_attached:
             self.suggestions.clear()
             self.suggestions.extend(items)
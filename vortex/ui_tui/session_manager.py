@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import os
 import socket
+import sys
 import time
 import uuid
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import orjson
+
 from vortex.performance.analytics import SessionAnalyticsStore
 from vortex.security.encryption import CredentialStore, SessionEncryptor
 from vortex.utils.logging import get_logger
@@ -22,8 +26,17 @@ logger = get_logger(__name__)
 SESSION_ROOT = Path.home() / ".vortex" / "sessions"
 SESSION_ROOT.mkdir(parents=True, exist_ok=True)
 
+# Payload keys never written to the shared event log.
+_PRIVATE_PAYLOAD_KEYS = frozenset({"diff", "raw", "secret"})
+# Metadata files are normally a few hundred bytes; below this size a worker
+# thread costs more than the read it would overlap, so they are read inline.
+_THREADED_READ_MIN_SIZE = 4 * 1024
+# Upper bound on metadata reads in flight at once, to stay well clear of the
+# descriptor limit on roots with many sessions.
+_MAX_CONCURRENT_READS = 16
+
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetadata:
     """Metadata describing a collaborative session."""
 
@@ -40,7 +53,7 @@ class SessionMetadata:
         return list(self.collaborators.keys())
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEvent:
     """Event broadcast across participants."""
 
@@ -51,15 +64,109 @@ class SessionEvent:
     timestamp: float
 
     def to_json(self, *, encrypted: bool, payload: Any) -> str:
-        record = {
-            "id": self.identifier,
-            "kind": self.kind,
-            "author": self.author,
-            "timestamp": self.timestamp,
-            "encrypted": encrypted,
-            "payload": payload,
-        }
-        return json.dumps(record, ensure_ascii=False)
+        return self.to_json_bytes(encrypted=encrypted, payload=payload).decode("utf-8")
+
+    def to_json_bytes(self, *, encrypted: bool, payload: Any) -> bytes:
+        record = dict(zip(_EVENT_RECORD_KEYS, _event_header(self)))
+        record["encrypted"] = encrypted
+        record["payload"] = payload
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Serialised key order for an event line, and one C-level getter for the values.
+_EVENT_RECORD_KEYS = ("id", "kind", "author", "timestamp")
+_event_header = attrgetter("identifier", "kind", "author", "timestamp")
+
+
+def _metadata_from_payload(session_id: str, payload: Dict[str, Any], path: Path) -> SessionMetadata:
+    # Collaborator entries are mutated by callers, so each load gets its own
+    # copies rather than sharing the cached payload.
+    collaborators = {key: dict(value) for key, value in payload.get("collaborators", {}).items()}
+    return SessionMetadata(
+        session_id=session_id,
+        title=payload.get("title", session_id),
+        created_at=payload.get("created_at", 0.0),
+        created_by=payload.get("created_by", "unknown"),
+        share_key=payload.get("share_key"),
+        collaborators=collaborators,
+        path=path,
+    )
+
+
+def _read_records(path: Path, position: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse the JSONL records appended to ``path`` since byte ``position``.
+
+    The file is streamed line by line, so memory is bounded by the new records
+    rather than the whole history. A trailing line without its newline is still
+    being written; it is left for the next call.
+    """
+
+    records: List[Dict[str, Any]] = []
+    with path.open("rb") as handle:
+        handle.seek(position)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+    return records, position
+
+
+def _write_file(path: Path, data: bytes) -> os.stat_result:
+    path.write_bytes(data)
+    return os.stat(path)
+
+
+def _append_line(path: Path, data: bytes) -> None:
+    with path.open("ab") as handle:
+        handle.write(data)
+
+
+def _read_optional(path: Path) -> Optional[bytes]:
+    # The session may be deleted between the stat and the read.
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+async def _read_many(paths: List[Path], threaded: bool) -> List[Optional[bytes]]:
+    if not threaded:
+        return [_read_optional(path) for path in paths]
+    limit = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+
+    async def _read(path: Path) -> Optional[bytes]:
+        async with limit:
+            return await asyncio.to_thread(_read_optional, path)
+
+    return list(await asyncio.gather(*(_read(path) for path in paths)))
+
+
+def _interned(value: Any, default: str) -> str:
+    # Event kinds and authors repeat across a whole session; interning lets
+    # every event parsed from the log share one string per distinct value.
+    return sys.intern(value) if isinstance(value, str) else default
+
+
+def _append_batches(batches: Dict[Path, List[bytes]]) -> None:
+    # One open and one write per file however many records were queued.
+    for path, chunks in batches.items():
+        with path.open("ab") as handle:
+            handle.write(b"".join(chunks))
+
+
+def _group_by_path(items: List[Tuple[Path, bytes]]) -> Dict[Path, List[bytes]]:
+    batches: Dict[Path, List[bytes]] = {}
+    for path, data in items:
+        batches.setdefault(path, []).append(data)
+    return batches
 
 
 def _hostname() -> str:
@@ -89,6 +196,13 @@ class SessionManager:
         self._queues: Dict[str, asyncio.Queue[SessionEvent]] = {}
         self._pollers: Dict[str, asyncio.Task[None]] = {}
         self._positions: Dict[str, int] = {}
+        # Transcript and metrics lines are side logs nothing reads back in
+        # process, so they go through one background writer in batches.
+        self._write_queue: Optional[asyncio.Queue[Tuple[Path, bytes]]] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        # Parsed metadata.json payloads keyed by path, valid while the file's
+        # (mtime_ns, size) is unchanged; broadcasts reload metadata every time.
+        self._metadata_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
         self._poll_interval = max(0.25, poll_interval)
         self._sync_host = os.getenv("VORTEX_TUI_SYNC_HOST")
         self._sync_port = int(os.getenv("VORTEX_TUI_SYNC_PORT", "0") or 0)
@@ -104,7 +218,6 @@ class SessionManager:
         path = self._root / session_id
         path.mkdir(parents=True, exist_ok=True)
         (path / "transcript.md").touch(exist_ok=True)
-        (path / "plan.json").write_text("{}", encoding="utf-8")
         (path / "metrics.jsonl").touch(exist_ok=True)
         (path / "events.jsonl").touch(exist_ok=True)
         share_key = self._encryptor.ensure_session_key(session_id)
@@ -134,27 +247,45 @@ class SessionManager:
     async def list_sessions(self) -> List[SessionMetadata]:
         """Return metadata for sessions stored on disk."""
 
-        results: List[SessionMetadata] = []
-        for path in self._root.iterdir():
-            if not path.is_dir():
-                continue
+        # scandir reports the entry type from the directory listing itself,
+        # where iterdir() + is_dir() costs a stat per entry.
+        with os.scandir(self._root) as entries:
+            session_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        payloads: Dict[Path, Optional[Dict[str, Any]]] = {}
+        misses: List[Tuple[Path, os.stat_result]] = []
+        for path in session_dirs:
             meta_path = path / "metadata.json"
-            if not meta_path.exists():
+            try:
+                stat = os.stat(meta_path)
+            except FileNotFoundError:
+                self._metadata_cache.pop(meta_path, None)
+                continue
+            payload = self._cached_metadata(meta_path, stat)
+            payloads[path] = payload
+            if payload is None:
+                misses.append((meta_path, stat))
+        if misses:
+            # Unchanged files were served from the cache above; the rest are
+            # read together, on worker threads once any is big enough to matter.
+            threaded = any(stat.st_size >= _THREADED_READ_MIN_SIZE for _, stat in misses)
+            blobs = await _read_many([meta_path for meta_path, _ in misses], threaded)
+            for (meta_path, stat), raw in zip(misses, blobs):
+                if raw is None:
+                    continue
+                try:
+                    payloads[meta_path.parent] = self._cache_metadata(meta_path, stat, raw)
+                except orjson.JSONDecodeError:
+                    logger.warning("corrupt session metadata", extra={"path": str(meta_path)})
+        results: List[SessionMetadata] = []
+        for path, payload in payloads.items():
+            if payload is None:
                 continue
             try:
-                payload = json.loads(meta_path.read_text())
-                metadata = SessionMetadata(
-                    session_id=payload["session_id"],
-                    title=payload.get("title", payload["session_id"]),
-                    created_at=payload.get("created_at", 0.0),
-                    created_by=payload.get("created_by", "unknown"),
-                    share_key=payload.get("share_key"),
-                    collaborators=payload.get("collaborators", {}),
-                    path=path,
-                )
-                results.append(metadata)
+                results.append(_metadata_from_payload(payload["session_id"], payload, path))
             except Exception:
-                logger.warning("corrupt session metadata", extra={"path": str(meta_path)})
+                logger.warning(
+                    "corrupt session metadata", extra={"path": str(path / "metadata.json")}
+                )
         results.sort(key=lambda item: item.created_at, reverse=True)
         return results
 
@@ -275,11 +406,34 @@ class SessionManager:
 
         return _iterator()
 
+    async def flush(self) -> None:
+        """Wait until queued transcript and metrics lines are on disk."""
+
+        if self._write_queue is not None:
+            await self._write_queue.join()
+
+    async def close(self) -> None:
+        """Write queued transcript and metrics lines and stop background tasks."""
+
+        await self.flush()
+        tasks = list(self._pollers.values())
+        self._pollers.clear()
+        if self._writer_task is not None:
+            tasks.append(self._writer_task)
+        self._writer_task = None
+        self._write_queue = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
     async def sync_now(self, session_id: str) -> None:
         """Manually persist metadata and trigger remote sync when configured."""
 
         metadata = await self._load_metadata(session_id)
         await self._write_metadata(metadata)
+        await self.flush()
         if self._sync_host and self._sync_port:
             await self._push_to_peer(metadata)
 
@@ -319,18 +473,32 @@ class SessionManager:
     # ------------------------------------------------------------------
     async def _load_metadata(self, session_id: str) -> SessionMetadata:
         path = self._root / session_id / "metadata.json"
-        if not path.exists():
+        payload = self._read_metadata_payload(path)
+        if payload is None:
             raise FileNotFoundError(f"Session {session_id} missing")
-        payload = json.loads(path.read_text())
-        return SessionMetadata(
-            session_id=session_id,
-            title=payload.get("title", session_id),
-            created_at=payload.get("created_at", 0.0),
-            created_by=payload.get("created_by", "unknown"),
-            share_key=payload.get("share_key"),
-            collaborators=payload.get("collaborators", {}),
-            path=path.parent,
-        )
+        return _metadata_from_payload(session_id, payload, path.parent)
+
+    def _read_metadata_payload(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._metadata_cache.pop(path, None)
+            return None
+        payload = self._cached_metadata(path, stat)
+        if payload is None:
+            payload = self._cache_metadata(path, stat, path.read_bytes())
+        return payload
+
+    def _cached_metadata(self, path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        cached = self._metadata_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        return None
+
+    def _cache_metadata(self, path: Path, stat: os.stat_result, raw: bytes) -> Dict[str, Any]:
+        payload = orjson.loads(raw)
+        self._metadata_cache[path] = (stat.st_mtime_ns, stat.st_size, payload)
+        return payload
 
     async def _write_metadata(self, metadata: SessionMetadata, owner: Optional[str] = None) -> None:
         lock = self._locks.setdefault(metadata.session_id, asyncio.Lock())
@@ -343,9 +511,16 @@ class SessionManager:
                 "share_key": metadata.share_key,
                 "collaborators": metadata.collaborators,
             }
-            (metadata.path / "metadata.json").write_text(
-                json.dumps(payload, indent=2), encoding="utf-8"
-            )
+            path = metadata.path / "metadata.json"
+            # Encoded on the loop, before anything can mutate the collaborators;
+            # only the write itself goes to a worker thread.
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            # Cache a private copy; the caller still owns the collaborators dict.
+            payload["collaborators"] = {
+                key: dict(value) for key, value in metadata.collaborators.items()
+            }
+            stat = await asyncio.to_thread(_write_file, path, data)
+            self._metadata_cache[path] = (stat.st_mtime_ns, stat.st_size, payload)
 
     async def _append_event(
         self,
@@ -355,11 +530,9 @@ class SessionManager:
         encrypted: bool,
     ) -> None:
         lock = self._locks.setdefault(metadata.session_id, asyncio.Lock())
-        record = event.to_json(encrypted=encrypted, payload=payload)
+        record = event.to_json_bytes(encrypted=encrypted, payload=payload)
         async with lock:
-            path = metadata.path / "events.jsonl"
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(record + "\n")
+            await asyncio.to_thread(_append_line, metadata.path / "events.jsonl", record + b"\n")
 
     def _enqueue(self, session_id: str, event: SessionEvent) -> None:
         queue = self._queues.setdefault(session_id, asyncio.Queue())
@@ -367,9 +540,7 @@ class SessionManager:
 
     def _append_transcript(self, metadata: SessionMetadata, event: SessionEvent) -> None:
         text = self._summarise_event(event)
-        path = metadata.path / "transcript.md"
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(text + "\n")
+        self._queue_write(metadata.path / "transcript.md", (text + "\n").encode("utf-8"))
 
     async def _append_metrics(
         self, metadata: SessionMetadata, event: SessionEvent, metrics: Optional[Dict[str, Any]]
@@ -380,11 +551,46 @@ class SessionManager:
             "author": event.author,
             "metrics": metrics or {},
         }
-        path = metadata.path / "metrics.jsonl"
-        lock = self._locks.setdefault(metadata.session_id, asyncio.Lock())
-        async with lock:
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(payload) + "\n")
+        self._queue_write(
+            metadata.path / "metrics.jsonl",
+            orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n",
+        )
+
+    def _queue_write(self, path: Path, data: bytes) -> None:
+        task = self._writer_task
+        # A writer bound to a loop that has since closed can never run again,
+        # so every loop that queues a write gets its own queue and writer.
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._write_loop(self._write_queue))
+        assert self._write_queue is not None
+        self._write_queue.put_nowait((path, data))
+
+    async def _write_loop(self, queue: asyncio.Queue[Tuple[Path, bytes]]) -> None:
+        try:
+            while True:
+                items = [await queue.get()]
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+                try:
+                    await asyncio.to_thread(_append_batches, _group_by_path(items))
+                except OSError as exc:
+                    logger.warning("failed to append session log", extra={"error": str(exc)})
+                finally:
+                    for _ in items:
+                        queue.task_done()
+        finally:
+            # Cancelled with lines still queued (the loop is shutting down):
+            # write them here rather than lose the tail of the transcript.
+            pending: List[Tuple[Path, bytes]] = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+                queue.task_done()
+            if pending:
+                try:
+                    _append_batches(_group_by_path(pending))
+                except OSError as exc:
+                    logger.warning("failed to append session log", extra={"error": str(exc)})
 
     async def _record_analytics(
         self, metadata: SessionMetadata, event: SessionEvent, metrics: Optional[Dict[str, Any]]
@@ -410,22 +616,13 @@ class SessionManager:
         lock = self._locks.setdefault(session_id, asyncio.Lock())
         while True:
             await asyncio.sleep(self._poll_interval)
-            if not path.exists():
-                continue
             async with lock:
-                with path.open("r", encoding="utf-8") as handle:
-                    handle.seek(position)
-                    lines = handle.readlines()
-                    position = handle.tell()
-            self._positions[session_id] = position
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    records, position = _read_records(path, position)
+                except FileNotFoundError:
                     continue
+            self._positions[session_id] = position
+            for record in records:
                 payload: Dict[str, Any]
                 if record.get("encrypted"):
                     try:
@@ -439,9 +636,9 @@ class SessionManager:
                     payload = record.get("payload", {})
                 event = SessionEvent(
                     identifier=record.get("id", uuid.uuid4().hex),
-                    kind=record.get("kind", "event"),
+                    kind=_interned(record.get("kind"), "event"),
                     payload=payload,
-                    author=record.get("author", "unknown"),
+                    author=_interned(record.get("author"), "unknown"),
                     timestamp=record.get("timestamp", time.time()),
                 )
                 self._enqueue(session_id, event)
@@ -459,7 +656,7 @@ class SessionManager:
             "metadata": metadata.collaborators,
             "timestamp": time.time(),
         }
-        data = json.dumps(payload).encode("utf-8")
+        data = orjson.dumps(payload)
         writer.write(len(data).to_bytes(4, "big") + data)
         await writer.drain()
         writer.close()
@@ -467,12 +664,9 @@ class SessionManager:
 
     @staticmethod
     def _sanitize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-        sanitized: Dict[str, Any] = {}
-        for key, value in payload.items():
-            if key in {"diff", "raw", "secret"}:
-                continue
-            sanitized[key] = value
-        return sanitized
+        if _PRIVATE_PAYLOAD_KEYS.isdisjoint(payload):
+            return dict(payload)
+        return {key: value for key, value in payload.items() if key not in _PRIVATE_PAYLOAD_KEYS}
 
     @staticmethod
     def _summarise_event(event: SessionEvent) -> str:
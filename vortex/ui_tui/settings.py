@@ -22,6 +22,11 @@ except ModuleNotFoundError:  # Python <3.11 fallback should never trigger in CI
     tomllib = None  # type: ignore[assignment]
 
 
+# Config files stay YAML/TOML because users edit them; libyaml's C loader and
+# dumper are used when PyYAML was built with it.
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 DEFAULT_FLAGS: Dict[str, bool] = {"experimental_tui": False, "lyra_assistant": True}
 
 
@@ -116,8 +121,9 @@ class TUISettingsManager:
             if self._settings is not None:
                 return self._settings
             merged: Dict[str, Any] = {}
-            self._raw_global = self._read_config(self.global_path)
-            self._raw_local = self._read_config(self.local_path)
+            self._raw_global, self._raw_local = await asyncio.to_thread(
+                lambda: (self._read_config(self.global_path), self._read_config(self.local_path))
+            )
             for payload in (self._raw_global, self._raw_local):
                 if not payload:
                     continue
@@ -134,10 +140,10 @@ class TUISettingsManager:
         async with self._lock:
             self._settings = settings
             data = dict(self._raw_global)
-            tui_payload = settings.to_dict()
-            data.setdefault("tui", {})
-            data["tui"].update(tui_payload)
-            self._write_config(self.global_path, data)
+            data["tui"] = {**data.get("tui", {}), **settings.to_dict()}
+            # Written off the event loop; the lock is still held so concurrent
+            # persists reach the file in order.
+            await asyncio.to_thread(self._write_config, self.global_path, data)
             self._raw_global = data
 
     async def update(self, **updates: Any) -> TUISettings:
@@ -154,11 +160,11 @@ class TUISettingsManager:
 
     @staticmethod
     def _read_config(path: Path) -> Dict[str, Any]:
-        if not path.exists():
-            return {}
+        # A missing file lands in the handler below like any unreadable one,
+        # without a separate stat up front.
         try:
             if path.suffix in {".yaml", ".yml"}:
-                return yaml.safe_load(path.read_text()) or {}
+                return yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
             if path.suffix == ".toml" and tomllib is not None:
                 with path.open("rb") as handle:
                     return tomllib.load(handle)
@@ -170,7 +176,7 @@ class TUISettingsManager:
     def _write_config(path: Path, payload: Dict[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.suffix in {".yaml", ".yml"}:
-            path.write_text(yaml.safe_dump(payload, sort_keys=True))
+            path.write_text(yaml.dump(payload, Dumper=_YAML_DUMPER, sort_keys=True))
             return
         content = _dump_toml(payload)
         path.write_text(content)
@@ -63,9 +63,13 @@ class StatusAggregator:
         lock_holder: Optional[str] = None,
     ) -> StatusSnapshot:
         with profile("status_gather"):
-            branch = await self._safe_git("rev-parse", "--abbrev-ref", "HEAD")
-            pending = await self._count_pending()
-            total_cost = await self._total_cost()
+            # The probes are independent (two git subprocesses and the cost
+            # tracker), so wall time is the slowest of them rather than the sum.
+            branch, pending, total_cost = await asyncio.gather(
+                self._safe_git("rev-parse", "--abbrev-ref", "HEAD"),
+                self._count_pending(),
+                self._total_cost(),
+            )
             cpu_usage, memory_usage = _system_usage()
             snapshot = StatusSnapshot(
                 branch=branch or "-",
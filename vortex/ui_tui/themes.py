@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
@@ -13,6 +14,12 @@ try:  # pragma: no cover - tomllib optional import guard
 except ModuleNotFoundError:  # pragma: no cover
     tomllib = None  # type: ignore[assignment]
 
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Compiled CSS for custom theme files keyed by path, valid while the file's
+# (mtime_ns, size) is unchanged; every settings change re-applies the theme.
+_custom_theme_cache: Dict[Path, Tuple[int, int, str]] = {}
+
 
 @dataclass(frozen=True)
 class ThemeDefinition:
@@ -199,6 +206,16 @@ def theme_css(
 
 
 def _load_custom_theme(path: Path) -> str:
+    key: Optional[Tuple[int, int]] = None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _custom_theme_cache.pop(path, None)
+    else:
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _custom_theme_cache.get(path)
+        if cached is not None and cached[:2] == key:
+            return cached[2]
     data = _read_palette(path)
     if not data:
         raise ThemeError(f"Custom theme {path} is empty")
@@ -206,17 +223,22 @@ def _load_custom_theme(path: Path) -> str:
     palette = data.get("palette") or {}
     css = _merge_palette(base, palette)
     _validate_contrast(css)
+    if key is not None:
+        _custom_theme_cache[path] = (*key, css)
     return css
 
 
 def _read_palette(path: Path) -> Dict[str, Any]:
+    try:
+        if path.suffix in {".yaml", ".yml"}:
+            return yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
+        if path.suffix == ".toml" and tomllib is not None:
+            with path.open("rb") as handle:
+                return tomllib.load(handle)
+    except FileNotFoundError as exc:
+        raise ThemeError(f"Custom theme {path} does not exist") from exc
     if not path.exists():
         raise ThemeError(f"Custom theme {path} does not exist")
-    if path.suffix in {".yaml", ".yml"}:
-        return yaml.safe_load(path.read_text()) or {}
-    if path.suffix == ".toml" and tomllib is not None:
-        with path.open("rb") as handle:
-            return tomllib.load(handle)
     raise ThemeError("Unsupported theme format; use TOML or YAML")
 
 
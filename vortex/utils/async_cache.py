@@ -8,11 +8,15 @@ unnecessary calls while keeping implementation simple and dependency-free.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import time
 from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 
+import orjson
+
 
 @dataclass
 class CacheEntry:
@@ -73,4 +77,26 @@ class AsyncTTLCache:
             self._data.clear()
 
 
-__all__ = ["AsyncTTLCache"]
+def _canonical(value: Any) -> Any:
+    # orjson only serialises real dicts natively; other mappings are copied
+    # and anything else unknown falls back to its repr.
+    if isinstance(value, Mapping):
+        return dict(value)
+    return repr(value)
+
+
+def request_digest(*parts: Any) -> bytes:
+    """Return a short, order-independent digest of request arguments.
+
+    Mapping keys are sorted by orjson, so ``{"a": 1, "b": 2}`` and
+    ``{"b": 2, "a": 1}`` produce the same digest, and nested or unhashable
+    values are supported.
+    """
+
+    raw = orjson.dumps(
+        parts, default=_canonical, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+__all__ = ["AsyncTTLCache", "request_digest"]
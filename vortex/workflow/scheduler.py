@@ -28,7 +28,7 @@ class WorkflowScheduler:
         self._jobs: List[ScheduledJob] = []
         self._lock = asyncio.Lock()
         self._runner: asyncio.Task[None] | None = None
-        self._stop_event = asyncio.Event()
+        self._wakeup = asyncio.Event()
 
     async def schedule(
         self, name: str, delay: float, callback: Callable[[], Awaitable[None]]
@@ -39,26 +39,28 @@ class WorkflowScheduler:
             )
             if self._runner is None:
                 self._runner = asyncio.create_task(self._run())
-            self._stop_event.set()
+            self._wakeup.set()
 
     async def _run(self) -> None:
         while True:
-            await self._stop_event.wait()
-            self._stop_event.clear()
-            while True:
-                async with self._lock:
-                    if not self._jobs:
-                        break
-                    job = self._jobs[0]
-                    delay = job.run_at - time.time()
-                    if delay > 0:
-                        await asyncio.sleep(delay)
+            async with self._lock:
+                if not self._jobs:
+                    self._runner = None
+                    return
+                job = self._jobs[0]
+                delay = job.run_at - time.time()
+                if delay > 0:
+                    self._wakeup.clear()
+                else:
                     heapq.heappop(self._jobs)
-                logger.debug("executing scheduled job", extra={"name": job.name})
-                await job.callback()
-            if not self._jobs:
-                break
-        self._runner = None
+            if delay > 0:
+                # Sleep until the earliest deadline, or until ``schedule`` wakes us
+                # because a sooner job was queued; the lock stays free meanwhile.
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+            logger.debug("executing scheduled job", extra={"name": job.name})
+            await job.callback()
 
     async def shutdown(self) -> None:
         if self._runner: